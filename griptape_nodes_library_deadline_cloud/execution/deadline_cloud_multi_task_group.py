@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging
+import time
 from typing import Any, TypeVar
 
 from griptape_nodes.common.node_executor import PublishWorkflowStartEndNodes
@@ -32,6 +33,9 @@ logger = logging.getLogger("griptape_nodes")
 
 T = TypeVar("T")
 
+# Minimum seconds between updates of the results output while tasks are finishing
+RESULTS_UPDATE_INTERVAL = 2.0
+
 
 class DeadlineCloudMultiTaskGroup(SubflowNodeGroup, BaseNodeGroup):
     """A SubflowNodeGroup that represents a Deadline Job defined with multiple Tasks.
@@ -90,6 +94,15 @@ class DeadlineCloudMultiTaskGroup(SubflowNodeGroup, BaseNodeGroup):
             allowed_modes={ParameterMode.INPUT},
         )
         self.add_parameter(self.items_list)
+        self.chunk_size = Parameter(
+            name="chunk_size",
+            tooltip="Number of items each Deadline Cloud task executes in a single engine process. "
+            "Larger chunks amortize worker startup across many short items.",
+            type=ParameterTypeBuiltin.INT.value,
+            allowed_modes={ParameterMode.PROPERTY},
+            default_value=1,
+        )
+        self.add_parameter(self.chunk_size)
         self.current_item = Parameter(
             name="current_item",
             tooltip="Current item being processed",
@@ -681,6 +694,8 @@ class DeadlineCloudMultiTaskGroup(SubflowNodeGroup, BaseNodeGroup):
         if not run_on_all_worker_hosts:
             host_requirements = self._build_host_requirements()
 
+        chunk_size = max(1, int(self.get_parameter_value("chunk_size") or 1))
+
         # Get the node names from this group for model gathering
         group_node_names = list(self.get_all_nodes().keys())
 
@@ -704,23 +719,41 @@ class DeadlineCloudMultiTaskGroup(SubflowNodeGroup, BaseNodeGroup):
             host_requirements=host_requirements,
             result_parameter_name=result_parameter_name,
             group_node_names=group_node_names,
+            chunk_size=chunk_size,
         )
 
         # Create and execute the multi-task publisher
         publisher = DeadlineCloudMultiTaskPublisher(config)
 
         logger.info(
-            "Starting multi-task execution for '%s' with %d iterations",
+            "Starting multi-task execution for '%s' with %d iterations in chunks of %d",
             self.name,
             total_iterations,
+            chunk_size,
         )
 
-        results = await publisher.publish_and_execute()
+        # Publish results incrementally as tasks finish so downstream previews can start early
+        # The update is throttled, since each one sends the whole list
+        results: list[Any] = [None] * total_iterations
+        self.parameter_output_values["results"] = results
+        last_update_time = time.monotonic()
+        has_pending_update = False
+        async for task_index, task_result in publisher.stream_results():
+            if task_index >= total_iterations:
+                continue
+            results[task_index] = task_result
+            has_pending_update = True
+            if time.monotonic() - last_update_time >= RESULTS_UPDATE_INTERVAL:
+                self.publish_update_to_parameter("results", list(results))
+                last_update_time = time.monotonic()
+                has_pending_update = False
+        if has_pending_update:
+            self.publish_update_to_parameter("results", list(results))
 
         logger.info(
             "Multi-task execution completed for '%s' with %d results",
             self.name,
-            len(results),
+            len([result for result in results if result is not None]),
         )
 
         # Store results in output parameter
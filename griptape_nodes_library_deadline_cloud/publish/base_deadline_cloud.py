@@ -1,24 +1,27 @@
 from __future__ import annotations
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from configparser import ConfigParser
+from pathlib import Path
 from typing import TYPE_CHECKING, Any, TypeVar
 
-import boto3
-from deadline.client.api import (
-    get_boto3_session,
-    get_storage_profile_for_queue,
-)
+from deadline.client.api import get_boto3_session
 from deadline.client.api._session import get_user_and_identity_store_id
 from deadline.client.config import get_setting_default
+from deadline.client.config.config_file import get_cache_directory
 from griptape_nodes.retained_mode.griptape_nodes import (
     GriptapeNodes,
 )
 from publish import DEADLINE_CLOUD_LIBRARY_CONFIG_KEY
+from publish.deadline_cloud_client_pool import DeadlineCloudClientPool
+from publish.deadline_cloud_queue_metadata_cache import DeadlineCloudQueueMetadata, DeadlineCloudQueueMetadataCache
+from publish.deadline_cloud_resource_catalog import DEFAULT_RESOURCE_CATALOG_TTL, DeadlineCloudResourceCatalog
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Iterator
 
+    import boto3
     from botocore.client import BaseClient
     from deadline.job_attachments.models import StorageProfile
 
@@ -31,6 +34,11 @@ T = TypeVar("T")
 
 logger = logging.getLogger("base_deadline_cloud")
 
+# search_jobs accepts at most 100 results per page
+SEARCH_JOBS_MAX_PAGE_SIZE = 100
+# Number of search_jobs pages fetched at once by search_all_jobs
+SEARCH_JOBS_MAX_WORKERS = 4
+
 
 class BaseDeadlineCloud:
     def __init__(self, session: boto3.Session | None = None) -> None:
@@ -46,7 +54,7 @@ class BaseDeadlineCloud:
         region_name = cls._get_config_value(DEADLINE_CLOUD_LIBRARY_CONFIG_KEY, "region_name", default="us-east-1")
         if profile_name != "" and region_name != "":
             try:
-                return boto3.Session(profile_name=profile_name, region_name=region_name)
+                return DeadlineCloudClientPool.get_instance().get_session(profile_name, region_name)
 
             except Exception:
                 msg = f"Failed to create boto3 session with profile '{profile_name}' and region '{region_name}'."
@@ -131,9 +139,40 @@ class BaseDeadlineCloud:
                 raise
             return None
 
+    @classmethod
+    def _get_resource_catalog(cls) -> DeadlineCloudResourceCatalog:
+        """Get the process-wide catalog of cached farm, queue and storage profile listings."""
+        persist = cls._get_config_value(DEADLINE_CLOUD_LIBRARY_CONFIG_KEY, "resource_catalog_persist", default=True)
+        cache_path = (
+            Path(get_cache_directory()) / "griptape_nodes" / "resource_catalog.json" if persist is True else None
+        )
+        return DeadlineCloudResourceCatalog.get_instance(cache_path=cache_path)
+
+    def _get_resource_catalog_prefix(self) -> tuple[str, str]:
+        """The catalog key prefix for this accessor's AWS profile and region."""
+        return (self._session.profile_name or "", self._session.region_name or "")
+
+    def _get_cached_resources(self, key: tuple[str, ...], loader: Callable[[], Any]) -> Any:
+        """Get a resource listing from the catalog, fetching it with the loader when needed."""
+        ttl = self._get_config_value(
+            DEADLINE_CLOUD_LIBRARY_CONFIG_KEY, "resource_catalog_ttl_seconds", default=DEFAULT_RESOURCE_CATALOG_TTL
+        )
+        return self._get_resource_catalog().get((*self._get_resource_catalog_prefix(), *key), loader, ttl=float(ttl))
+
+    def invalidate_resources(self, *key: str) -> None:
+        """Drop cached resource listings for this accessor's AWS profile and region.
+
+        Args:
+            key: Optional key prefix to narrow what is dropped, e.g. ("queues", farm_id).
+        """
+        self._get_resource_catalog().invalidate(*self._get_resource_catalog_prefix(), *key)
+
     def _get_list_api_kwargs(self) -> dict:
         kwargs = {}
-        user_id, _ = get_user_and_identity_store_id(config=self._get_config_parser())
+        user_id, _ = self._get_cached_resources(
+            ("user_and_identity_store_id",),
+            lambda: get_user_and_identity_store_id(config=self._get_config_parser()),
+        )
         if user_id:
             kwargs["principalId"] = user_id
 
@@ -141,34 +180,162 @@ class BaseDeadlineCloud:
 
     def list_farms(self, *_args, raise_on_error: bool = False) -> Any:
         """List all farms in Deadline Cloud."""
-        kwargs = self._get_list_api_kwargs()
-        result = self._safe_api_call(lambda: self._get_client().list_farms(**kwargs), raise_on_error=raise_on_error)
-        return result["farms"] if result else []
+        result = self._safe_api_call(
+            lambda: self._get_cached_resources(("farms",), lambda: list(self.iter_farms())),
+            raise_on_error=raise_on_error,
+        )
+        return result or []
 
     def list_queues(self, farm_id: str, *_args, raise_on_error: bool = False) -> Any:
         """List all queues in Deadline Cloud."""
-        kwargs = self._get_list_api_kwargs()
         result = self._safe_api_call(
-            lambda: self._get_client().list_queues(farmId=farm_id, **kwargs), raise_on_error=raise_on_error
+            lambda: self._get_cached_resources(
+                ("queues", farm_id),
+                lambda: list(self.iter_queues(farm_id)),
+            ),
+            raise_on_error=raise_on_error,
         )
-        return result["queues"] if result else []
+        return result or []
 
     def list_storage_profiles(self, farm_id: str, queue_id: str, *_args, raise_on_error: bool = False) -> Any:
         """List all storage profiles for the queue in Deadline Cloud."""
         result = self._safe_api_call(
-            lambda: self._get_client().list_storage_profiles_for_queue(farmId=farm_id, queueId=queue_id),
+            lambda: self._get_cached_resources(
+                ("storage_profiles", farm_id, queue_id),
+                lambda: list(self.iter_storage_profiles(farm_id, queue_id)),
+            ),
             raise_on_error=raise_on_error,
         )
-        return result["storageProfiles"] if result else []
+        return result or []
+
+    def _iter_paginated(self, operation_name: str, result_key: str, **kwargs) -> Iterator[Any]:
+        """Lazily yield the items of a paginated list operation, fetching each page only when it is reached."""
+        paginator = self._get_client().get_paginator(operation_name)
+        for page in paginator.paginate(**kwargs):
+            yield from page.get(result_key, [])
+
+    def iter_farms(self) -> Iterator[Any]:
+        """Lazily iterate over every farm in Deadline Cloud, bypassing the resource catalog.
+
+        Raises:
+            Exception: If a page cannot be fetched.
+        """
+        return self._iter_paginated("list_farms", "farms", **self._get_list_api_kwargs())
+
+    def iter_queues(self, farm_id: str) -> Iterator[Any]:
+        """Lazily iterate over every queue of a farm, bypassing the resource catalog.
+
+        Raises:
+            Exception: If a page cannot be fetched.
+        """
+        return self._iter_paginated("list_queues", "queues", farmId=farm_id, **self._get_list_api_kwargs())
+
+    def iter_storage_profiles(self, farm_id: str, queue_id: str) -> Iterator[Any]:
+        """Lazily iterate over every storage profile of a queue, bypassing the resource catalog.
+
+        Raises:
+            Exception: If a page cannot be fetched.
+        """
+        return self._iter_paginated(
+            "list_storage_profiles_for_queue", "storageProfiles", farmId=farm_id, queueId=queue_id
+        )
 
-    def search_jobs(self, farm_id: str, queue_id: str, page_size: int = 100, item_offset: int = 0) -> Any:
+    def _get_search_jobs_request(
+        self,
+        farm_id: str,
+        queue_id: str,
+        filter_expressions: dict[str, Any] | None,
+        sort_expressions: list[dict[str, Any]] | None,
+    ) -> dict[str, Any]:
+        request: dict[str, Any] = {"farmId": farm_id, "queueIds": [queue_id]}
+        if filter_expressions:
+            request["filterExpressions"] = filter_expressions
+        if sort_expressions:
+            request["sortExpressions"] = sort_expressions
+        return request
+
+    def iter_jobs(
+        self,
+        farm_id: str,
+        queue_id: str,
+        *,
+        page_size: int = SEARCH_JOBS_MAX_PAGE_SIZE,
+        filter_expressions: dict[str, Any] | None = None,
+        sort_expressions: list[dict[str, Any]] | None = None,
+    ) -> Iterator[Any]:
+        """Lazily iterate over the jobs of a queue matching a search, one page at a time.
+
+        search_jobs has no paginator, so pages are requested by item offset until the search
+        reports no further results. Stop iterating to avoid fetching later pages.
+
+        Raises:
+            Exception: If a page cannot be fetched.
+        """
+        request = self._get_search_jobs_request(farm_id, queue_id, filter_expressions, sort_expressions)
+        item_offset: int | None = 0
+        while item_offset is not None:
+            result = self._get_client().search_jobs(**request, pageSize=page_size, itemOffset=item_offset)
+            yield from result.get("jobs", [])
+            item_offset = result.get("nextItemOffset")
+
+    def search_all_jobs(
+        self,
+        farm_id: str,
+        queue_id: str,
+        *,
+        filter_expressions: dict[str, Any] | None = None,
+        sort_expressions: list[dict[str, Any]] | None = None,
+        max_results: int | None = None,
+    ) -> list[Any]:
+        """Return every job of a queue matching a search, fetching the pages after the first concurrently.
+
+        The first page reports the total number of results, so the offsets of the remaining pages
+        are known up front and can be requested in parallel. Results keep the search's sort order.
+
+        Args:
+            farm_id: The farm ID.
+            queue_id: The queue ID.
+            filter_expressions: Optional search filter expressions.
+            sort_expressions: Optional search sort expressions.
+            max_results: Optional upper bound on the number of jobs returned.
+
+        Raises:
+            Exception: If a page cannot be fetched.
+        """
+        client = self._get_client()
+        request = self._get_search_jobs_request(farm_id, queue_id, filter_expressions, sort_expressions)
+
+        def search_page(item_offset: int) -> list[Any]:
+            result = client.search_jobs(**request, pageSize=SEARCH_JOBS_MAX_PAGE_SIZE, itemOffset=item_offset)
+            return result.get("jobs", [])
+
+        first_page = client.search_jobs(**request, pageSize=SEARCH_JOBS_MAX_PAGE_SIZE, itemOffset=0)
+        jobs = list(first_page.get("jobs", []))
+        total_results = first_page.get("totalResults", len(jobs))
+        if max_results is not None:
+            total_results = min(total_results, max_results)
+
+        offsets = range(len(jobs), total_results, SEARCH_JOBS_MAX_PAGE_SIZE) if jobs else range(0)
+        if offsets:
+            with ThreadPoolExecutor(max_workers=SEARCH_JOBS_MAX_WORKERS) as executor:
+                for page in executor.map(search_page, offsets):
+                    jobs.extend(page)
+
+        return jobs[:total_results]
+
+    def search_jobs(  # noqa: PLR0913
+        self,
+        farm_id: str,
+        queue_id: str,
+        page_size: int = 100,
+        item_offset: int = 0,
+        *,
+        filter_expressions: dict[str, Any] | None = None,
+        sort_expressions: list[dict[str, Any]] | None = None,
+    ) -> Any:
+        request = self._get_search_jobs_request(farm_id, queue_id, filter_expressions, sort_expressions)
         result = self._safe_api_call(
-            lambda: self._get_client().search_jobs(
-                farmId=farm_id,
-                queueIds=[queue_id],
-                pageSize=page_size,
-                itemOffset=item_offset,
-            )
+            lambda: self._get_client().search_jobs(**request, pageSize=page_size, itemOffset=item_offset)
         )
         return result["jobs"] if result else []
 
@@ -176,8 +343,10 @@ class BaseDeadlineCloud:
         """Get cached Deadline Cloud client."""
         if self._client is None:
             try:
-                self._client = self._session.client(
-                    "deadline", region_name=self._get_config_value(DEADLINE_CLOUD_LIBRARY_CONFIG_KEY, "region_name")
+                self._client = DeadlineCloudClientPool.get_instance().get_client(
+                    self._session,
+                    "deadline",
+                    region_name=self._get_config_value(DEADLINE_CLOUD_LIBRARY_CONFIG_KEY, "region_name"),
                 )
             except Exception as e:
                 details = "Failed to create Deadline Cloud client. Please ensure your AWS credentials are configured and refreshed."
@@ -185,9 +354,33 @@ class BaseDeadlineCloud:
                 raise RuntimeError(details) from e
         return self._client
 
+    def _get_queue_session(self, farm_id: str, queue_id: str) -> boto3.Session:
+        """Get the shared boto3 session with the queue role's credentials."""
+        return DeadlineCloudClientPool.get_instance().get_queue_session(
+            self._get_client(), self._session.region_name, farm_id, queue_id
+        )
+
     def _get_storage_profile_for_queue(
         self, farm_id: str, queue_id: str, storage_profile_id: Any
     ) -> StorageProfile | None:
         if storage_profile_id and storage_profile_id != "":
-            return get_storage_profile_for_queue(farm_id, queue_id, storage_profile_id, self._get_client())
+            return DeadlineCloudQueueMetadataCache.get_instance().get_storage_profile(
+                self._get_client(), farm_id, queue_id, storage_profile_id
+            )
         return None
+
+    def _get_queue_metadata(
+        self, farm_id: str, queue_id: str, storage_profile_id: Any = None
+    ) -> DeadlineCloudQueueMetadata:
+        """Get the queue's job attachment settings, queue role session and storage profile.
+
+        The settings and storage profile are cached per queue, and the queue role session is shared,
+        so repeated submissions and downloads on a queue do not call `get_queue` again.
+        """
+        return DeadlineCloudQueueMetadata(
+            job_attachment_settings=DeadlineCloudQueueMetadataCache.get_instance().get_job_attachment_settings(
+                self._get_client(), farm_id, queue_id
+            ),
+            queue_session=self._get_queue_session(farm_id, queue_id),
+            storage_profile=self._get_storage_profile_for_queue(farm_id, queue_id, storage_profile_id),
+        )
@@ -0,0 +1,443 @@
+from __future__ import annotations
+
+import filecmp
+import hashlib
+import json
+import logging
+import os
+import shutil
+import sys
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import partial
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, ClassVar
+
+import yaml
+from deadline.client.config.config_file import get_cache_directory
+from deadline.job_attachments.asset_manifests import ManifestModelRegistry, ManifestVersion, hash_file
+from deadline.job_attachments.models import AssetRootManifest, Attachments, ManifestProperties
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from boto3 import Session
+    from deadline.job_attachments.asset_manifests import (
+        BaseManifestModel,
+        BaseManifestPath,
+        HashAlgorithm,
+    )
+    from deadline.job_attachments.models import AssetRootGroup, JobAttachmentS3Settings
+
+
+logger = logging.getLogger("deadline_cloud_bundle_cache")
+
+# Bumped whenever the bundle layout changes so that stale cache entries are never reused
+BUNDLE_CACHE_VERSION = "2"
+
+# Marker written once a bundle has been fully packaged
+_BUNDLE_COMPLETE_MARKER = ".bundle_complete"
+# Directory inside a cached bundle holding the job attachments uploaded for it, one file per queue
+_ATTACHMENTS_DIR_NAME = ".attachments"
+# File inside a cached bundle holding the hashes of its files
+_HASH_INDEX_FILE_NAME = ".hash_index.json"
+# Bundle entries that are not packaged, and so are kept when a bundle is updated in place
+_PRESERVED_BUNDLE_ENTRIES = frozenset({_BUNDLE_COMPLETE_MARKER, _ATTACHMENTS_DIR_NAME, _HASH_INDEX_FILE_NAME, "output"})
+# Bumped whenever the hash index layout changes so that stale indexes are ignored
+_HASH_INDEX_FILE_VERSION = 1
+
+
+def verify_input_manifests_exist(
+    manifests: list[ManifestProperties], job_attachment_settings: JobAttachmentS3Settings, queue_session: Session
+) -> None:
+    """Check that previously uploaded input manifests are still present in the queue's S3 bucket.
+
+    The uploaded data is content-addressed, so an existing manifest is enough to prove that an
+    earlier upload can be reused.
+
+    Raises:
+        ClientError: If a manifest no longer exists or cannot be read.
+    """
+    s3_client = queue_session.client("s3")
+    for manifest in manifests:
+        if manifest.inputManifestPath:
+            s3_client.head_object(
+                Bucket=job_attachment_settings.s3BucketName,
+                Key=job_attachment_settings.add_root_and_manifest_folder_prefix(manifest.inputManifestPath),
+            )
+
+
+class BundleFingerprint:
+    """Incrementally builds a fingerprint of everything that goes into a job bundle.
+
+    Each component is added under a label so that moving a value from one component to
+    another changes the fingerprint.
+    """
+
+    def __init__(self) -> None:
+        self._hash = hashlib.sha256()
+        self.add_text("bundle_cache_version", BUNDLE_CACHE_VERSION)
+
+    def add_text(self, label: str, value: str) -> None:
+        """Add a text value to the fingerprint."""
+        self._hash.update(f"{label}\0{value}\0".encode())
+
+    def add_json(self, label: str, value: Any) -> None:
+        """Add a JSON-serializable value to the fingerprint."""
+        self.add_text(label, json.dumps(value, sort_keys=True, default=str))
+
+    def add_file_contents(self, label: str, path: Path) -> None:
+        """Add the contents of a file to the fingerprint."""
+        file_hash = hashlib.sha256()
+        with path.open("rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                file_hash.update(chunk)
+        self.add_text(label, file_hash.hexdigest())
+
+    def add_path_stats(self, label: str, path: Path, ignore_patterns: list[str] | None = None) -> None:
+        """Add the relative path, size and modification time of a file or every file in a directory tree.
+
+        Stat metadata is used instead of file contents so that large library trees and static
+        files can be fingerprinted without reading them.
+        """
+        ignore_patterns = ignore_patterns or []
+        entries: list[tuple[str, int, int]] = []
+        if path.is_file():
+            stat = path.stat()
+            entries.append((path.name, stat.st_size, stat.st_mtime_ns))
+        elif path.is_dir():
+            for dirpath, dirnames, filenames in os.walk(path):
+                dirnames[:] = sorted(d for d in dirnames if d not in ignore_patterns)
+                for filename in sorted(filenames):
+                    file_path = Path(dirpath) / filename
+                    stat = file_path.stat()
+                    entries.append((file_path.relative_to(path).as_posix(), stat.st_size, stat.st_mtime_ns))
+        self.add_json(label, entries)
+
+    def hexdigest(self) -> str:
+        """Return the fingerprint as a hex string."""
+        return self._hash.hexdigest()
+
+
+class BundleHashIndex:
+    """Hashes of a cached bundle's files, keyed by their stat metadata.
+
+    A file whose relative path, size, modification time and inode all match its indexed entry
+    is assumed unchanged and is not read again. Cached bundles are updated in place and keep
+    the inode and modification time of every unchanged file, so republishing a workflow only
+    hashes the files that actually changed, usually just `workflow.py`.
+    """
+
+    def __init__(self, bundle_dir: Path) -> None:
+        self.bundle_dir = bundle_dir
+        self._index_path = bundle_dir / _HASH_INDEX_FILE_NAME
+        self._entries: dict[str, list[Any]] = {}
+        self._used_entries: dict[str, list[Any]] = {}
+        self._lock = threading.Lock()
+        self._load()
+
+    def create_manifests(
+        self, asset_groups: list[AssetRootGroup], manifest_version: ManifestVersion
+    ) -> list[AssetRootManifest]:
+        """Create the manifests of asset groups, hashing only files that changed since they were last indexed.
+
+        Produces the same manifests as `S3AssetManager.hash_assets_and_create_manifest`.
+        """
+        manifest_model = ManifestModelRegistry.get_manifest_model(version=manifest_version)
+        hash_alg = manifest_model.AssetManifest.get_default_hash_alg()
+
+        asset_root_manifests: list[AssetRootManifest] = []
+        with ThreadPoolExecutor() as executor:
+            for group in asset_groups:
+                asset_manifest = None
+                if group.inputs:
+                    get_manifest_path = partial(self._get_manifest_path, manifest_model, hash_alg, group.root_path)
+                    paths = list(executor.map(get_manifest_path, sorted(group.inputs)))
+                    # Sorted the same way as Deadline's own manifests to keep them canonical
+                    paths.sort(key=lambda manifest_path: manifest_path.path, reverse=True)
+                    asset_manifest = manifest_model.AssetManifest(
+                        hash_alg=hash_alg, paths=paths, total_size=sum(path.size for path in paths)
+                    )
+
+                asset_root_manifests.append(
+                    AssetRootManifest(
+                        file_system_location_name=group.file_system_location_name,
+                        root_path=group.root_path,
+                        asset_manifest=asset_manifest,
+                        outputs=sorted(group.outputs),
+                    )
+                )
+
+        self._save()
+        return asset_root_manifests
+
+    def hash_files(
+        self, paths: list[Path], manifest_version: ManifestVersion = ManifestVersion.v2023_03_03
+    ) -> tuple[HashAlgorithm, dict[Path, str]]:
+        """Hash files of the bundle with the default algorithm of a manifest version.
+
+        Files that have not changed since they were last indexed are not read again, and the
+        hashes are kept for the next `create_manifests`, so that the files are not hashed twice.
+        """
+        manifest_model = ManifestModelRegistry.get_manifest_model(version=manifest_version)
+        hash_alg = manifest_model.AssetManifest.get_default_hash_alg()
+
+        with ThreadPoolExecutor() as executor:
+            hashes = list(executor.map(lambda path: self._get_file_hash(hash_alg, path)[1], paths))
+        return hash_alg, dict(zip(paths, hashes, strict=True))
+
+    def _get_manifest_path(
+        self, manifest_model: type[BaseManifestModel], hash_alg: HashAlgorithm, root_path: str, path: Path
+    ) -> BaseManifestPath:
+        stat, file_hash = self._get_file_hash(hash_alg, path)
+
+        # The asset manifest spec requires the mtime in microseconds
+        return manifest_model.Path(
+            path=path.relative_to(root_path).as_posix(),
+            hash=file_hash,
+            size=stat.st_size,
+            mtime=stat.st_mtime_ns // 1000,
+        )
+
+    def _get_file_hash(self, hash_alg: HashAlgorithm, path: Path) -> tuple[os.stat_result, str]:
+        stat = path.stat()
+        key = os.path.relpath(path, self.bundle_dir).replace(os.sep, "/")
+        entry_stat = [stat.st_size, stat.st_mtime_ns, stat.st_ino, hash_alg.value]
+
+        with self._lock:
+            entry = self._used_entries.get(key) or self._entries.get(key)
+        if entry is not None and entry[:4] == entry_stat:
+            file_hash = entry[4]
+        else:
+            file_hash = hash_file(str(path), hash_alg)
+
+        with self._lock:
+            self._used_entries[key] = [*entry_stat, file_hash]
+        return stat, file_hash
+
+    def _load(self) -> None:
+        if not self._index_path.is_file():
+            return
+
+        try:
+            data = json.loads(self._index_path.read_text(encoding="utf-8"))
+            if data.get("version") == _HASH_INDEX_FILE_VERSION:
+                self._entries = dict(data["entries"])
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.info("Ignoring unreadable bundle hash index %s: %s", self._index_path, e)
+
+    def _save(self) -> None:
+        """Save the entries used by the last manifests, dropping files that are no longer in the bundle."""
+        with self._lock:
+            data = {"version": _HASH_INDEX_FILE_VERSION, "entries": self._used_entries}
+            self._entries = dict(self._used_entries)
+
+        try:
+            temp_path = self._index_path.with_suffix(f".{os.getpid()}.tmp")
+            temp_path.write_text(json.dumps(data), encoding="utf-8")
+            temp_path.replace(self._index_path)
+        except OSError as e:
+            logger.warning("Failed to save bundle hash index %s: %s", self._index_path, e)
+
+
+class DeadlineCloudBundleCache:
+    """Persistent cache of packaged job bundles and the job attachments uploaded for them.
+
+    Each workflow has a single bundle directory under the Deadline cache directory, marked
+    with a fingerprint of the inputs it was packaged from. A bundle is packaged into a staging
+    directory next to the cache, then synced into the workflow's bundle directory once complete:
+    unchanged files are left untouched, so they keep their inode and modification time and both
+    the Deadline hash cache and `BundleHashIndex` can skip hashing them. The fingerprint marker
+    is only written once syncing is done, so a partially updated bundle is never reused.
+
+    A publish holds `lock_bundle` from packaging until its attachments are saved, so that no
+    other publish, in this process or another one, rewrites the bundle while it is uploaded.
+    """
+
+    _bundle_locks: ClassVar[dict[Path, threading.Lock]] = {}
+    _bundle_locks_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(self, cache_dir: Path | None = None) -> None:
+        self.cache_dir = cache_dir or Path(get_cache_directory()) / "griptape_nodes" / "bundles"
+
+    def get_bundle_dir(self, workflow_name: str) -> Path:
+        """Return the directory a workflow's bundle is stored in."""
+        safe_name = workflow_name.replace(os.sep, "_").replace("/", "_")
+        return self.cache_dir / f"{safe_name}_v{BUNDLE_CACHE_VERSION}"
+
+    def get_cached_bundle(self, workflow_name: str, fingerprint: str) -> Path | None:
+        """Return the workflow's bundle directory, if it holds a complete bundle with the fingerprint."""
+        bundle_dir = self.get_bundle_dir(workflow_name)
+        marker = bundle_dir / _BUNDLE_COMPLETE_MARKER
+        if marker.is_file() and marker.read_text(encoding="utf-8") == fingerprint:
+            return bundle_dir
+        return None
+
+    def create_staging_dir(self, workflow_name: str) -> Path:
+        """Create an empty staging directory on the same filesystem as the cache."""
+        staging_root = self.cache_dir / ".staging"
+        staging_root.mkdir(parents=True, exist_ok=True)
+        return Path(tempfile.mkdtemp(prefix=f"{workflow_name}_deadline_bundle_", dir=staging_root))
+
+    @contextmanager
+    def lock_bundle(self, workflow_name: str) -> Iterator[None]:
+        """Hold exclusive use of a workflow's bundle directory, across threads and processes.
+
+        The lock file sits next to the bundle directory, so that syncing the bundle never removes it.
+        """
+        bundle_dir = self.get_bundle_dir(workflow_name)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        with self._get_bundle_lock(bundle_dir):
+            if sys.platform == "win32":
+                yield
+                return
+
+            import fcntl
+
+            with (self.cache_dir / f"{bundle_dir.name}.lock").open("a") as lock_file:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+    def commit_bundle(self, staging_dir: Path, workflow_name: str, fingerprint: str) -> Path:
+        """Sync a fully packaged staging directory into the workflow's bundle directory and return it.
+
+        Must be called while holding `lock_bundle` for the workflow.
+        """
+        bundle_dir = self.get_bundle_dir(workflow_name)
+        try:
+            if self.get_cached_bundle(workflow_name, fingerprint) is None:
+                bundle_dir.mkdir(parents=True, exist_ok=True)
+                # Invalidate the bundle, and the attachments uploaded for it, before changing any file
+                (bundle_dir / _BUNDLE_COMPLETE_MARKER).unlink(missing_ok=True)
+                shutil.rmtree(bundle_dir / _ATTACHMENTS_DIR_NAME, ignore_errors=True)
+
+                updated_count = self._sync_tree(staging_dir, bundle_dir)
+                (bundle_dir / _BUNDLE_COMPLETE_MARKER).write_text(fingerprint, encoding="utf-8")
+                logger.info("Cached job bundle at %s (%d file(s) updated)", bundle_dir, updated_count)
+        finally:
+            shutil.rmtree(staging_dir, ignore_errors=True)
+
+        return bundle_dir
+
+    @classmethod
+    def _get_bundle_lock(cls, bundle_dir: Path) -> threading.Lock:
+        with cls._bundle_locks_lock:
+            return cls._bundle_locks.setdefault(bundle_dir, threading.Lock())
+
+    @classmethod
+    def _sync_tree(cls, source_dir: Path, destination_dir: Path) -> int:
+        """Make a directory tree match another by moving over only the files that differ.
+
+        Returns:
+            The number of files that were added or replaced.
+        """
+        updated_count = 0
+        synced_paths: set[Path] = set()
+
+        for dirpath, _, filenames in os.walk(source_dir):
+            relative_dir = Path(dirpath).relative_to(source_dir)
+            destination_subdir = destination_dir / relative_dir
+            if destination_subdir.is_file() or destination_subdir.is_symlink():
+                destination_subdir.unlink()
+            destination_subdir.mkdir(exist_ok=True)
+            synced_paths.add(relative_dir)
+
+            for filename in filenames:
+                source_path = Path(dirpath) / filename
+                destination_path = destination_subdir / filename
+                synced_paths.add(relative_dir / filename)
+
+                if destination_path.is_dir() and not destination_path.is_symlink():
+                    shutil.rmtree(destination_path)
+                elif destination_path.is_file() and filecmp.cmp(source_path, destination_path, shallow=True):
+                    continue
+                source_path.replace(destination_path)
+                updated_count += 1
+
+        cls._remove_stale_entries(destination_dir, synced_paths)
+        return updated_count
+
+    @staticmethod
+    def _remove_stale_entries(bundle_dir: Path, synced_paths: set[Path]) -> None:
+        """Remove the files and directories of a bundle that are no longer part of it."""
+        for dirpath, dirnames, filenames in os.walk(bundle_dir):
+            relative_dir = Path(dirpath).relative_to(bundle_dir)
+            for dirname in list(dirnames):
+                relative_path = relative_dir / dirname
+                if str(relative_path) in _PRESERVED_BUNDLE_ENTRIES:
+                    dirnames.remove(dirname)
+                elif relative_path not in synced_paths:
+                    shutil.rmtree(bundle_dir / relative_path, ignore_errors=True)
+                    dirnames.remove(dirname)
+            for filename in filenames:
+                relative_path = relative_dir / filename
+                if relative_path not in synced_paths and str(relative_path) not in _PRESERVED_BUNDLE_ENTRIES:
+                    (bundle_dir / relative_path).unlink(missing_ok=True)
+
+    def discard_staging_dir(self, staging_dir: Path) -> None:
+        """Remove a staging directory after a failed packaging attempt."""
+        shutil.rmtree(staging_dir, ignore_errors=True)
+
+    @staticmethod
+    def load_job_template(bundle_dir: Path) -> dict[str, Any]:
+        """Load the job template written into a cached bundle."""
+        with (bundle_dir / "template.yaml").open(encoding="utf-8") as template_file:
+            return yaml.safe_load(template_file)
+
+    @staticmethod
+    def get_attachments_key(
+        farm_id: str,
+        queue_id: str,
+        storage_profile_id: str | None,
+        job_attachment_settings: JobAttachmentS3Settings,
+    ) -> str:
+        """Build the key uploaded attachments are cached under; uploads are only reusable for the same target."""
+        target = f"{farm_id}\0{queue_id}\0{storage_profile_id or ''}\0{job_attachment_settings.to_root_path()}"
+        return hashlib.sha256(target.encode()).hexdigest()[:16]
+
+    def load_attachments(
+        self,
+        bundle_dir: Path,
+        attachments_key: str,
+        job_attachment_settings: JobAttachmentS3Settings,
+        queue_session: Session,
+    ) -> Attachments | None:
+        """Return the attachments previously uploaded for a bundle, if they are still present in S3.
+
+        Args:
+            bundle_dir: The cached bundle directory.
+            attachments_key: Key of the upload target, from `get_attachments_key`.
+            job_attachment_settings: The queue's job attachment settings.
+            queue_session: Queue role session used to verify the input manifests still exist.
+        """
+        attachments_path = bundle_dir / _ATTACHMENTS_DIR_NAME / f"{attachments_key}.json"
+        if not attachments_path.is_file():
+            return None
+
+        try:
+            attachments_dict = json.loads(attachments_path.read_text(encoding="utf-8"))
+            attachments = Attachments(
+                manifests=[ManifestProperties.from_dict(manifest) for manifest in attachments_dict["manifests"]],
+                fileSystem=attachments_dict["fileSystem"],
+            )
+
+            verify_input_manifests_exist(attachments.manifests, job_attachment_settings, queue_session)
+        except Exception as e:
+            logger.info("Cached job attachments for %s are no longer usable: %s", bundle_dir, e)
+            return None
+
+        return attachments
+
+    def save_attachments(self, bundle_dir: Path, attachments_key: str, attachments: Attachments) -> None:
+        """Record the attachments uploaded for a bundle so that later publishes can reuse them."""
+        attachments_path = bundle_dir / _ATTACHMENTS_DIR_NAME / f"{attachments_key}.json"
+        try:
+            attachments_path.parent.mkdir(parents=True, exist_ok=True)
+            attachments_path.write_text(json.dumps(attachments.to_dict(), indent=2), encoding="utf-8")
+        except OSError as e:
+            logger.warning("Failed to cache job attachments for %s: %s", bundle_dir, e)
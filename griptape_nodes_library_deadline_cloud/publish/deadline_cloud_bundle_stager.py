@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import concurrent.futures
+import errno
+import logging
+import os
+import shutil
+import sys
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from fnmatch import fnmatch
+from pathlib import Path
+from typing import TYPE_CHECKING, ClassVar, Self
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from types import TracebackType
+
+
+logger = logging.getLogger("deadline_cloud_bundle_stager")
+
+# Staging is mostly bound by filesystem calls rather than bandwidth, so a few threads go a long way
+STAGING_MAX_WORKERS = 8
+
+# Linux ioctl that clones a file's extents into another file on copy-on-write filesystems (btrfs, XFS)
+_FICLONE = 0x40049409
+# Errors meaning a staging method is not supported between two devices at all, rather than for one file
+_UNSUPPORTED_ERRNOS = frozenset(
+    {errno.EXDEV, errno.EOPNOTSUPP, errno.ENOTSUP, errno.ENOTTY, errno.EINVAL, errno.ENOSYS}
+)
+
+_REFLINK = "reflink"
+_HARDLINK = "hardlink"
+_COPY = "copy"
+
+
+class DeadlineCloudBundleStager:
+    """Stages files and directory trees into a job bundle concurrently, without copying data where possible.
+
+    Each file is cloned with a copy-on-write reflink where the filesystem supports it, otherwise
+    hard linked, and only copied when neither is possible, e.g. across devices. Cloned and linked
+    files share their data with the source, so staging time and disk usage do not grow with the
+    size of the staged assets. Every method keeps the source's modification time, which the
+    bundle cache relies on to detect unchanged files.
+
+    Files are staged in the background; `wait` blocks until all of them are staged. A method that
+    is not supported between two devices is remembered, and not attempted again for them.
+    """
+
+    _unsupported_methods: ClassVar[set[tuple[int, int, str]]] = set()
+    _unsupported_methods_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(self, max_workers: int = STAGING_MAX_WORKERS) -> None:
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="deadline_cloud_bundle_stager")
+        self._futures: list[Future] = []
+        self._method_counts = dict.fromkeys((_REFLINK, _HARDLINK, _COPY), 0)
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self._executor.shutdown(wait=True, cancel_futures=exc_type is not None)
+
+    def stage_file(self, source_path: Path, destination_path: Path) -> None:
+        """Stage a single file, replacing the destination if it exists."""
+        destination_path.parent.mkdir(parents=True, exist_ok=True)
+        self._futures.append(self._executor.submit(self._stage_file, source_path, destination_path))
+
+    def stage_tree(self, source_dir: Path, destination_dir: Path, ignore_patterns: list[str] | None = None) -> None:
+        """Stage every file of a directory tree, merging it into the destination directory.
+
+        Args:
+            source_dir: The directory to stage.
+            destination_dir: The directory to stage it as.
+            ignore_patterns: Glob patterns of file and directory names to leave out, e.g. "__pycache__".
+        """
+        ignore_patterns = ignore_patterns or []
+
+        def is_ignored(name: str) -> bool:
+            return any(fnmatch(name, pattern) for pattern in ignore_patterns)
+
+        # Symlinks are followed, so that their targets are staged like regular files and directories
+        for dirpath, dirnames, filenames in os.walk(source_dir, followlinks=True):
+            dirnames[:] = [dirname for dirname in dirnames if not is_ignored(dirname)]
+            staged_dir = destination_dir / Path(dirpath).relative_to(source_dir)
+            staged_dir.mkdir(parents=True, exist_ok=True)
+            for filename in filenames:
+                if not is_ignored(filename):
+                    self._futures.append(
+                        self._executor.submit(self._stage_file, Path(dirpath) / filename, staged_dir / filename)
+                    )
+
+    def wait(self) -> None:
+        """Wait until every file submitted so far is staged.
+
+        Raises:
+            OSError: If a file could not be staged; the first error is raised once all files are done.
+        """
+        futures, self._futures = self._futures, []
+        concurrent.futures.wait(futures)
+        for future in futures:
+            exception = future.exception()
+            if exception is not None:
+                raise exception
+
+        with self._lock:
+            logger.info(
+                "Staged %d file(s): %d reflinked, %d hard linked, %d copied",
+                sum(self._method_counts.values()),
+                self._method_counts[_REFLINK],
+                self._method_counts[_HARDLINK],
+                self._method_counts[_COPY],
+            )
+
+    def _stage_file(self, source_path: Path, destination_path: Path) -> None:
+        # Staged under a temporary name so that an existing destination is replaced atomically
+        temp_path = destination_path.with_name(f".{destination_path.name}.{threading.get_ident()}.tmp")
+        devices = (source_path.stat().st_dev, destination_path.parent.stat().st_dev)
+
+        methods: tuple[tuple[str, Callable[[Path, Path], object]], ...] = (
+            (_REFLINK, self._reflink),
+            (_HARDLINK, os.link),
+            (_COPY, shutil.copy2),
+        )
+        for method, stage in methods:
+            if method != _COPY and (*devices, method) in self._unsupported_methods:
+                continue
+
+            try:
+                stage(source_path, temp_path)
+            except OSError as e:
+                temp_path.unlink(missing_ok=True)
+                if method == _COPY:
+                    raise
+                if e.errno in _UNSUPPORTED_ERRNOS:
+                    with self._unsupported_methods_lock:
+                        self._unsupported_methods.add((*devices, method))
+                continue
+
+            temp_path.replace(destination_path)
+            # Renaming a hard link onto another link to the same file leaves both names in place
+            temp_path.unlink(missing_ok=True)
+            with self._lock:
+                self._method_counts[method] += 1
+            return
+
+    @staticmethod
+    def _reflink(source_path: Path, destination_path: Path) -> None:
+        if sys.platform != "linux":
+            raise OSError(errno.EOPNOTSUPP, "Reflinks are only attempted on Linux")
+
+        import fcntl
+
+        with source_path.open("rb") as source_file, destination_path.open("xb") as destination_file:
+            fcntl.ioctl(destination_file.fileno(), _FICLONE, source_file.fileno())
+        shutil.copystat(source_path, destination_path)
@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import logging
+import threading
+import weakref
+from typing import TYPE_CHECKING, Any, ClassVar
+
+import boto3
+from botocore.config import Config
+from deadline.client.api import get_queue_user_boto3_session
+
+if TYPE_CHECKING:
+    from botocore.client import BaseClient
+
+
+logger = logging.getLogger("deadline_cloud_client_pool")
+
+# Sized for the parallel uploads, downloads and listings that share a client
+MAX_POOL_CONNECTIONS = 32
+
+
+class DeadlineCloudClientPool:
+    """Process-wide pool of boto3 sessions, clients and queue role sessions.
+
+    Creating a session or client loads the botocore data files, and every new client opens its own
+    connections, so nodes share them instead of creating their own. Sessions are keyed by AWS
+    profile and region, clients by session, service and region, and queue role sessions by the
+    Deadline Cloud client, farm, queue and region they were created for.
+
+    boto3 clients are thread-safe once created, but sessions are not, so every creation happens
+    under the pool's lock.
+    """
+
+    _instance: ClassVar[DeadlineCloudClientPool | None] = None
+    _instance_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(self) -> None:
+        self._lock = threading.RLock()
+        self._sessions: dict[tuple[str, str], boto3.Session] = {}
+        self._clients: weakref.WeakKeyDictionary[boto3.Session, dict[tuple[str, str | None], BaseClient]] = (
+            weakref.WeakKeyDictionary()
+        )
+        self._queue_sessions: weakref.WeakKeyDictionary[BaseClient, dict[tuple[str, str, str], boto3.Session]] = (
+            weakref.WeakKeyDictionary()
+        )
+
+    @classmethod
+    def get_instance(cls) -> DeadlineCloudClientPool:
+        """Return the process-wide pool instance."""
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls()
+            return cls._instance
+
+    def get_session(self, profile_name: str, region_name: str) -> boto3.Session:
+        """Return the shared session for an AWS profile and region.
+
+        Raises:
+            ProfileNotFound: If the profile does not exist.
+        """
+        key = (profile_name, region_name)
+        with self._lock:
+            session = self._sessions.get(key)
+            if session is None:
+                session = boto3.Session(profile_name=profile_name, region_name=region_name)
+                self._sessions[key] = session
+            return session
+
+    def get_client(self, session: boto3.Session, service_name: str, region_name: str | None = None) -> BaseClient:
+        """Return the shared client for a service, created from the given session."""
+        key = (service_name, region_name)
+        with self._lock:
+            clients = self._clients.setdefault(session, {})
+            client = clients.get(key)
+            if client is None:
+                client = session.client(
+                    service_name, region_name=region_name, config=Config(max_pool_connections=MAX_POOL_CONNECTIONS)
+                )
+                clients[key] = client
+            return client
+
+    def get_queue_session(
+        self, deadline_client: BaseClient, region_name: str | None, farm_id: str, queue_id: str
+    ) -> boto3.Session:
+        """Return the shared session with a queue role's credentials.
+
+        The session's credentials refresh themselves through AssumeQueueRoleForUser before they
+        expire, so a session is only recreated once its credentials can no longer be loaded.
+
+        Args:
+            deadline_client: Deadline Cloud client used to assume the queue role.
+            region_name: Region the session's clients should use, or None for the default.
+            farm_id: The farm ID.
+            queue_id: The queue ID.
+        """
+        key = (farm_id, queue_id, region_name or "")
+        with self._lock:
+            queue_sessions = self._queue_sessions.setdefault(deadline_client, {})
+            queue_session = queue_sessions.get(key)
+            if queue_session is not None and self._has_credentials(queue_session):
+                return queue_session
+
+            queue_session = get_queue_user_boto3_session(
+                deadline_client, None, farm_id, queue_id, force_refresh=queue_session is not None
+            )
+            if region_name:
+                queue_session._session.set_config_variable("region", region_name)
+            queue_sessions[key] = queue_session
+            return queue_session
+
+    def clear(self) -> None:
+        """Drop every pooled session and client, e.g. after the AWS configuration changed."""
+        with self._lock:
+            self._sessions.clear()
+            self._clients.clear()
+            self._queue_sessions.clear()
+
+    @staticmethod
+    def _has_credentials(session: boto3.Session) -> bool:
+        try:
+            credentials: Any = session.get_credentials()
+        except Exception as e:
+            logger.debug("Failed to load pooled queue role credentials: %s", e)
+            return False
+        return credentials is not None
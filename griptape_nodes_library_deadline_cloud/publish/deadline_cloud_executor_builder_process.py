@@ -0,0 +1,240 @@
+"""Long-lived helper process that runs executor workflow generation scripts.
+
+Generating an executor workflow needs a Griptape Nodes engine with no other flows loaded, which
+used to mean starting a fresh Python process, importing the engine and registering every library
+on each publish. This module keeps one such process alive and reuses it across publishes.
+
+Run as a script, it serves requests read from stdin, one JSON object per line. Imported, it
+provides the client that starts the helper process and sends it scripts to run.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import queue
+import runpy
+import subprocess
+import sys
+import threading
+import time
+import traceback
+from pathlib import Path
+from typing import Any, ClassVar
+
+logger = logging.getLogger("deadline_cloud_executor_builder_process")
+
+# Prefixes the line a request's result is written on; every other output line is engine logging
+_RESULT_MARKER = "__deadline_cloud_executor_builder_result__ "
+
+
+class ExecutorBuilderProcessError(RuntimeError):
+    """The helper process could not run a script: it failed to start, exited or timed out."""
+
+
+class DeadlineCloudExecutorBuilderProcess:
+    """Client of the helper process that generates executor workflows, shared by every publish.
+
+    Scripts run one at a time. The helper is started on first use, and again whenever the
+    workspace or the libraries to register change, a script times out or the helper exits.
+    Libraries stay registered in the helper, so any change to a registered library's files or
+    version restarts it rather than leaving it on stale node classes. When the helper itself
+    fails, `ExecutorBuilderProcessError` is raised so that callers can fall back to running the
+    script in a one-off subprocess; a script that fails raises a plain RuntimeError.
+    """
+
+    _instance: ClassVar[DeadlineCloudExecutorBuilderProcess | None] = None
+    _instance_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(self) -> None:
+        self._process: subprocess.Popen[str] | None = None
+        self._output_lines: queue.Queue[str | None] = queue.Queue()
+        self._workspace_path: Path | None = None
+        self._libraries_fingerprint: tuple[Any, ...] | None = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def get_instance(cls) -> DeadlineCloudExecutorBuilderProcess:
+        """Return the process-wide client."""
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls()
+            return cls._instance
+
+    def run_script(self, script_path: Path, workspace_path: Path, libraries: list[str], timeout: float) -> None:
+        """Run a workflow generation script in the helper process.
+
+        Args:
+            script_path: The generated script; its `main` function is called.
+            workspace_path: The workspace the executor workflow must be saved to.
+            libraries: The library files or requirement specifiers the script registers.
+            timeout: Time, in seconds, to wait for the script to finish.
+
+        Raises:
+            ExecutorBuilderProcessError: If the helper process could not run the script.
+            RuntimeError: If the script failed.
+        """
+        libraries_fingerprint = _get_libraries_fingerprint(libraries)
+        with self._lock:
+            process = self._ensure_started(workspace_path, libraries_fingerprint)
+            try:
+                if process.stdin is None:
+                    msg = "Executor workflow builder process has no stdin"
+                    raise ExecutorBuilderProcessError(msg)  # noqa: TRY301
+                process.stdin.write(json.dumps({"script_path": str(script_path)}) + "\n")
+                process.stdin.flush()
+                result = self._read_result(timeout)
+            except (OSError, ValueError) as e:
+                self._stop()
+                msg = f"Failed to communicate with the executor workflow builder process: {e}"
+                raise ExecutorBuilderProcessError(msg) from e
+            except ExecutorBuilderProcessError:
+                self._stop()
+                raise
+
+        if not result.get("succeeded"):
+            msg = f"Executor workflow generation failed: {result.get('error')}"
+            raise RuntimeError(msg)
+
+    def stop(self) -> None:
+        """Stop the helper process, if it is running."""
+        with self._lock:
+            self._stop()
+
+    def _ensure_started(self, workspace_path: Path, libraries_fingerprint: tuple[Any, ...]) -> subprocess.Popen[str]:
+        if (
+            self._process is not None
+            and self._process.poll() is None
+            and self._workspace_path == workspace_path
+            and self._libraries_fingerprint == libraries_fingerprint
+        ):
+            return self._process
+
+        self._stop()
+        logger.info("Starting executor workflow builder process")
+        try:
+            self._process = subprocess.Popen(  # noqa: S603
+                [sys.executable, "-u", str(Path(__file__))],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                text=True,
+                cwd=Path(__file__).parent,
+            )
+        except OSError as e:
+            msg = f"Failed to start executor workflow builder process: {e}"
+            raise ExecutorBuilderProcessError(msg) from e
+
+        self._workspace_path = workspace_path
+        self._libraries_fingerprint = libraries_fingerprint
+        self._output_lines = queue.Queue()
+        threading.Thread(
+            target=self._read_output,
+            args=(self._process, self._output_lines),
+            name="deadline_cloud_executor_builder_output",
+            daemon=True,
+        ).start()
+        return self._process
+
+    def _read_result(self, timeout: float) -> dict[str, Any]:
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                line = self._output_lines.get(timeout=max(deadline - time.monotonic(), 0))
+            except queue.Empty:
+                msg = f"Executor workflow builder process did not finish within {timeout} seconds"
+                raise ExecutorBuilderProcessError(msg) from None
+
+            if line is None:
+                msg = "Executor workflow builder process exited unexpectedly"
+                raise ExecutorBuilderProcessError(msg)
+            if line.startswith(_RESULT_MARKER):
+                return json.loads(line.removeprefix(_RESULT_MARKER))
+            if line.strip():
+                logger.debug(line.rstrip())
+
+    def _stop(self) -> None:
+        if self._process is None:
+            return
+
+        if self._process.poll() is None:
+            self._process.kill()
+            self._process.wait()
+        self._process = None
+        self._workspace_path = None
+        self._libraries_fingerprint = None
+
+    @staticmethod
+    def _read_output(process: subprocess.Popen[str], output_lines: queue.Queue[str | None]) -> None:
+        if process.stdout is not None:
+            for line in process.stdout:
+                output_lines.put(line)
+        output_lines.put(None)
+
+
+def _get_libraries_fingerprint(libraries: list[str]) -> tuple[Any, ...]:
+    """Identify the libraries to register along with their current versions and source files.
+
+    A library file is identified by its path, its declared version and the latest modification
+    time of its JSON and Python files; a requirement specifier by the specifier itself.
+    """
+    fingerprint: list[Any] = []
+    for library in libraries:
+        if not library.endswith(".json"):
+            fingerprint.append(library)
+            continue
+
+        library_path = Path(library)
+        try:
+            with library_path.open(encoding="utf-8") as f:
+                version = json.load(f).get("metadata", {}).get("library_version")
+        except (OSError, ValueError):
+            version = None
+
+        latest_mtime_ns = 0
+        for dirpath, dirnames, filenames in os.walk(library_path.parent):
+            # Skip virtual environments, caches and other hidden directories
+            dirnames[:] = [name for name in dirnames if not name.startswith(".") and name != "__pycache__"]
+            for filename in filenames:
+                if filename.endswith((".py", ".json")):
+                    try:
+                        latest_mtime_ns = max(latest_mtime_ns, (Path(dirpath) / filename).stat().st_mtime_ns)
+                    except OSError:
+                        continue
+        fingerprint.append((library, version, latest_mtime_ns))
+    return tuple(fingerprint)
+
+
+def _run_script(script_path: Path) -> dict[str, Any]:
+    """Run a generation script against a freshly cleared engine."""
+    from griptape_nodes.retained_mode.events.object_events import ClearAllObjectStateRequest
+    from griptape_nodes.retained_mode.griptape_nodes import GriptapeNodes
+
+    try:
+        # Libraries stay registered between scripts; only the flows and nodes of the last one are dropped
+        GriptapeNodes.handle_request(ClearAllObjectStateRequest(i_know_what_im_doing=True))
+        namespace = runpy.run_path(str(script_path), run_name="__deadline_cloud_executor_builder__")
+        namespace["main"]()
+    except SystemExit as e:
+        if e.code not in (None, 0):
+            return {"succeeded": False, "error": f"Script exited with status {e.code}"}
+    except Exception:
+        return {"succeeded": False, "error": traceback.format_exc()}
+    return {"succeeded": True}
+
+
+def main() -> None:
+    """Serve generation requests from stdin until it is closed."""
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        request = json.loads(line)
+        result = _run_script(Path(request["script_path"]))
+        # Starts on a new line in case the script left a partial line behind
+        sys.stdout.write(f"\n{_RESULT_MARKER}{json.dumps(result)}\n")
+        sys.stdout.flush()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,290 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import itertools
+import logging
+import threading
+import time
+from concurrent.futures import Future, InvalidStateError
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING, Any, ClassVar
+
+from publish.deadline_cloud_job_poller import _BACKOFF_MULTIPLIER, _INITIAL_POLL_INTERVAL
+
+if TYPE_CHECKING:
+    from publish.base_deadline_cloud import BaseDeadlineCloud
+    from publish.deadline_cloud_job_poller import DeadlineCloudJobPoller
+
+
+logger = logging.getLogger("deadline_cloud_job_poll_coordinator")
+
+# search_jobs accepts at most 100 results per page
+_SEARCH_PAGE_SIZE = 100
+# Upper bound on search pages per queue per tick; jobs not found within these pages fall back to get_job
+_MAX_SEARCH_PAGES = 5
+# Registered jobs are searched from slightly before their registration time to tolerate clock skew
+_CREATED_AT_MARGIN = timedelta(minutes=5)
+
+
+@dataclass
+class _JobWaiter:
+    """A registered job and the future its caller is waiting on."""
+
+    poller: DeadlineCloudJobPoller
+    created_after: datetime
+    future: Future = field(default_factory=Future)
+    poll_count: int = 0
+    start_time: float = field(default_factory=time.time)
+
+
+@dataclass
+class _QueueGroup:
+    """All in-flight jobs of a single farm/queue pair, refreshed together."""
+
+    deadline_cloud: BaseDeadlineCloud
+    farm_id: str
+    queue_id: str
+    # Every caller waiting on a job, in registration order; a job may be awaited more than once
+    waiters: dict[str, list[_JobWaiter]] = field(default_factory=dict)
+    poll_interval: float = _INITIAL_POLL_INTERVAL
+    next_poll_at: float = float("inf")
+
+
+class DeadlineCloudJobPollCoordinator:
+    """Process-wide coordinator that polls many Deadline Cloud jobs with one search per queue.
+
+    Jobs are registered together with the `DeadlineCloudJobPoller` that describes them. On each
+    tick, a background thread issues a single `search_jobs` request per farm/queue pair covering
+    every registered job in that queue, then hands each job's summary to its poller's status
+    callback. Jobs missing from the search results (e.g. because the search index has not caught
+    up with a freshly created job) are refreshed individually with `get_job`.
+
+    The number of API calls therefore scales with the number of queues rather than the number
+    of jobs being monitored.
+    """
+
+    _instance: ClassVar[DeadlineCloudJobPollCoordinator | None] = None
+    _instance_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(self) -> None:
+        self._groups: dict[tuple[str, str], _QueueGroup] = {}
+        self._condition = threading.Condition()
+        self._thread: threading.Thread | None = None
+
+    @classmethod
+    def get_instance(cls) -> DeadlineCloudJobPollCoordinator:
+        """Return the process-wide coordinator instance."""
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls()
+            return cls._instance
+
+    def wait_for_job(self, deadline_cloud: BaseDeadlineCloud, poller: DeadlineCloudJobPoller) -> Any:
+        """Block until the poller's job completes and return its final job summary.
+
+        Args:
+            deadline_cloud: Deadline Cloud accessor used to search the job's queue.
+            poller: Poller describing the job, its poll interval and status callback.
+
+        Raises:
+            RuntimeError: If the job fails or does not complete successfully.
+        """
+        return self.register(deadline_cloud, poller).result()
+
+    async def await_job(self, deadline_cloud: BaseDeadlineCloud, poller: DeadlineCloudJobPoller) -> Any:
+        """Await the poller's job without blocking the event loop and return its final job summary.
+
+        Args:
+            deadline_cloud: Deadline Cloud accessor used to search the job's queue.
+            poller: Poller describing the job, its poll interval and status callback.
+
+        Raises:
+            RuntimeError: If the job fails or does not complete successfully.
+        """
+        return await asyncio.wrap_future(self.register(deadline_cloud, poller))
+
+    def register(self, deadline_cloud: BaseDeadlineCloud, poller: DeadlineCloudJobPoller) -> Future:
+        """Register a job for coordinated polling.
+
+        Args:
+            deadline_cloud: Deadline Cloud accessor used to search the job's queue.
+            poller: Poller describing the job, its poll interval and status callback.
+
+        Returns:
+            A future resolved with the final job summary, or with the error raised for a failed job.
+        """
+        waiter = _JobWaiter(poller=poller, created_after=datetime.now(UTC) - _CREATED_AT_MARGIN)
+        key = (poller.farm_id, poller.queue_id)
+
+        with self._condition:
+            group = self._groups.get(key)
+            if group is None:
+                group = _QueueGroup(deadline_cloud=deadline_cloud, farm_id=poller.farm_id, queue_id=poller.queue_id)
+                self._groups[key] = group
+            group.waiters.setdefault(poller.job_id, []).append(waiter)
+
+            # Pick up the new job quickly, then let the group back off again
+            group.poll_interval = _INITIAL_POLL_INTERVAL
+            group.next_poll_at = min(group.next_poll_at, time.monotonic() + _INITIAL_POLL_INTERVAL)
+
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="deadline_cloud_job_poll_coordinator", daemon=True
+                )
+                self._thread.start()
+            self._condition.notify()
+
+        logger.debug("Registered job %s for coordinated polling on queue %s", poller.job_id, poller.queue_id)
+        return waiter.future
+
+    def _run(self) -> None:
+        """Background loop that refreshes every queue group when it is due."""
+        while True:
+            with self._condition:
+                if not self._groups:
+                    self._thread = None
+                    return
+
+                now = time.monotonic()
+                due = [group for group in self._groups.values() if group.next_poll_at <= now]
+                if not due:
+                    next_poll_at = min(group.next_poll_at for group in self._groups.values())
+                    self._condition.wait(timeout=next_poll_at - now)
+                    continue
+
+                # Schedule the next refresh up front so registrations during this tick can pull it forward
+                for group in due:
+                    max_interval = min(
+                        float(waiter.poller.max_poll_interval)
+                        for job_waiters in group.waiters.values()
+                        for waiter in job_waiters
+                    )
+                    group.next_poll_at = now + group.poll_interval
+                    group.poll_interval = min(group.poll_interval * _BACKOFF_MULTIPLIER, max_interval)
+
+            for group in due:
+                try:
+                    self._refresh_group(group)
+                except Exception:
+                    logger.exception("Unexpected error refreshing jobs on queue %s", group.queue_id)
+
+    def _refresh_group(self, group: _QueueGroup) -> None:
+        """Refresh every registered job of a queue with one search and fan the results out."""
+        with self._condition:
+            # Drop callers that stopped waiting, and jobs nobody waits on anymore
+            for job_id, job_waiters in list(group.waiters.items()):
+                job_waiters[:] = [waiter for waiter in job_waiters if not waiter.future.cancelled()]
+                if not job_waiters:
+                    del group.waiters[job_id]
+            if not group.waiters:
+                self._groups.pop((group.farm_id, group.queue_id), None)
+                return
+            waiters = {job_id: list(job_waiters) for job_id, job_waiters in group.waiters.items()}
+
+        job_summaries = self._search_registered_jobs(group, waiters)
+
+        for job_id, job_waiters in waiters.items():
+            # A job missing from the search is fetched once, by its first waiter's poller
+            fetched_by: _JobWaiter | None = None
+            job_details_dict = job_summaries.get(job_id)
+            if job_details_dict is None:
+                fetched_by = job_waiters[0]
+                try:
+                    job_details_dict = fetched_by.poller._get_job()
+                except Exception as e:
+                    logger.error("Failed to get status for job %s: %s", job_id, e)
+                    for waiter in job_waiters:
+                        self._finish(group, waiter, error=e)
+                    continue
+
+            for waiter in job_waiters:
+                if waiter is not fetched_by:
+                    waiter.poller._refresh_task_progress(job_details_dict)
+                self._update_waiter(group, waiter, job_details_dict)
+
+    def _search_registered_jobs(self, group: _QueueGroup, waiters: dict[str, list[_JobWaiter]]) -> dict[str, Any]:
+        """Search the group's queue for its registered jobs, returning the summaries found by job ID."""
+        created_after = min(waiter.created_after for job_waiters in waiters.values() for waiter in job_waiters)
+        filter_expressions = {
+            "filters": [
+                {
+                    "dateTimeFilter": {
+                        "name": "CREATED_AT",
+                        "operator": "GREATER_THAN_EQUAL_TO",
+                        "dateTime": created_after,
+                    }
+                }
+            ],
+            "operator": "AND",
+        }
+        sort_expressions = [{"fieldSort": {"name": "CREATED_AT", "sortOrder": "ASCENDING"}}]
+
+        found: dict[str, Any] = {}
+        jobs = group.deadline_cloud.iter_jobs(
+            farm_id=group.farm_id,
+            queue_id=group.queue_id,
+            page_size=_SEARCH_PAGE_SIZE,
+            filter_expressions=filter_expressions,
+            sort_expressions=sort_expressions,
+        )
+        try:
+            # Stop fetching pages as soon as every registered job has been found
+            for job in itertools.islice(jobs, _SEARCH_PAGE_SIZE * _MAX_SEARCH_PAGES):
+                if job.get("jobId") in waiters:
+                    found[job["jobId"]] = job
+                    if len(found) == len(waiters):
+                        break
+        except Exception as e:
+            logger.debug("Failed to search jobs on queue %s: %s", group.queue_id, e)
+
+        return found
+
+    def _update_waiter(self, group: _QueueGroup, waiter: _JobWaiter, job_details_dict: Any) -> None:
+        """Report a job's latest status to its poller and resolve the waiter once the job is done."""
+        poller = waiter.poller
+        waiter.poll_count += 1
+
+        # Narrow the next search window to the job's actual creation time
+        created_at = job_details_dict.get("createdAt")
+        if isinstance(created_at, datetime):
+            waiter.created_after = created_at
+
+        try:
+            job_details = poller._report_status(job_details_dict, waiter.poll_count, waiter.start_time)
+            if not poller._is_finished(job_details):
+                return
+            poller._raise_for_final_status(job_details)
+        except Exception as e:
+            self._finish(group, waiter, error=e)
+            return
+
+        logger.info(
+            "Job %s completed successfully after %d polls (%.1fs)",
+            poller.job_id,
+            waiter.poll_count,
+            time.time() - waiter.start_time,
+        )
+        self._finish(group, waiter, result=job_details_dict)
+
+    def _finish(
+        self, group: _QueueGroup, waiter: _JobWaiter, result: Any = None, error: BaseException | None = None
+    ) -> None:
+        """Unregister a waiter and resolve its future."""
+        with self._condition:
+            job_waiters = group.waiters.get(waiter.poller.job_id, [])
+            job_waiters[:] = [job_waiter for job_waiter in job_waiters if job_waiter is not waiter]
+            if not job_waiters:
+                group.waiters.pop(waiter.poller.job_id, None)
+            if not group.waiters:
+                self._groups.pop((group.farm_id, group.queue_id), None)
+
+        if waiter.future.cancelled():
+            return
+        # The caller may cancel the wait concurrently
+        with contextlib.suppress(InvalidStateError):
+            if error is not None:
+                waiter.future.set_exception(error)
+            else:
+                waiter.future.set_result(result)
@@ -1,20 +1,51 @@
 from __future__ import annotations
 
+import asyncio
 import logging
+import threading
 import time
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
 from enum import StrEnum
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, ClassVar
 
 if TYPE_CHECKING:
     from collections.abc import Callable
     from configparser import ConfigParser
+    from datetime import datetime
 
     from botocore.client import BaseClient
 
 
 logger = logging.getLogger(__name__)
 
+# Backoff parameters shared by the sync and async polling loops
+_INITIAL_POLL_INTERVAL = 0.5
+_BACKOFF_MULTIPLIER = 1.5
+
+# Boto calls made by async pollers run on this bounded pool so that many concurrently
+# monitored jobs cannot exhaust the event loop's default executor.
+_POLL_EXECUTOR_MAX_WORKERS = 4
+_poll_executor: ThreadPoolExecutor | None = None
+_poll_executor_lock = threading.Lock()
+
+# search_tasks accepts at most 100 results per page and item offsets up to 10000
+SEARCH_TASKS_MAX_PAGE_SIZE = 100
+SEARCH_TASKS_MAX_ITEM_OFFSET = 10000
+# Pages of updated tasks fetched per progress refresh, so a busy job cannot monopolise a poll tick
+TASK_PROGRESS_MAX_PAGES_PER_REFRESH = 5
+
+
+def _get_poll_executor() -> ThreadPoolExecutor:
+    """Return the shared thread pool used to offload blocking Deadline Cloud calls."""
+    global _poll_executor  # noqa: PLW0603
+    with _poll_executor_lock:
+        if _poll_executor is None:
+            _poll_executor = ThreadPoolExecutor(
+                max_workers=_POLL_EXECUTOR_MAX_WORKERS, thread_name_prefix="deadline_cloud_poller"
+            )
+        return _poll_executor
+
 
 class LifecycleStatus(StrEnum):
     """Lifecycle status values for Deadline Cloud jobs."""
@@ -58,6 +89,54 @@ class TaskRunStatus(StrEnum):
         """Get the list of task run statuses that indicate completion."""
         return [cls.SUCCEEDED, cls.FAILED, cls.CANCELED, cls.NOT_COMPATIBLE]
 
+    @classmethod
+    def get_active_statuses(cls) -> list[TaskRunStatus]:
+        """Get the list of task run statuses that indicate a task is occupying a worker."""
+        return [cls.ASSIGNED, cls.STARTING, cls.SCHEDULED, cls.RUNNING, cls.INTERRUPTING]
+
+    @classmethod
+    def get_unsuccessful_statuses(cls) -> list[TaskRunStatus]:
+        """Get the list of task run statuses that indicate a task finished without succeeding."""
+        return [cls.FAILED, cls.CANCELED, cls.NOT_COMPATIBLE]
+
+
+@dataclass
+class DeadlineCloudTaskDetails:
+    """Identity and parameters of a single task in a Deadline Cloud job.
+
+    Attributes:
+        step_id (str): The ID of the step the task belongs to.
+        task_id (str): The ID of the task.
+        parameters (dict[str, Any]): The task parameter values, e.g. {"TaskIndex": {"int": "3"}}.
+    """
+
+    step_id: str
+    task_id: str
+    parameters: dict[str, Any]
+
+
+@dataclass
+class DeadlineCloudTaskProgress:
+    """Aggregated task-level progress of a Deadline Cloud job.
+
+    Attributes:
+        total (int): The number of tasks seen across all steps of the job.
+        succeeded (int): The number of tasks that succeeded.
+        failed (int): The number of tasks that failed, were canceled or are not compatible.
+        running (int): The number of tasks currently assigned to or running on a worker.
+        pending (int): The number of tasks that are not yet running or finished.
+        throughput (float): Tasks succeeded per minute since tracking started.
+        newly_succeeded (list[DeadlineCloudTaskDetails]): Tasks that succeeded since the previous refresh.
+    """
+
+    total: int
+    succeeded: int
+    failed: int
+    running: int
+    pending: int
+    throughput: float
+    newly_succeeded: list[DeadlineCloudTaskDetails] = field(default_factory=list)
+
 
 @dataclass
 class DeadlineCloudJobDetails:
@@ -82,6 +161,7 @@ class DeadlineCloudJobDetails:
         task_failure_retry_count (int): Current task failure retry count.
         storage_profile_id (str | None): The storage profile ID.
         source_job_id (str | None): The source job ID if this is a retry.
+        task_progress (DeadlineCloudTaskProgress | None): Task-level progress, if task progress tracking is enabled.
     """
 
     job_id: str
@@ -102,6 +182,7 @@ class DeadlineCloudJobDetails:
     task_failure_retry_count: int
     storage_profile_id: str | None
     source_job_id: str | None
+    task_progress: DeadlineCloudTaskProgress | None = None
 
     @classmethod
     def from_job_details(cls, job_details: dict[str, Any]) -> DeadlineCloudJobDetails:
@@ -135,6 +216,184 @@ class DeadlineCloudJobDetails:
         )
 
 
+class DeadlineCloudTaskProgressTracker:
+    """Incrementally tracks the run status of every task in a Deadline Cloud job.
+
+    Each refresh searches only for the tasks updated since the latest `updatedAt` seen so far,
+    sorted oldest first, and fetches at most `max_pages_per_refresh` pages. A refresh that hits
+    the cap resumes from where it stopped on the next call. Task
+    statuses are kept in a compact byte array with one entry per task, so very wide jobs stay
+    cheap to track.
+    """
+
+    _STATUS_CODES: ClassVar[dict[TaskRunStatus, int]] = {status: code for code, status in enumerate(TaskRunStatus)}
+    _SUCCEEDED_CODE: ClassVar[int] = _STATUS_CODES[TaskRunStatus.SUCCEEDED]
+
+    def __init__(
+        self,
+        client: BaseClient,
+        job_id: str,
+        queue_id: str,
+        farm_id: str,
+        *,
+        max_pages_per_refresh: int | None = TASK_PROGRESS_MAX_PAGES_PER_REFRESH,
+    ) -> None:
+        self.client = client
+        self.job_id = job_id
+        self.queue_id = queue_id
+        self.farm_id = farm_id
+        self.max_pages_per_refresh = max_pages_per_refresh
+
+        self._job_change_key: Any = None
+        self._job_status_counts: dict[str, int] | None = None
+        self._updated_since: datetime | None = None
+        self._updated_since_inclusive = False
+        self._resume_offset = 0
+        self._task_slots: dict[str, int] = {}
+        self._task_statuses = bytearray()
+        self._newly_succeeded: list[DeadlineCloudTaskDetails] = []
+
+        self._start_time: float | None = None
+        self._start_succeeded = 0
+
+    def refresh(self, job_details_dict: Any | None = None) -> DeadlineCloudTaskProgress:
+        """Refresh task statuses and return the aggregated progress.
+
+        Args:
+            job_details_dict: Latest job details or job search summary. When neither its `updatedAt`
+                nor its task run status counts changed since the previous complete refresh, no
+                Deadline Cloud calls are made. Its task run status counts are used for the aggregate
+                totals.
+        """
+        job_change_key = None
+        if job_details_dict:
+            job_change_key = self._get_change_key(job_details_dict)
+            self._job_status_counts = job_details_dict.get("taskRunStatusCounts") or None
+        if job_change_key is None or job_change_key != self._job_change_key:
+            caught_up = self._refresh_updated_tasks()
+            # Leave the key unset after a capped refresh so that the next call resumes the search
+            self._job_change_key = job_change_key if caught_up else None
+
+        progress = self.get_progress()
+        progress.newly_succeeded, self._newly_succeeded = self._newly_succeeded, []
+        return progress
+
+    def get_progress(self) -> DeadlineCloudTaskProgress:
+        """Return the aggregated progress from the job's status counts, or from the statuses recorded so far."""
+        if self._job_status_counts is not None:
+            counts = {status: self._job_status_counts.get(status.value, 0) for status in TaskRunStatus}
+        else:
+            counts = {status: self._task_statuses.count(code) for status, code in self._STATUS_CODES.items()}
+        total = sum(counts.values())
+        succeeded = counts[TaskRunStatus.SUCCEEDED]
+        failed = sum(counts[status] for status in TaskRunStatus.get_unsuccessful_statuses())
+        running = sum(counts[status] for status in TaskRunStatus.get_active_statuses())
+
+        now = time.time()
+        if self._start_time is None:
+            self._start_time = now
+            self._start_succeeded = succeeded
+        elapsed_minutes = (now - self._start_time) / 60
+        throughput = (succeeded - self._start_succeeded) / elapsed_minutes if elapsed_minutes > 0 else 0.0
+
+        return DeadlineCloudTaskProgress(
+            total=total,
+            succeeded=succeeded,
+            failed=failed,
+            running=running,
+            pending=total - succeeded - failed - running,
+            throughput=throughput,
+        )
+
+    @staticmethod
+    def _get_change_key(summary: Any) -> tuple[Any, tuple[tuple[str, int], ...]]:
+        """Build a key that changes whenever a job summary reports new task activity."""
+        counts = summary.get("taskRunStatusCounts") or {}
+        return summary.get("updatedAt"), tuple(sorted(counts.items()))
+
+    def _get_search_tasks_request(self) -> dict[str, Any]:
+        request: dict[str, Any] = {
+            "farmId": self.farm_id,
+            "queueIds": [self.queue_id],
+            "jobId": self.job_id,
+            "sortExpressions": [{"fieldSort": {"name": "UPDATED_AT", "sortOrder": "ASCENDING"}}],
+        }
+        if self._updated_since is not None:
+            request["filterExpressions"] = {
+                "filters": [
+                    {
+                        "dateTimeFilter": {
+                            "name": "UPDATED_AT",
+                            "operator": "GREATER_THAN_EQUAL_TO" if self._updated_since_inclusive else "GREATER_THAN",
+                            "dateTime": self._updated_since,
+                        }
+                    }
+                ],
+                "operator": "AND",
+            }
+        return request
+
+    def _refresh_updated_tasks(self) -> bool:
+        """Record the tasks updated since the previous refresh.
+
+        After a complete refresh the next one only searches for tasks updated strictly after the
+        latest `updatedAt` seen. A refresh cut short by the page cap or the search's item offset
+        limit restarts from the latest `updatedAt` it saw, inclusive, or continues by item offset
+        when every task it fetched shared one timestamp. Recording a task's status twice is harmless.
+
+        Returns:
+            True if every updated task was fetched, False if the page cap was reached first.
+        """
+        pages = 0
+        while True:
+            request = self._get_search_tasks_request()
+            item_offset = self._resume_offset
+            first_updated_at = latest_updated_at = None
+            while True:
+                result = self.client.search_tasks(
+                    **request, pageSize=SEARCH_TASKS_MAX_PAGE_SIZE, itemOffset=item_offset
+                )
+                pages += 1
+                for task in result.get("tasks", []):
+                    self._record_task(task)
+                    latest_updated_at = task.get("updatedAt") or latest_updated_at
+                    first_updated_at = first_updated_at or latest_updated_at
+
+                next_item_offset = result.get("nextItemOffset")
+                capped = self.max_pages_per_refresh is not None and pages >= self.max_pages_per_refresh
+                if next_item_offset is None or capped or next_item_offset > SEARCH_TASKS_MAX_ITEM_OFFSET:
+                    break
+                item_offset = next_item_offset
+
+            if latest_updated_at is not None:
+                self._updated_since = latest_updated_at
+            if next_item_offset is None:
+                self._updated_since_inclusive = False
+                self._resume_offset = 0
+                return True
+
+            self._updated_since_inclusive = True
+            self._resume_offset = next_item_offset if first_updated_at == latest_updated_at else 0
+            if capped:
+                return False
+
+    def _record_task(self, task: Any) -> None:
+        slot = self._task_slots.get(task["taskId"])
+        if slot is None:
+            slot = len(self._task_statuses)
+            self._task_slots[task["taskId"]] = slot
+            self._task_statuses.append(self._STATUS_CODES[TaskRunStatus.UNKNOWN])
+
+        status_code = self._STATUS_CODES[TaskRunStatus(task.get("runStatus", "UNKNOWN"))]
+        if status_code == self._SUCCEEDED_CODE and self._task_statuses[slot] != status_code:
+            self._newly_succeeded.append(
+                DeadlineCloudTaskDetails(
+                    step_id=task["stepId"], task_id=task["taskId"], parameters=task.get("parameters", {})
+                )
+            )
+        self._task_statuses[slot] = status_code
+
+
 class DeadlineCloudJobPoller:
     """Polls the Deadline Cloud job until completion.
 
@@ -145,6 +404,7 @@ class DeadlineCloudJobPoller:
         farm_id (str): The ID of the farm where the job is submitted.
         max_poll_interval (int): Maximum time to wait between polls in seconds.
         status_callback (Callable[[DeadlineCloudJobDetails, float], None] | None): Optional callback function to report status updates.
+        track_task_progress (bool): Whether to track task-level progress and report it through `task_progress`.
     """
 
     def __init__(  # noqa: PLR0913
@@ -156,6 +416,8 @@ class DeadlineCloudJobPoller:
         farm_id: str,
         max_poll_interval: int = 120,
         status_callback: Callable[[DeadlineCloudJobDetails, float], None] | None = None,
+        *,
+        track_task_progress: bool = False,
     ) -> None:
         self.client = client
         self.config = config
@@ -164,67 +426,139 @@ class DeadlineCloudJobPoller:
         self.farm_id = farm_id
         self.max_poll_interval = max_poll_interval
         self.status_callback = status_callback
+        self.task_progress_tracker = (
+            DeadlineCloudTaskProgressTracker(client, job_id, queue_id, farm_id) if track_task_progress else None
+        )
+        self._task_progress: DeadlineCloudTaskProgress | None = None
 
     def poll_job(self) -> Any:
         """Poll the job until completion and return job details.
 
-        Args:
-            max_poll_interval: Maximum time to wait between polls in seconds.
+        This blocks the calling thread between polls. Callers running on an event loop
+        should use `apoll_job` instead.
         """
         job_details_dict: Any = {}
         current_job_details: DeadlineCloudJobDetails | None = None
-        failed_statuses = LifecycleStatus.get_failed_statuses()
 
         # Exponential backoff parameters
-        poll_interval = 0.5  # Start with 0.5 seconds
-        backoff_multiplier = 1.5
+        poll_interval = _INITIAL_POLL_INTERVAL
         max_interval = float(self.max_poll_interval)
         poll_count = 0
         start_time = time.time()
 
         while True:
             poll_count += 1
-            job_details_dict = self.client.get_job(jobId=self.job_id, queueId=self.queue_id, farmId=self.farm_id)
-            current_job_details = DeadlineCloudJobDetails.from_job_details(job_details_dict)
+            job_details_dict = self._get_job()
+            current_job_details = self._report_status(job_details_dict, poll_count, start_time)
+
+            if self._is_finished(current_job_details):
+                break
+
+            # Sleep with exponential backoff
+            logger.debug("Waiting %.1f seconds before next poll", poll_interval)
+            time.sleep(poll_interval)
 
-            elapsed_time = time.time() - start_time
+            # Increase poll interval with backoff, but cap at max_interval
+            poll_interval = min(poll_interval * _BACKOFF_MULTIPLIER, max_interval)
 
-            if self.status_callback:
-                self.status_callback(current_job_details, elapsed_time)
+        self._raise_for_final_status(current_job_details)
 
-            logger.info(
-                "Job %s poll #%d - Lifecycle: %s, Task Status: %s (elapsed: %.1fs)",
-                self.job_id,
-                poll_count,
-                current_job_details.lifecycle_status,
-                current_job_details.task_run_status,
-                elapsed_time,
-            )
+        logger.info(
+            "Job %s completed successfully after %d polls (%.1fs)", self.job_id, poll_count, time.time() - start_time
+        )
+        return job_details_dict
 
-            # Check for failure conditions
-            if current_job_details.lifecycle_status in failed_statuses:
-                break
+    async def apoll_job(self) -> Any:
+        """Poll the job until completion without blocking the event loop.
+
+        Boto calls are offloaded to a bounded thread pool shared by all pollers and the
+        backoff wait uses `asyncio.sleep`, so several jobs can be monitored concurrently
+        from a single engine process.
+        """
+        loop = asyncio.get_running_loop()
+        job_details_dict: Any = {}
+        current_job_details: DeadlineCloudJobDetails | None = None
 
-            # Check for completion
-            if current_job_details.task_run_status in TaskRunStatus.get_completed_statuses():
+        # Exponential backoff parameters
+        poll_interval = _INITIAL_POLL_INTERVAL
+        max_interval = float(self.max_poll_interval)
+        poll_count = 0
+        start_time = time.time()
+
+        while True:
+            poll_count += 1
+            job_details_dict = await loop.run_in_executor(_get_poll_executor(), self._get_job)
+            current_job_details = self._report_status(job_details_dict, poll_count, start_time)
+
+            if self._is_finished(current_job_details):
                 break
 
-            # Sleep with exponential backoff
             logger.debug("Waiting %.1f seconds before next poll", poll_interval)
-            time.sleep(poll_interval)
+            await asyncio.sleep(poll_interval)
 
-            # Increase poll interval with backoff, but cap at max_interval
-            poll_interval = min(poll_interval * backoff_multiplier, max_interval)
+            poll_interval = min(poll_interval * _BACKOFF_MULTIPLIER, max_interval)
 
-        if current_job_details and current_job_details.lifecycle_status in failed_statuses:
-            msg = f"Job {self.job_id} failed with lifecycle status: {current_job_details.lifecycle_status}"
+        self._raise_for_final_status(current_job_details)
+
+        logger.info(
+            "Job %s completed successfully after %d polls (%.1fs)", self.job_id, poll_count, time.time() - start_time
+        )
+        return job_details_dict
+
+    def _get_job(self) -> Any:
+        """Fetch the current job details, and task progress if tracked, from Deadline Cloud."""
+        job_details_dict = self.client.get_job(jobId=self.job_id, queueId=self.queue_id, farmId=self.farm_id)
+        self._refresh_task_progress(job_details_dict)
+        return job_details_dict
+
+    def _refresh_task_progress(self, job_details_dict: Any) -> None:
+        """Refresh task-level progress when tracking is enabled. Makes blocking Deadline Cloud calls."""
+        if self.task_progress_tracker is None:
+            return
+        try:
+            self._task_progress = self.task_progress_tracker.refresh(job_details_dict)
+        except Exception as e:
+            # Progress is informational only; never fail the job wait because of it
+            logger.warning("Failed to refresh task progress for job %s: %s", self.job_id, e)
+            if self._task_progress is not None:
+                self._task_progress = replace(self._task_progress, newly_succeeded=[])
+
+    def _report_status(self, job_details_dict: Any, poll_count: int, start_time: float) -> DeadlineCloudJobDetails:
+        """Parse a get_job response, invoke the status callback and log the current state."""
+        current_job_details = DeadlineCloudJobDetails.from_job_details(job_details_dict)
+        current_job_details.task_progress = self._task_progress
+        elapsed_time = time.time() - start_time
+
+        if self.status_callback:
+            self.status_callback(current_job_details, elapsed_time)
+
+        logger.info(
+            "Job %s poll #%d - Lifecycle: %s, Task Status: %s (elapsed: %.1fs)",
+            self.job_id,
+            poll_count,
+            current_job_details.lifecycle_status,
+            current_job_details.task_run_status,
+            elapsed_time,
+        )
+        return current_job_details
+
+    @staticmethod
+    def _is_finished(job_details: DeadlineCloudJobDetails) -> bool:
+        """Return True once the job has failed or reached a completed task run status."""
+        if job_details.lifecycle_status in LifecycleStatus.get_failed_statuses():
+            return True
+        return job_details.task_run_status in TaskRunStatus.get_completed_statuses()
+
+    def _raise_for_final_status(self, job_details: DeadlineCloudJobDetails | None) -> None:
+        """Raise a RuntimeError if the finished job did not succeed."""
+        if job_details and job_details.lifecycle_status in LifecycleStatus.get_failed_statuses():
+            msg = f"Job {self.job_id} failed with lifecycle status: {job_details.lifecycle_status}"
             logger.error(msg)
             raise RuntimeError(msg)
 
-        if current_job_details and current_job_details.task_run_status != TaskRunStatus.SUCCEEDED:
-            msg = f"Job {self.job_id} did not complete successfully. Final task run status: {current_job_details.task_run_status}"
+        if job_details and job_details.task_run_status != TaskRunStatus.SUCCEEDED:
+            msg = (
+                f"Job {self.job_id} did not complete successfully. Final task run status: {job_details.task_run_status}"
+            )
             logger.error(msg)
             raise RuntimeError(msg)
-
-        logger.info("Job %s completed successfully after %d polls (%.1fs)", self.job_id, poll_count, elapsed_time)
-        return job_details_dict
@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import copy
 import logging
-from typing import TYPE_CHECKING, Any
+import re
+from typing import TYPE_CHECKING, Any, Literal
 
 import yaml
 
@@ -12,15 +14,125 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger("job_template_generator")
 
+PackageInstaller = Literal["pip", "uv"]
+
+# Worker-side venv cache used when no cache directory is configured; GTN_VENV_CACHE_DIR overrides it per host
+DEFAULT_VENV_CACHE_DIR = "${GTN_VENV_CACHE_DIR:-$HOME/.cache/griptape_nodes/venvs}"
+# Days a cached venv may go unused before workers remove it; GTN_VENV_CACHE_MAX_AGE_DAYS overrides it per host
+DEFAULT_VENV_CACHE_MAX_AGE_DAYS = "${GTN_VENV_CACHE_MAX_AGE_DAYS:-14}"
+
+# Model weight files read concurrently while warming the worker's page cache
+MODEL_CACHE_WARMUP_MAX_WORKERS = 8
+
+_INPUT_FILE_ARG = "{{Param.InputFile}}"
+_OUTPUT_DIR_REF = "{{Param.OutputDir}}"
+
+# Baseline manifest of the hashes of the static files seeded into the output directory. It is built
+# into the bundle's assets directory when publishing, and copied to the output directory by the worker.
+SEEDED_INPUTS_MANIFEST_FILE_NAME = ".seeded_inputs.json"
+
+# Python code shared by the generated execution scripts that overlays static_files/ onto the output
+# directory. It is pasted into templates that Open Job Description formats, so it must not contain
+# double braces.
+STATIC_FILES_OVERLAY_SCRIPT = """
+_FICLONE = 0x40049409
+# (overlay path, size, mtime) of every overlaid file, and the directories created for them
+_static_files_overlay = []
+_static_files_overlay_dirs = []
+
+
+def _link_static_file(source: Path, destination: Path, *, use_reflink: bool) -> str:
+    # Never a symlink: the workflow may write to any overlaid file, and the engine resolves symlinks,
+    # so a linked project.yml would put the project directory back inside the bundle. A copy-on-write
+    # clone keeps the bundled file untouched without copying any data; otherwise the file is copied.
+    if use_reflink and sys.platform == "linux":
+        import fcntl  # noqa: PLC0415
+
+        try:
+            with source.open("rb") as source_file, destination.open("xb") as destination_file:
+                fcntl.ioctl(destination_file.fileno(), _FICLONE, source_file.fileno())
+            shutil.copystat(source, destination)
+            return "reflink"
+        except OSError:
+            destination.unlink(missing_ok=True)
+    shutil.copy2(source, destination)
+    return "copy"
+
+
+def _overlay_static_files(static_files_dir: Path, target_dir: Path, baseline_path: Path) -> None:
+    use_reflink = True
+    counts = dict.fromkeys(("reflink", "copy"), 0)
+    for dirpath, _, filenames in os.walk(static_files_dir):
+        overlay_dir = target_dir / Path(dirpath).relative_to(static_files_dir)
+        if not overlay_dir.is_dir():
+            overlay_dir.mkdir(parents=True)
+            _static_files_overlay_dirs.append(overlay_dir)
+        for filename in filenames:
+            source = Path(dirpath) / filename
+            destination = overlay_dir / filename
+            if destination.is_file():
+                destination.unlink()
+            method = _link_static_file(source, destination, use_reflink=use_reflink)
+            # Reflinks are supported by the filesystem for every file or for none of them
+            use_reflink = method == "reflink"
+            counts[method] += 1
+            source_stat = source.stat()
+            _static_files_overlay.append((destination, source_stat.st_size, source_stat.st_mtime_ns))
+    # The baseline is built when the bundle is published, so the seeded files are never hashed here
+    if baseline_path.is_file():
+        shutil.copyfile(baseline_path, target_dir / baseline_path.name)
+    logger.info(
+        "Overlaid static files onto output directory %s: %d reflinked, %d copied",
+        target_dir,
+        counts["reflink"],
+        counts["copy"],
+    )
+
+
+def _remove_static_files_overlay() -> None:
+    # Runs at exit, before the output directory is synced: unchanged static files are inputs, not outputs
+    removed = 0
+    for destination, size, mtime_ns in _static_files_overlay:
+        try:
+            if not destination.is_file():
+                continue
+            destination_stat = destination.stat()
+            if (destination_stat.st_size, destination_stat.st_mtime_ns) != (size, mtime_ns):
+                continue
+            destination.unlink()
+            removed += 1
+        except OSError as e:
+            logger.warning("Failed to remove overlaid static file %s: %s", destination, e)
+    for overlay_dir in reversed(_static_files_overlay_dirs):
+        try:
+            overlay_dir.rmdir()
+        except OSError:
+            pass
+    # Cleared so that the static files can be overlaid again, e.g. for the next task of an executor daemon
+    _static_files_overlay.clear()
+    _static_files_overlay_dirs.clear()
+    logger.info("Removed %d unchanged static file(s) from the output directory", removed)
+"""
+
 
 class DeadlineCloudJobTemplateGenerator:
     """Handles generation of Open Job Description templates for Griptape workflows."""
 
     @staticmethod
-    def generate_job_template(
-        job_bundle_dir: Path, workflow_name: str, library_paths: list[str], *, pickle_control_flow_result: bool = False
+    def generate_job_template(  # noqa: PLR0913
+        job_bundle_dir: Path,
+        workflow_name: str,
+        library_paths: list[str],
+        *,
+        pickle_control_flow_result: bool = False,
+        venv_cache_dir: str | None = None,
+        package_installer: PackageInstaller = "pip",
+        models: list[str] | None = None,
     ) -> dict[str, Any]:
-        """Generate Open Job Description template for the workflow."""
+        """Generate Open Job Description template for the workflow.
+
+        When HuggingFace models are given, a job environment warms the worker's page cache with their weights.
+        """
         parameter_definitions: list[dict[str, Any]] = []
 
         parameter_definitions.append(
@@ -90,27 +202,9 @@ class DeadlineCloudJobTemplateGenerator:
             library_paths, pickle_control_flow_result=pickle_control_flow_result
         )
 
-        venv_script = """#!/bin/env bash
-set -e
-echo 'Setting up Python virtual environment...'
-python -m pip install --upgrade pip wheel setuptools
-echo 'Installing dependencies...'
-pip install -r {{Param.LocationToRemap}}/assets/requirements.txt
-mkdir -p {{Param.LocationToRemap}}/output
-
-# Create .venv symlinks in libraries so library code that expects its own
-# venv (e.g. _get_library_env_python) finds a working Python with all deps.
-SESSION_PYTHON=$(which python)
-for lib_dir in {{Param.LocationToRemap}}/assets/libraries/*/; do
-    if [ -f "${lib_dir}griptape-nodes-library.json" ] || [ -f "${lib_dir}griptape-nodes-library-cuda129.json" ]; then
-        mkdir -p "${lib_dir}.venv/bin"
-        ln -sf "$SESSION_PYTHON" "${lib_dir}.venv/bin/python"
-        echo "Created .venv symlink in ${lib_dir}"
-    fi
-done
-
-echo 'Virtual environment setup complete.'
-"""
+        venv_script = DeadlineCloudJobTemplateGenerator.generate_venv_script(
+            venv_cache_dir=venv_cache_dir, package_installer=package_installer
+        )
 
         # Create job template
         job_template: dict[str, Any] = {
@@ -152,6 +246,12 @@ echo 'Virtual environment setup complete.'
             ],
         }
 
+        if models:
+            # Entered first, so that warming overlaps with building the virtual environment
+            job_template["jobEnvironments"].insert(
+                0, DeadlineCloudJobTemplateGenerator.generate_model_cache_warmup_environment(models)
+            )
+
         template_path = job_bundle_dir / "template.yaml"
         with template_path.open("w", encoding="utf-8") as template_file:
             yaml.dump(job_template, template_file, default_flow_style=False, sort_keys=False)
@@ -160,12 +260,315 @@ echo 'Virtual environment setup complete.'
 
         return job_template
 
+    @staticmethod
+    def can_batch_job_template(job_template: dict[str, Any]) -> bool:
+        """Whether a published workflow's job template can be turned into a batched template."""
+        steps = job_template.get("steps", [])
+        if len(steps) != 1 or "parameterSpace" in steps[0]:
+            return False
+        args = steps[0].get("script", {}).get("actions", {}).get("onRun", {}).get("args", [])
+        return _INPUT_FILE_ARG in args
+
+    @staticmethod
+    def generate_batched_job_template(job_template: dict[str, Any], task_count: int) -> dict[str, Any]:
+        """Turn a published workflow's job template into one that runs several invocations, one per task.
+
+        The InputFile parameter is replaced by an InputDir parameter holding input_<TaskIndex>.json
+        files, and each task writes its outputs to its own <OutputDir>/<TaskIndex> subdirectory.
+
+        Args:
+            job_template: A job template from `generate_job_template`.
+            task_count: The number of invocations in the batch.
+
+        Raises:
+            ValueError: If the job template cannot be batched.
+        """
+        if not DeadlineCloudJobTemplateGenerator.can_batch_job_template(job_template):
+            msg = "The job template does not have a single step that reads {{Param.InputFile}}."
+            raise ValueError(msg)
+
+        batched_template = copy.deepcopy(job_template)
+        batched_template["parameterDefinitions"] = [
+            definition for definition in batched_template["parameterDefinitions"] if definition["name"] != "InputFile"
+        ]
+        batched_template["parameterDefinitions"].append(
+            {
+                "name": "InputDir",
+                "type": "PATH",
+                "objectType": "DIRECTORY",
+                "dataFlow": "IN",
+                "description": "Directory containing one input_<TaskIndex>.json file per task",
+            }
+        )
+
+        step = batched_template["steps"][0]
+        step["parameterSpace"] = {
+            "taskParameterDefinitions": [
+                {
+                    "name": "TaskIndex",
+                    "type": "INT",
+                    "range": f"0-{task_count - 1}",
+                }
+            ]
+        }
+        args = step["script"]["actions"]["onRun"]["args"]
+        args[args.index(_INPUT_FILE_ARG)] = "{{Param.InputDir}}/input_{{Task.Param.TaskIndex}}.json"
+        for embedded_file in step["script"].get("embeddedFiles", []):
+            embedded_file["data"] = embedded_file["data"].replace(
+                _OUTPUT_DIR_REF, f"{_OUTPUT_DIR_REF}/{{{{Task.Param.TaskIndex}}}}"
+            )
+
+        return batched_template
+
+    @staticmethod
+    def generate_model_cache_warmup_environment(models: list[str]) -> dict[str, Any]:
+        """Generate the job environment that reads the weights of the given models into the worker's page cache.
+
+        Entering the environment starts a background process and returns at once, so the weights
+        are read while the rest of the session is set up. Weight files are found in the HuggingFace
+        hub cache that ModelsLocationToRemap points to, or in the session's fallback cache, and are
+        read sequentially and concurrently, largest first. Files are skipped once they would take
+        up more than half of the host's available memory, so warming never evicts itself.
+
+        Args:
+            models: HuggingFace repository names of the models the workflow uses.
+        """
+        warmup_script = f"""import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+MODELS = {sorted(set(models))!r}
+CACHE_DIRS = [Path(r"{{{{Param.ModelsLocationToRemap}}}}"), Path(r"{{{{Param.LocationToRemap}}}}") / "hf_cache"]
+WEIGHT_FILE_SUFFIXES = (".safetensors", ".bin", ".pt", ".pth", ".ckpt", ".gguf", ".onnx")
+READ_CHUNK_SIZE = 16 * 1024 * 1024
+
+
+def _find_weight_files() -> list:
+    # Snapshot files are symlinks into the cache's blobs, so the same weights are only read once
+    sizes = dict()
+    for cache_dir in CACHE_DIRS:
+        for model in MODELS:
+            snapshots_dir = cache_dir / ("models--" + model.replace("/", "--")) / "snapshots"
+            for dirpath, _, filenames in os.walk(snapshots_dir):
+                for filename in filenames:
+                    if not filename.endswith(WEIGHT_FILE_SUFFIXES):
+                        continue
+                    try:
+                        path = (Path(dirpath) / filename).resolve(strict=True)
+                        sizes[path] = path.stat().st_size
+                    except OSError:
+                        continue
+    return sorted(sizes.items(), key=lambda item: item[1], reverse=True)
+
+
+def _get_available_memory():
+    try:
+        with open("/proc/meminfo", encoding="utf-8") as meminfo:
+            for line in meminfo:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) * 1024
+    except (OSError, ValueError):
+        pass
+    return None
+
+
+def _read_ahead(path: Path) -> int:
+    buffer = bytearray(READ_CHUNK_SIZE)
+    total = 0
+    try:
+        with open(path, "rb", buffering=0) as weight_file:
+            if hasattr(os, "posix_fadvise"):
+                os.posix_fadvise(weight_file.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            while read := weight_file.readinto(buffer):
+                total += read
+    except OSError as e:
+        print("Failed to warm %s: %s" % (path, e), flush=True)
+    return total
+
+
+def main() -> None:
+    start = time.monotonic()
+    available_memory = _get_available_memory()
+    budget = available_memory // 2 if available_memory is not None else None
+    selected = []
+    selected_size = 0
+    for path, size in _find_weight_files():
+        if budget is not None and selected_size + size > budget:
+            print("Not warming %s (%d bytes), which does not fit in memory" % (path, size), flush=True)
+            continue
+        selected.append(path)
+        selected_size += size
+
+    with ThreadPoolExecutor(max_workers={MODEL_CACHE_WARMUP_MAX_WORKERS}) as executor:
+        warmed = sum(executor.map(_read_ahead, selected))
+    print(
+        "Warmed %d model weight file(s), %.2f GiB, in %.1fs"
+        % (len(selected), warmed / 1024**3, time.monotonic() - start),
+        flush=True,
+    )
+
+
+if __name__ == "__main__":
+    main()
+"""
+
+        enter_script = f"""#!/bin/env bash
+PYTHON=$(command -v python3 || command -v python)
+LOG_FILE="{{{{Session.WorkingDirectory}}}}/model_cache_warmup.log"
+
+# Detached from the action, which returns at once instead of waiting for the weights to be read
+SETSID=""
+if command -v setsid >/dev/null 2>&1; then
+    SETSID=setsid
+fi
+$SETSID nohup "$PYTHON" "{{{{Env.File.Warm}}}}" </dev/null >"$LOG_FILE" 2>&1 &
+echo $! > "{{{{Session.WorkingDirectory}}}}/model_cache_warmup.pid"
+echo "Warming the page cache with the weights of {len(set(models))} model(s) in the background"
+"""
+
+        exit_script = """#!/bin/env bash
+PID_FILE="{{Session.WorkingDirectory}}/model_cache_warmup.pid"
+LOG_FILE="{{Session.WorkingDirectory}}/model_cache_warmup.log"
+
+if [ -f "$PID_FILE" ]; then
+    kill "$(cat "$PID_FILE")" 2>/dev/null || true
+    rm -f "$PID_FILE"
+fi
+if [ -f "$LOG_FILE" ]; then
+    cat "$LOG_FILE"
+fi
+"""
+
+        return {
+            "name": "ModelCacheWarmup",
+            "description": "Reads the workflow's model weights into the page cache in the background",
+            "script": {
+                "actions": {
+                    "onEnter": {"command": "bash", "args": ["{{Env.File.Enter}}"]},
+                    "onExit": {"command": "bash", "args": ["{{Env.File.Exit}}"]},
+                },
+                "embeddedFiles": [
+                    {"name": "Enter", "type": "TEXT", "runnable": True, "data": enter_script},
+                    {"name": "Exit", "type": "TEXT", "runnable": True, "data": exit_script},
+                    {"name": "Warm", "type": "TEXT", "data": warmup_script},
+                ],
+            },
+        }
+
+    @staticmethod
+    def generate_venv_script(*, venv_cache_dir: str | None = None, package_installer: PackageInstaller = "pip") -> str:
+        """Generate the job environment script that activates a cached virtual environment on the worker.
+
+        Virtual environments are cached on the worker host under a key derived from the bundle's
+        requirements.txt, the installer and the session's base Python, so sessions with the same
+        requirements skip dependency installation. A venv is built in place under a lock and only
+        marked complete once its installation succeeded, so an interrupted build is never reused.
+        Venvs see the base Python's packages, e.g. those a queue provides through conda, and are
+        removed once no session has used them for GTN_VENV_CACHE_MAX_AGE_DAYS days.
+
+        Args:
+            venv_cache_dir: Directory on the worker host to cache virtual environments in, in which
+                environment variables and a leading ~ are expanded on the worker.
+                Defaults to GTN_VENV_CACHE_DIR, or a directory under the user's home.
+            package_installer: The installer used to build the virtual environment, "pip" or "uv".
+        """
+        if package_installer not in ("pip", "uv"):
+            msg = f"Unsupported package installer '{package_installer}'. Expected 'pip' or 'uv'."
+            raise ValueError(msg)
+
+        cache_dir = venv_cache_dir or DEFAULT_VENV_CACHE_DIR
+        if cache_dir == "~" or cache_dir.startswith("~/"):
+            cache_dir = f"$HOME{cache_dir[1:]}"
+        # Double quoted so that environment variables are expanded on the worker
+        cache_dir = '"' + re.sub(r'(["\\`])', r"\\\1", cache_dir) + '"'
+
+        return f"""#!/bin/env bash
+set -e
+REQUIREMENTS_FILE="{{{{Param.LocationToRemap}}}}/assets/requirements.txt"
+VENV_CACHE_DIR={cache_dir}
+VENV_CACHE_MAX_AGE_DAYS="{DEFAULT_VENV_CACHE_MAX_AGE_DAYS}"
+PACKAGE_INSTALLER={package_installer}
+
+# Virtual environments are keyed by everything that determines their contents
+VENV_KEY=$({{ cat "$REQUIREMENTS_FILE"; echo "$PACKAGE_INSTALLER"; python -c 'import sys; print(sys.base_prefix, sys.version)'; }} | sha256sum | cut -c1-32)
+VENV_DIR="$VENV_CACHE_DIR/$VENV_KEY"
+mkdir -p "$VENV_CACHE_DIR"
+
+# Serialize builds of the same virtual environment across sessions on this host
+exec 9>"$VENV_DIR.lock"
+if command -v flock >/dev/null 2>&1; then
+    flock 9
+fi
+
+if [ -f "$VENV_DIR/.complete" ] && "$VENV_DIR/bin/python" -c 'pass' >/dev/null 2>&1; then
+    echo "Reusing cached Python virtual environment $VENV_DIR"
+    # The marker's modification time records when the venv was last used
+    touch "$VENV_DIR/.complete"
+else
+    echo "Setting up Python virtual environment $VENV_DIR..."
+    rm -rf "$VENV_DIR"
+    # System site packages keep the session's own packages, e.g. from conda, importable
+    python -m venv --system-site-packages "$VENV_DIR"
+    echo 'Installing dependencies...'
+    if [ "$PACKAGE_INSTALLER" = "uv" ]; then
+        "$VENV_DIR/bin/python" -m pip install --upgrade uv
+        "$VENV_DIR/bin/python" -m uv pip install --python "$VENV_DIR/bin/python" -r "$REQUIREMENTS_FILE"
+    else
+        "$VENV_DIR/bin/python" -m pip install --upgrade pip wheel setuptools
+        "$VENV_DIR/bin/python" -m pip install -r "$REQUIREMENTS_FILE"
+    fi
+    # Marked complete last so that an interrupted build is rebuilt by the next session
+    touch "$VENV_DIR/.complete"
+fi
+exec 9>&-
+
+# Remove the cached venvs that no session has used recently, each under its own build lock
+if command -v flock >/dev/null 2>&1; then
+    for STALE_VENV_DIR in "$VENV_CACHE_DIR"/*/; do
+        STALE_VENV_DIR="${{STALE_VENV_DIR%/}}"
+        if [ ! -d "$STALE_VENV_DIR" ] || [ "$STALE_VENV_DIR" = "$VENV_DIR" ]; then
+            continue
+        fi
+        exec 8>"$STALE_VENV_DIR.lock"
+        if flock -n 8; then
+            LAST_USED="$STALE_VENV_DIR/.complete"
+            [ -f "$LAST_USED" ] || LAST_USED="$STALE_VENV_DIR"
+            if [ -n "$(find "$LAST_USED" -maxdepth 0 -mtime +"$VENV_CACHE_MAX_AGE_DAYS")" ]; then
+                echo "Removing unused cached Python virtual environment $STALE_VENV_DIR"
+                rm -rf "$STALE_VENV_DIR"
+            fi
+        fi
+        exec 8>&-
+    done
+fi
+
+# Activate the virtual environment for the rest of the session
+echo "openjd_env: VIRTUAL_ENV=$VENV_DIR"
+echo "openjd_env: PATH=$VENV_DIR/bin:$PATH"
+mkdir -p {{{{Param.LocationToRemap}}}}/output
+
+# Create .venv symlinks in libraries so library code that expects its own
+# venv (e.g. _get_library_env_python) finds a working Python with all deps.
+SESSION_PYTHON="$VENV_DIR/bin/python"
+for lib_dir in {{{{Param.LocationToRemap}}}}/assets/libraries/*/; do
+    if [ -f "${{lib_dir}}griptape-nodes-library.json" ] || [ -f "${{lib_dir}}griptape-nodes-library-cuda129.json" ]; then
+        mkdir -p "${{lib_dir}}.venv/bin"
+        ln -sf "$SESSION_PYTHON" "${{lib_dir}}.venv/bin/python"
+        echo "Created .venv symlink in ${{lib_dir}}"
+    fi
+done
+
+echo 'Virtual environment setup complete.'
+"""
+
     @staticmethod
     def _generate_python_execution_script(library_paths: list[str], *, pickle_control_flow_result: bool = False) -> str:
         """Generate the Python script that will execute the Griptape workflow."""
         library_paths_str = ", ".join(repr(path) for path in library_paths)
 
         return f"""import argparse
+import atexit
 import json
 import logging
 import os
@@ -191,12 +594,18 @@ output_dir = Path(location_to_remap) / "output" / output_dir_subdirectory
 output_dir.mkdir(parents=True, exist_ok=True)
 sys.path.insert(0, str(job_assets_dir))
 
-# Copy the contents of static_files/ into the tracked output directory so that
-# project-relative directory macros (e.g. {{outputs}}) resolve inside it.
+# Overlay the contents of static_files/ onto the tracked output directory so that
+# project-relative directory macros (e.g. {{outputs}}) resolve inside it. Files are
+# reflinked where the filesystem supports it and copied otherwise, and the overlay is
+# removed again at exit so that only the static files the workflow changed are synced
+# as outputs.
+# The bundle's baseline manifest of their hashes is copied alongside them, letting clients
+# skip any that still come back unchanged.
+{STATIC_FILES_OVERLAY_SCRIPT}
 _bundled_static_files = job_assets_dir / "static_files"
 if _bundled_static_files.exists():
-    shutil.copytree(str(_bundled_static_files), str(output_dir), dirs_exist_ok=True)
-    logger.info("Copied static files contents into output directory: %s", output_dir)
+    atexit.register(_remove_static_files_overlay)
+    _overlay_static_files(_bundled_static_files, output_dir, job_assets_dir / "{SEEDED_INPUTS_MANIFEST_FILE_NAME}")
 
 # Load environment variables
 if (job_assets_dir / ".env").exists():
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from deadline.client.config.config_file import get_cache_directory
+from deadline.job_attachments.models import ManifestProperties
+from publish.deadline_cloud_bundle_cache import verify_input_manifests_exist
+
+if TYPE_CHECKING:
+    from boto3 import Session
+    from deadline.job_attachments.models import JobAttachmentS3Settings
+
+
+logger = logging.getLogger("deadline_cloud_model_manifest_cache")
+
+
+class DeadlineCloudModelManifestCache:
+    """Persistent cache of the job attachment manifests uploaded for HuggingFace model revisions.
+
+    The files of a HuggingFace snapshot revision never change once downloaded, so the manifest
+    uploaded for it can be reused by every later job that targets the same queue bucket and
+    storage profile, without hashing or uploading the model files again. A revision can still
+    gain files, or be only partially downloaded, so the listing of its files is part of the key.
+    """
+
+    def __init__(self, cache_dir: Path | None = None) -> None:
+        self.cache_dir = cache_dir or Path(get_cache_directory()) / "griptape_nodes" / "model_manifests"
+
+    @staticmethod
+    def get_key(  # noqa: PLR0913
+        repo_id: str,
+        commit_hash: str,
+        file_paths: list[str],
+        *,
+        models_root: str,
+        storage_profile_id: str | None,
+        job_attachment_settings: JobAttachmentS3Settings,
+    ) -> str:
+        """Build the key a model revision's manifest is cached under.
+
+        Args:
+            repo_id: The HuggingFace repository ID.
+            commit_hash: The commit hash of the cached snapshot revision.
+            file_paths: The files of the cached snapshot revision that are uploaded.
+            models_root: The local HuggingFace cache directory the manifest is rooted at.
+            storage_profile_id: The storage profile used for the upload, if any.
+            job_attachment_settings: The queue's job attachment settings.
+
+        Raises:
+            OSError: If a file of the snapshot cannot be read.
+        """
+        target = "\0".join(
+            [
+                repo_id,
+                commit_hash,
+                _get_files_digest(file_paths, models_root),
+                models_root,
+                storage_profile_id or "",
+                job_attachment_settings.to_root_path(),
+            ]
+        )
+        return hashlib.sha256(target.encode()).hexdigest()
+
+    def load_manifest(
+        self, key: str, job_attachment_settings: JobAttachmentS3Settings, queue_session: Session
+    ) -> ManifestProperties | None:
+        """Return the cached manifest for a model revision, if it is still present in S3."""
+        manifest_path = self.cache_dir / f"{key}.json"
+        if not manifest_path.is_file():
+            return None
+
+        try:
+            manifest = ManifestProperties.from_dict(json.loads(manifest_path.read_text(encoding="utf-8")))
+            verify_input_manifests_exist([manifest], job_attachment_settings, queue_session)
+        except Exception as e:
+            logger.info("Cached model manifest %s is no longer usable: %s", key, e)
+            return None
+
+        return manifest
+
+    def save_manifest(self, key: str, manifest: ManifestProperties) -> None:
+        """Record the manifest uploaded for a model revision."""
+        manifest_path = self.cache_dir / f"{key}.json"
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            temp_path = manifest_path.with_suffix(f".{os.getpid()}.tmp")
+            temp_path.write_text(json.dumps(manifest.to_dict(), indent=2), encoding="utf-8")
+            temp_path.replace(manifest_path)
+        except OSError as e:
+            logger.warning("Failed to cache model manifest %s: %s", key, e)
+
+
+def _get_files_digest(file_paths: list[str], root: str) -> str:
+    """Digest the sorted (relative path, size, mtime) listing of files, following snapshot symlinks to their blobs."""
+    listing = []
+    for file_path in file_paths:
+        file_stat = Path(file_path).stat()
+        listing.append((os.path.relpath(file_path, root), file_stat.st_size, file_stat.st_mtime_ns))
+    return hashlib.sha256(json.dumps(sorted(listing)).encode()).hexdigest()
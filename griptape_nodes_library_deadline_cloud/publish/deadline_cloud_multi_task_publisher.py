@@ -6,17 +6,20 @@ with multiple tasks, where each task processes one item from an input list.
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
+import re
+import sys
 import tempfile
+from array import array
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 from botocore.exceptions import BotoCoreError, ClientError
-from deadline.client.api import get_queue_user_boto3_session
-from deadline.job_attachments.download import OutputDownloader
-from deadline.job_attachments.models import Attachments, JobAttachmentS3Settings
+from deadline.job_attachments._aws.aws_clients import get_s3_client
 from griptape_nodes.exe_types.node_types import BaseNode
 from griptape_nodes.node_library.library_registry import LibraryNameAndVersion, LibraryRegistry
 from griptape_nodes.retained_mode.events.os_events import (
@@ -29,17 +32,39 @@ from griptape_nodes.retained_mode.events.workflow_events import (
 )
 from griptape_nodes.retained_mode.griptape_nodes import GriptapeNodes
 from publish import DEADLINE_CLOUD_LIBRARY_CONFIG_KEY
-from publish.deadline_cloud_job_poller import DeadlineCloudJobPoller
-from publish.deadline_cloud_multi_task_template_generator import DeadlineCloudMultiTaskJobTemplateGenerator
-from publish.deadline_cloud_publisher import DeadlineCloudPublisher
-from publish.utils import collect_metadata_sidecars, write_sidecar_output_files
+from publish.deadline_cloud_bundle_stager import DeadlineCloudBundleStager
+from publish.deadline_cloud_job_poll_coordinator import DeadlineCloudJobPollCoordinator
+from publish.deadline_cloud_job_poller import (
+    DeadlineCloudJobDetails,
+    DeadlineCloudJobPoller,
+    DeadlineCloudTaskDetails,
+    TaskRunStatus,
+)
+from publish.deadline_cloud_multi_task_template_generator import (
+    PACKED_INPUTS_FILE_NAME,
+    PACKED_INPUTS_INDEX_FILE_NAME,
+    DeadlineCloudMultiTaskJobTemplateGenerator,
+)
+from publish.deadline_cloud_output_downloader import DeadlineCloudSelectiveOutputDownloader, OutputReferenceContext
+from publish.deadline_cloud_publisher import LIBRARY_IGNORE_PATTERNS, DeadlineCloudPublisher
+from publish.utils import collect_metadata_sidecars, finalize_downloaded_file, write_sidecar_output_files
 
 if TYPE_CHECKING:
-    from deadline.job_attachments.models import StorageProfile
+    from collections.abc import AsyncIterator, Callable
+
+    import boto3
+    from deadline.job_attachments.models import Attachments, JobAttachmentS3Settings
+    from griptape_nodes.node_library.workflow_registry import LibraryNameAndNodeType
     from griptape_nodes.retained_mode.events.flow_events import PackageNodesAsSerializedFlowResultSuccess
 
 logger = logging.getLogger("deadline_cloud_multi_task_publisher")
 
+# Each task writes its result to output_N.json, where N is the item index
+TASK_OUTPUT_FILE_PATTERN = re.compile(r"output_(\d+)\.json$")
+
+# Tasks whose outputs are downloaded and parsed concurrently when collecting results
+OUTPUT_DOWNLOAD_MAX_WORKERS = 8
+
 
 @dataclass
 class MultiTaskPublisherConfig:
@@ -63,6 +88,9 @@ class MultiTaskPublisherConfig:
     host_requirements: dict[str, Any] | None = None
     result_parameter_name: str | None = None
     group_node_names: list[str] | None = None
+    track_task_progress: bool | None = None
+    chunk_size: int = 1
+    pack_task_inputs: bool = True
 
 
 class DeadlineCloudMultiTaskPublisher(DeadlineCloudPublisher):
@@ -102,41 +130,12 @@ class DeadlineCloudMultiTaskPublisher(DeadlineCloudPublisher):
         Returns:
             List of results, one per task, in order of task index
         """
-        workflow_file_path: Path | None = None
         try:
-            # 1. Save the packaged workflow as a file
-            logger.info("Saving packaged workflow for multi-task execution...")
-            workflow_file_result = await self._save_workflow_file()
-            workflow_file_path = Path(workflow_file_result.file_path)
-            logger.info("Workflow saved to: %s", workflow_file_path)
-
-            # 2. Package the workflow as a job bundle
-            logger.info("Packaging workflow for multi-task execution...")
-            package_path = self._package_multi_task_workflow(workflow_file_path)
-            self._job_bundle_path = Path(package_path)
-            logger.info("Workflow packaged to path: %s", package_path)
-
-            # 3. Generate input files for each task
-            logger.info("Generating input files for %d tasks...", self.task_count)
-            self._generate_task_input_files(package_path)
-
-            # 4. Process job attachments
-            logger.info("Processing job attachments...")
-            self._job_attachment_settings, attachments = self._process_multi_task_job_attachments(package_path)
-            logger.info("Job attachments processed successfully")
-
-            # 5. Submit the job
-            logger.info("Submitting multi-task job to Deadline Cloud...")
-            job_id = self._submit_multi_task_job(
-                package_path=package_path,
-                attachments=attachments,
-            )
-            self._job_id = job_id
-            logger.info("Job submitted successfully: %s", job_id)
+            job_id = await self._publish_job()
 
             # 6. Monitor job until completion using the poller
             logger.info("Monitoring job execution...")
-            self._wait_for_job_completion(job_id)
+            await self._wait_for_job_completion(job_id)
             logger.info("Job completed: %s", job_id)
 
             # 7. Collect results
@@ -154,10 +153,126 @@ class DeadlineCloudMultiTaskPublisher(DeadlineCloudPublisher):
             details = f"Unexpected error during multi-task execution: {e}"
             logger.exception(details)
             raise RuntimeError(details) from e
+
+    async def stream_results(self) -> AsyncIterator[tuple[int, Any]]:  # noqa: C901
+        """Publish the workflow and yield each task's result as soon as that task succeeds.
+
+        Task progress is tracked unless the publisher config turns it off, so that succeeded tasks
+        are detected while the job is polled and only their outputs are downloaded. Once the job
+        finishes, any succeeded task not yet collected is collected before the job's final status
+        is checked, so with tracking turned off every result arrives after the job finishes.
+
+        Yields:
+            Tuples of (task index, result), in completion order rather than task index order
+        """
+        try:
+            job_id = await self._publish_job()
+
+            loop = asyncio.get_running_loop()
+            succeeded_tasks: asyncio.Queue[DeadlineCloudTaskDetails | None] = asyncio.Queue()
+
+            def status_callback(job_details: DeadlineCloudJobDetails, elapsed_time: float) -> None:
+                self._job_status_callback(job_details, elapsed_time)
+                if job_details.task_progress is not None:
+                    for task in job_details.task_progress.newly_succeeded:
+                        loop.call_soon_threadsafe(succeeded_tasks.put_nowait, task)
+
+            logger.info("Monitoring job execution and streaming task results...")
+            track_task_progress = self._multi_task_config.track_task_progress
+            wait_future = asyncio.ensure_future(
+                self._wait_for_job_completion(
+                    job_id,
+                    status_callback=status_callback,
+                    track_task_progress=track_task_progress is not False,
+                )
+            )
+            wait_future.add_done_callback(lambda _: succeeded_tasks.put_nowait(None))
+
+            try:
+                queue_session = await loop.run_in_executor(
+                    None, self._get_queue_session, self._multi_task_config.farm_id, self._multi_task_config.queue_id
+                )
+                reference_context = self._get_output_reference_context()
+                collected_task_ids: set[str] = set()
+                while (task := await succeeded_tasks.get()) is not None:
+                    if task.task_id in collected_task_ids:
+                        continue
+                    collected_task_ids.add(task.task_id)
+                    task_results = await self._acollect_task_results(job_id, task, queue_session, reference_context)
+                    for task_index, result in task_results.items():
+                        yield task_index, result
+
+                # Collect any succeeded tasks that were missed while polling, even if the job failed
+                job_error = wait_future.exception()
+                missed_tasks = [
+                    task
+                    for task in await loop.run_in_executor(None, self._list_succeeded_tasks, job_id)
+                    if task.task_id not in collected_task_ids
+                ]
+                for task in missed_tasks:
+                    task_results = await self._acollect_task_results(job_id, task, queue_session, reference_context)
+                    for task_index, result in task_results.items():
+                        yield task_index, result
+
+                if job_error is not None:
+                    raise job_error
+            finally:
+                # Stop monitoring if the consumer stopped iterating early
+                wait_future.cancel()
+
+            logger.info("Job completed: %s", job_id)
+
+        except (ClientError, BotoCoreError) as e:
+            details = f"AWS API error during multi-task execution: {e}"
+            logger.error(details)
+            raise RuntimeError(details) from e
+        except Exception as e:
+            details = f"Unexpected error during multi-task execution: {e}"
+            logger.exception(details)
+            raise RuntimeError(details) from e
+
+    async def _publish_job(self) -> str:
+        """Package, upload and submit the multi-task job.
+
+        Returns:
+            The ID of the submitted job
+        """
+        workflow_file_path: Path | None = None
+        try:
+            # 1. Save the packaged workflow as a file
+            logger.info("Saving packaged workflow for multi-task execution...")
+            workflow_file_result = await self._save_workflow_file()
+            workflow_file_path = Path(workflow_file_result.file_path)
+            logger.info("Workflow saved to: %s", workflow_file_path)
+
+            # 2. Package the workflow as a job bundle
+            logger.info("Packaging workflow for multi-task execution...")
+            package_path = self._package_multi_task_workflow(workflow_file_path)
+            self._job_bundle_path = Path(package_path)
+            logger.info("Workflow packaged to path: %s", package_path)
         finally:
             if workflow_file_path is not None:
                 workflow_file_path.unlink(missing_ok=True)
 
+        # 3. Generate input files for each task
+        logger.info("Generating input files for %d tasks...", self.task_count)
+        self._generate_task_input_files(package_path)
+
+        # 4. Process job attachments
+        logger.info("Processing job attachments...")
+        self._job_attachment_settings, attachments = self._process_multi_task_job_attachments(package_path)
+        logger.info("Job attachments processed successfully")
+
+        # 5. Submit the job
+        logger.info("Submitting multi-task job to Deadline Cloud...")
+        job_id = self._submit_multi_task_job(
+            package_path=package_path,
+            attachments=attachments,
+        )
+        self._job_id = job_id
+        logger.info("Job submitted successfully: %s", job_id)
+        return job_id
+
     async def _save_workflow_file(self) -> SaveWorkflowFileFromSerializedFlowResultSuccess:
         """Save the packaged workflow as a runnable workflow file.
 
@@ -254,65 +369,73 @@ class DeadlineCloudMultiTaskPublisher(DeadlineCloudPublisher):
                 logger.error(details)
                 raise TypeError(details)  # noqa: TRY301
 
-            # 3. Copy libraries - use the same method as parent class
-            node_libraries = self._get_libraries_from_serialized_flow()
-            runtime_env_path = Path("{{Param.LocationToRemap}}/assets/libraries")
-
-            # Create a mock workflow object to pass to the parent's method
-            # We need to pass the library references we extracted
-            library_paths = self._copy_libraries_to_path_for_multi_task(
-                node_libraries=node_libraries,
-                destination_path=assets_dir / "libraries",
-                runtime_env_path=runtime_env_path,
-            )
+            with DeadlineCloudBundleStager() as stager:
+                # 3. Stage libraries, concurrently with writing the rest of the bundle
+                node_libraries = self._get_libraries_from_serialized_flow()
+                runtime_env_path = Path("{{Param.LocationToRemap}}/assets/libraries")
+
+                # Create a mock workflow object to pass to the parent's method
+                # We need to pass the library references we extracted
+                library_paths = self._copy_libraries_to_path_for_multi_task(
+                    node_libraries=node_libraries,
+                    destination_path=assets_dir / "libraries",
+                    runtime_env_path=runtime_env_path,
+                    node_types_used=self._multi_task_config.package_result.serialized_flow_commands.node_types_used,
+                    stager=stager,
+                )
 
-            # 4. Create configuration
-            config = config_manager.user_config.copy()
-            config["workspace_directory"] = "."
-            config["app_events"] = {
-                "on_app_initialization_complete": {
-                    "workflows_to_register": [],
-                    "libraries_to_register": library_paths,
+                # 4. Create configuration
+                config = config_manager.user_config.copy()
+                config["workspace_directory"] = "."
+                config["app_events"] = {
+                    "on_app_initialization_complete": {
+                        "workflows_to_register": [],
+                        "libraries_to_register": library_paths,
+                    }
                 }
-            }
 
-            with (assets_dir / "griptape_nodes_config.json").open("w", encoding="utf-8") as config_file:
-                json.dump(config, config_file, indent=2)
+                with (assets_dir / "griptape_nodes_config.json").open("w", encoding="utf-8") as config_file:
+                    json.dump(config, config_file, indent=2)
 
-            # 5. Create environment file - reuse parent's method
-            env_file_mapping = self._get_merged_env_file_mapping(secrets_manager.workspace_env_path)
-            self._write_env_file(assets_dir / ".env", env_file_mapping)
+                # 5. Create environment file - reuse parent's method
+                env_file_mapping = self._get_merged_env_file_mapping(secrets_manager.workspace_env_path)
+                self._write_env_file(assets_dir / ".env", env_file_mapping)
 
-            # 6. Create requirements.txt
-            engine_version = self._get_engine_version_string()
-            source, commit_id = self._get_install_source()
-            if source == "git" and commit_id is not None:
-                engine_version = commit_id
+                # 6. Create requirements.txt
+                engine_version = self._get_engine_version_string()
+                source, commit_id = self._get_install_source()
+                if source == "git" and commit_id is not None:
+                    engine_version = commit_id
 
-            with (assets_dir / "requirements.txt").open("w", encoding="utf-8") as req_file:
-                req_file.write(
-                    f"griptape-nodes-engine @ git+https://github.com/griptape-ai/griptape-nodes-engine.git@{engine_version}\n"
-                )
-                for library_ref in node_libraries:
-                    lib = LibraryRegistry.get_library(library_ref.library_name)
-                    library_data = lib.get_library_data()
-                    deps = library_data.metadata.dependencies
-                    if deps and deps.pip_dependencies:
-                        if deps.pip_install_flags:
-                            req_file.write(f"{' '.join(deps.pip_install_flags)}\n")
-                        for dep in deps.pip_dependencies:
-                            if dep.startswith("-e"):
-                                continue
-                            req_file.write(f"{dep}\n")
-                    else:
-                        # Fallback: check for a sibling library JSON with deps
-                        # (handles no-deps variants used for local dev)
-                        self._write_deps_from_sibling_json(library_ref.library_name, req_file)
-
-            # 7. Gather and copy static file dependencies from FileSelector nodes
-            file_selector_nodes = self._gather_file_selector_nodes()
-            if file_selector_nodes:
-                self._resolve_and_copy_static_files(file_selector_nodes, assets_dir)
+                with (assets_dir / "requirements.txt").open("w", encoding="utf-8") as req_file:
+                    req_file.write(
+                        f"griptape-nodes-engine @ git+https://github.com/griptape-ai/griptape-nodes-engine.git@{engine_version}\n"
+                    )
+                    for library_ref in node_libraries:
+                        lib = LibraryRegistry.get_library(library_ref.library_name)
+                        library_data = lib.get_library_data()
+                        deps = library_data.metadata.dependencies
+                        if deps and deps.pip_dependencies:
+                            if deps.pip_install_flags:
+                                req_file.write(f"{' '.join(deps.pip_install_flags)}\n")
+                            for dep in deps.pip_dependencies:
+                                if dep.startswith("-e"):
+                                    continue
+                                req_file.write(f"{dep}\n")
+                        else:
+                            # Fallback: check for a sibling library JSON with deps
+                            # (handles no-deps variants used for local dev)
+                            self._write_deps_from_sibling_json(library_ref.library_name, req_file)
+
+                # 7. Gather and copy static file dependencies from FileSelector nodes
+                file_selector_nodes = self._gather_file_selector_nodes()
+                if file_selector_nodes:
+                    self._resolve_and_copy_static_files(file_selector_nodes, assets_dir, stager)
+
+                stager.wait()
+
+            # Bytecode is compiled once the library sources are all staged
+            self._compile_library_bytecode(assets_dir / "libraries")
 
             # 8. Write Deadline-specific project template (always, even without FileSelector nodes)
             self._write_deadline_project_template(assets_dir)
@@ -323,8 +446,11 @@ class DeadlineCloudMultiTaskPublisher(DeadlineCloudPublisher):
                 self._multi_task_config.workflow_name,
                 library_paths,
                 task_count=self.task_count,
+                chunk_size=self._multi_task_config.chunk_size,
                 pickle_control_flow_result=self._multi_task_config.pickle_control_flow_result,
                 host_requirements=self._multi_task_config.host_requirements,
+                models=self._get_models_to_warm(),
+                **self._get_worker_venv_options(),
             )
 
             logger.info("Multi-task job bundle created at: %s", job_bundle_dir)
@@ -340,25 +466,27 @@ class DeadlineCloudMultiTaskPublisher(DeadlineCloudPublisher):
         node_libraries: list[LibraryNameAndVersion],
         destination_path: Path,
         runtime_env_path: Path,
+        node_types_used: set[LibraryNameAndNodeType],
+        stager: DeadlineCloudBundleStager,
     ) -> list[str]:
-        """Copy libraries to the destination path for the workflow.
+        """Stage libraries to the destination path for the workflow.
 
         This is similar to the parent's _copy_libraries_to_path_for_workflow but
-        doesn't require a Workflow object.
+        doesn't require a Workflow object. The library files may still be staging
+        until the stager is waited on.
 
         Args:
-            node_libraries: List of library references to copy
-            destination_path: Where to copy the libraries
+            node_libraries: List of library references to stage
+            destination_path: Where to stage the libraries
             runtime_env_path: Runtime path for library references
+            node_types_used: Node types used by the flow, which the libraries are trimmed to
+            stager: Stager to stage the library files with
 
         Returns:
             List of library paths for the runtime environment
         """
-        import os
-
-        from griptape_nodes.retained_mode.events.os_events import CopyTreeRequest, CopyTreeResultSuccess
-
         library_paths: list[str] = []
+        node_types_by_library = self._get_node_types_by_library(node_types_used)
 
         for library_ref in node_libraries:
             library = GriptapeNodes.LibraryManager().get_library_info_by_library_name(library_ref.library_name)
@@ -373,30 +501,15 @@ class DeadlineCloudMultiTaskPublisher(DeadlineCloudPublisher):
             library_data = LibraryRegistry.get_library(library_ref.library_name).get_library_data()
 
             if library.library_path.endswith(".json"):
-                library_path = Path(library.library_path)
-                absolute_library_path = library_path.resolve()
-                abs_paths = [absolute_library_path]
-                for node in library_data.nodes:
-                    p = (library_path.parent / Path(node.file_path)).resolve()
-                    abs_paths.append(p)
-                common_root = Path(os.path.commonpath([str(p) for p in abs_paths]))
+                absolute_library_path = Path(library.library_path).resolve()
+                common_root = self._get_library_common_root(library.library_path, library_data)
                 dest = destination_path / common_root.name
-                copy_tree_request = CopyTreeRequest(
-                    source_path=str(common_root),
-                    destination_path=str(dest),
-                    ignore_patterns=[".venv", "__pycache__"],
-                    dirs_exist_ok=True,
-                )
-                copy_tree_result = GriptapeNodes.handle_request(copy_tree_request)
-                if not isinstance(copy_tree_result, CopyTreeResultSuccess):
-                    logger.warning(
-                        "Failed to copy library files from '%s' to '%s' for library '%s'",
-                        common_root,
-                        dest,
-                        library_ref.library_name,
-                    )
-                    continue
-                library_path_relative_to_common_root = absolute_library_path.relative_to(common_root)
+                stager.stage_tree(common_root, dest, LIBRARY_IGNORE_PATTERNS)
+                library_path_relative_to_common_root = self._write_trimmed_library_json(
+                    absolute_library_path,
+                    dest / absolute_library_path.relative_to(common_root),
+                    node_types_by_library.get(library_ref.library_name, set()),
+                ).relative_to(dest)
                 library_paths.append(
                     (runtime_env_path / common_root.name / library_path_relative_to_common_root).as_posix()
                 )
@@ -418,11 +531,15 @@ class DeadlineCloudMultiTaskPublisher(DeadlineCloudPublisher):
         return "main"
 
     def _generate_task_input_files(self, package_path: str) -> None:
-        """Generate input JSON files for each task.
+        """Generate the input of each task.
 
         The input format matches what the workflow executor expects:
         {start_node_name: {param_name: param_value, ...}}
 
+        By default, all inputs are packed into a single JSON Lines file with a binary index of
+        byte offsets, so the number of files to hash, upload and sync stays constant as the
+        item count grows. Otherwise, one input_N.json file is written per task.
+
         Args:
             package_path: Path to the job bundle directory
         """
@@ -433,6 +550,10 @@ class DeadlineCloudMultiTaskPublisher(DeadlineCloudPublisher):
         # Index 0 contains the Start node mappings with the actual node name
         start_node_name = self._multi_task_config.package_result.parameter_name_mappings[0].node_name
 
+        if self._multi_task_config.pack_task_inputs:
+            self._write_packed_task_inputs(inputs_dir, start_node_name)
+            return
+
         for iteration_index, parameter_values in self._multi_task_config.parameter_values_per_iteration.items():
             # Format input as expected by the workflow executor
             flow_input = {start_node_name: parameter_values}
@@ -442,6 +563,40 @@ class DeadlineCloudMultiTaskPublisher(DeadlineCloudPublisher):
                 json.dump(flow_input, f, indent=2, default=str)
             logger.debug("Generated input file: %s", input_file)
 
+    def _write_packed_task_inputs(self, inputs_dir: Path, start_node_name: str) -> None:
+        """Write every task's input into one JSON Lines file and a byte-offset index.
+
+        The index holds task_count + 1 little-endian unsigned 64-bit offsets, so that the input
+        of task N spans bytes [offsets[N], offsets[N + 1]) of the JSON Lines file. Tasks without
+        parameter values get an empty record.
+
+        Args:
+            inputs_dir: Directory to write the packed inputs to
+            start_node_name: Name of the StartFlow node the inputs are addressed to
+        """
+        parameter_values_per_iteration = self._multi_task_config.parameter_values_per_iteration
+        offsets = array("Q")
+
+        with (inputs_dir / PACKED_INPUTS_FILE_NAME).open("wb") as inputs_file:
+            for iteration_index in range(self.task_count):
+                offsets.append(inputs_file.tell())
+                parameter_values = parameter_values_per_iteration.get(iteration_index)
+                flow_input = {start_node_name: parameter_values} if parameter_values is not None else {}
+                inputs_file.write(json.dumps(flow_input, default=str).encode("utf-8"))
+                inputs_file.write(b"\n")
+            offsets.append(inputs_file.tell())
+
+        if sys.byteorder != "little":
+            offsets.byteswap()
+        (inputs_dir / PACKED_INPUTS_INDEX_FILE_NAME).write_bytes(offsets.tobytes())
+        logger.info("Packed %d task inputs into %s", self.task_count, inputs_dir / PACKED_INPUTS_FILE_NAME)
+
+    def _get_models_to_warm(self) -> list[str]:
+        """Get the HuggingFace models used by the group's child nodes, which workers warm before the first task."""
+        if not self._get_config_value(DEADLINE_CLOUD_LIBRARY_CONFIG_KEY, "warm_model_cache", default=True):
+            return []
+        return sorted(set(self._gather_models_for_group()))
+
     def _gather_models_for_group(self) -> list[str]:
         """Gather HuggingFace model names from the group's child nodes.
 
@@ -555,23 +710,11 @@ class DeadlineCloudMultiTaskPublisher(DeadlineCloudPublisher):
             DEADLINE_CLOUD_LIBRARY_CONFIG_KEY, "enable_models_as_attachments", default=True
         )
 
-        deadline_client = self._get_client()
-
         # Get queue information for job attachment settings
-        queue_response = deadline_client.get_queue(farmId=farm_id, queueId=queue_id)
-        job_attachment_settings = JobAttachmentS3Settings(**queue_response["jobAttachmentSettings"])
-
-        queue_session = get_queue_user_boto3_session(
-            deadline_client,
-            None,
-            farm_id,
-            queue_id,
-        )
-        queue_session._session.set_config_variable("region", self._session.region_name)
-
-        storage_profile: StorageProfile | None = self._get_storage_profile_for_queue(
-            farm_id, queue_id, storage_profile_id
-        )
+        queue_metadata = self._get_queue_metadata(farm_id, queue_id, storage_profile_id)
+        job_attachment_settings = queue_metadata.job_attachment_settings
+        queue_session = queue_metadata.queue_session
+        storage_profile = queue_metadata.storage_profile
 
         # Collect input paths
         job_bundle_path = Path(package_path)
@@ -599,20 +742,16 @@ class DeadlineCloudMultiTaskPublisher(DeadlineCloudPublisher):
         # Upload model files separately (if enabled)
         if enable_models_as_attachments:
             model_names = self._gather_models_for_group()
-            model_paths = self._get_model_paths(model_names)
-            if model_paths:
-                logger.info("Uploading %d model files", len(model_paths))
-                model_attachments = self.upload_paths_as_job_attachments(
-                    input_paths=model_paths,
-                    output_paths=[],
+            attachments.manifests.extend(
+                self._upload_model_attachments(
+                    model_names,
                     farm_id=farm_id,
                     queue_id=queue_id,
                     storage_profile=storage_profile,
                     job_attachment_settings=job_attachment_settings,
                     queue_session=queue_session,
                 )
-                attachments.manifests.extend(model_attachments.manifests)
-                logger.info("Added %d model manifest(s)", len(model_attachments.manifests))
+            )
 
         return job_attachment_settings, attachments
 
@@ -684,15 +823,31 @@ class DeadlineCloudMultiTaskPublisher(DeadlineCloudPublisher):
         response = deadline_client.create_job(**create_job_request)
         return response["jobId"]
 
-    def _wait_for_job_completion(self, job_id: str) -> None:
-        """Wait for the job to complete using the job poller.
+    async def _wait_for_job_completion(
+        self,
+        job_id: str,
+        status_callback: Callable[[DeadlineCloudJobDetails, float], None] | None = None,
+        *,
+        track_task_progress: bool | None = None,
+    ) -> None:
+        """Wait for the job to complete via the shared poll coordinator without blocking the event loop.
 
         Args:
             job_id: ID of the job to monitor
+            status_callback: Callback for status updates; defaults to logging the job status
+            track_task_progress: Whether to track task-level progress; defaults to the publisher config,
+                then to the library's `track_task_progress` setting
         """
         deadline_client = self._get_client()
         config = self._get_config_parser()
 
+        if track_task_progress is None:
+            track_task_progress = self._multi_task_config.track_task_progress
+        if track_task_progress is None:
+            track_task_progress = self._get_config_value(
+                DEADLINE_CLOUD_LIBRARY_CONFIG_KEY, "track_task_progress", default=False
+            )
+
         poller = DeadlineCloudJobPoller(
             client=deadline_client,
             config=config,
@@ -700,10 +855,11 @@ class DeadlineCloudMultiTaskPublisher(DeadlineCloudPublisher):
             queue_id=self._multi_task_config.queue_id,
             farm_id=self._multi_task_config.farm_id,
             max_poll_interval=10,
-            status_callback=self._job_status_callback,
+            status_callback=status_callback or self._job_status_callback,
+            track_task_progress=track_task_progress,
         )
 
-        poller.poll_job()
+        await DeadlineCloudJobPollCoordinator.get_instance().await_job(self, poller)
 
     def _job_status_callback(self, job_details: Any, elapsed_time: float) -> None:
         """Callback for job status updates.
@@ -712,19 +868,36 @@ class DeadlineCloudMultiTaskPublisher(DeadlineCloudPublisher):
             job_details: Current job details from poller
             elapsed_time: Time elapsed since polling started
         """
+        progress = job_details.task_progress
+        if progress is None:
+            logger.info(
+                "Job %s - Status: %s, Task Status: %s (elapsed: %.1fs)",
+                job_details.job_id,
+                job_details.lifecycle_status,
+                job_details.task_run_status,
+                elapsed_time,
+            )
+            return
+
         logger.info(
-            "Job %s - Status: %s, Task Status: %s (elapsed: %.1fs)",
+            "Job %s - Status: %s, Tasks: %d/%d succeeded, %d failed, %d running (%.1f tasks/min, elapsed: %.1fs)",
             job_details.job_id,
             job_details.lifecycle_status,
-            job_details.task_run_status,
+            progress.succeeded,
+            progress.total,
+            progress.failed,
+            progress.running,
+            progress.throughput,
             elapsed_time,
         )
 
     def _collect_results(self, job_id: str) -> list[Any]:
         """Collect results from all completed tasks.
 
-        For multi-task jobs, each task writes a workflow_output.json file.
-        We download these from the job attachments output location.
+        Each task's outputs are downloaded and parsed on a bounded thread pool, so collection is
+        limited by bandwidth rather than by per-task round trips. Everything the downloads need
+        from the engine is resolved up front on this thread, and parsed results are written to
+        the local project from this thread, one task at a time, as they arrive.
 
         Args:
             job_id: ID of the completed job
@@ -734,48 +907,181 @@ class DeadlineCloudMultiTaskPublisher(DeadlineCloudPublisher):
         """
         logger.info("Result collection for job %s - downloading from job attachments", job_id)
 
-        farm_id = self._multi_task_config.farm_id
-        queue_id = self._multi_task_config.queue_id
+        try:
+            tasks = self._list_succeeded_tasks(job_id)
+            queue_session = self._get_queue_session(self._multi_task_config.farm_id, self._multi_task_config.queue_id)
+            # Create the shared S3 client and fetch the attachment settings up front; the download
+            # threads would otherwise race to create them
+            get_s3_client(session=queue_session)
+            self._get_job_attachment_settings()
+            reference_context = self._get_output_reference_context()
+
+            results: list[Any] = [None] * self.task_count
+            collected_indices: set[int] = set()
+            with ThreadPoolExecutor(max_workers=OUTPUT_DOWNLOAD_MAX_WORKERS) as executor:
+                futures = [
+                    executor.submit(
+                        self._download_and_parse_task_outputs, job_id, task, queue_session, reference_context
+                    )
+                    for task in tasks
+                ]
+                for future in as_completed(futures):
+                    output_paths_by_root, task_results = future.result()
+                    self._finalize_task_outputs(output_paths_by_root, task_results)
+                    for task_index, task_result in task_results.items():
+                        results[task_index] = task_result
+                    collected_indices.update(task_results)
 
-        deadline_client = self._get_client()
+            logger.info("Job output downloaded successfully.")
+            logger.info("Extracted results for %d/%d tasks", len(collected_indices), self.task_count)
+            missing_indices = sorted(set(range(self.task_count)) - collected_indices)
+            if missing_indices:
+                logger.warning(
+                    "No result was produced for %d task(s) of job %s, leaving None at indices: %s",
+                    len(missing_indices),
+                    job_id,
+                    missing_indices,
+                )
+            return results  # noqa: TRY300
+        except Exception as e:
+            details = f"Error downloading job output: {e}"
+            logger.error(details)
+            raise RuntimeError(details) from e
 
-        # Get job attachment settings if not already cached
-        if self._job_attachment_settings is None:
-            queue_response = deadline_client.get_queue(farmId=farm_id, queueId=queue_id)
-            self._job_attachment_settings = JobAttachmentS3Settings(**queue_response["jobAttachmentSettings"])
-
-        queue_session = get_queue_user_boto3_session(
-            deadline_client,
-            None,
-            farm_id,
-            queue_id,
+    async def _acollect_task_results(
+        self,
+        job_id: str,
+        task: DeadlineCloudTaskDetails,
+        queue_session: boto3.Session,
+        reference_context: OutputReferenceContext | None,
+    ) -> dict[int, Any]:
+        """Download and extract the outputs of a single succeeded task.
+
+        The download runs on the event loop's default executor; the results are written to the
+        local project on the event loop.
+
+        Args:
+            job_id: ID of the job the task belongs to
+            task: The succeeded task
+            queue_session: Queue role session used to read job attachments
+            reference_context: See `_get_output_reference_context`
+
+        Returns:
+            Map of task index to result for the outputs the task produced
+        """
+        output_paths_by_root, task_results = await asyncio.get_running_loop().run_in_executor(
+            None, self._download_and_parse_task_outputs, job_id, task, queue_session, reference_context
         )
+        self._finalize_task_outputs(output_paths_by_root, task_results)
+        return task_results
 
-        downloader = OutputDownloader(
-            s3_settings=self._job_attachment_settings,
-            farm_id=farm_id,
-            queue_id=queue_id,
+    def _get_output_reference_context(self) -> OutputReferenceContext | None:
+        """Capture what selective output downloads need from the engine.
+
+        Must be called on the engine's thread. Returns None when selective output download is
+        disabled and every output is downloaded.
+        """
+        if not self._get_config_value(DEADLINE_CLOUD_LIBRARY_CONFIG_KEY, "selective_output_download", default=True):
+            return None
+        return OutputReferenceContext.capture()
+
+    def _download_and_parse_task_outputs(
+        self,
+        job_id: str,
+        task: DeadlineCloudTaskDetails,
+        queue_session: boto3.Session,
+        reference_context: OutputReferenceContext | None,
+    ) -> tuple[dict[str, list[str]], dict[int, Any]]:
+        """Download a single succeeded task's outputs and parse its results.
+
+        Safe to call from worker threads once the job attachment settings are cached: no engine
+        requests are made and nothing is written to the local project.
+
+        Returns:
+            Tuple of (downloaded output paths by root, map of task index to result)
+        """
+        downloader = DeadlineCloudSelectiveOutputDownloader(
+            s3_settings=self._get_job_attachment_settings(),
+            farm_id=self._multi_task_config.farm_id,
+            queue_id=self._multi_task_config.queue_id,
             job_id=job_id,
+            step_id=task.step_id,
+            task_id=task.task_id,
             session=queue_session,
         )
 
-        def on_download_progress(progress: Any) -> bool:
-            logger.info("Downloading output: %s", progress)
-            return True  # Continue downloading
-
         try:
-            downloader.download_job_output(
-                on_downloading_files=on_download_progress,
-            )
-            logger.info("Job output downloaded successfully.")
-
-            output_paths_by_root = downloader.get_output_paths_by_root()
-            return self._extract_multi_task_results(output_paths_by_root)
+            output_paths_by_root = self._download_task_outputs(downloader, reference_context)
+            task_results = self._parse_task_outputs(output_paths_by_root)
         except Exception as e:
-            details = f"Error downloading job output: {e}"
+            details = f"Error downloading output for task {task.task_id}: {e}"
             logger.error(details)
             raise RuntimeError(details) from e
 
+        logger.info("Collected results for task %s: indices %s", task.task_id, sorted(task_results))
+        return output_paths_by_root, task_results
+
+    def _download_task_outputs(
+        self,
+        downloader: DeadlineCloudSelectiveOutputDownloader,
+        reference_context: OutputReferenceContext | None,
+        on_downloading_files: Callable[[Any], bool] | None = None,
+    ) -> dict[str, list[str]]:
+        """Download task outputs, only the output_N.json files and the files they reference when selective.
+
+        Args:
+            downloader: Downloader for the task's outputs
+            reference_context: See `_get_output_reference_context`; None downloads every output
+            on_downloading_files: Callback periodically reporting download progress
+
+        Returns:
+            Dictionary mapping root paths to the downloaded output file paths
+        """
+        if reference_context is not None:
+            return downloader.download_referenced_outputs(
+                self._get_output_dir_subdir(),
+                is_result_file=lambda path: TASK_OUTPUT_FILE_PATTERN.match(Path(path).name) is not None,
+                on_downloading_files=on_downloading_files,
+                reference_context=reference_context,
+            )
+
+        downloader.exclude_seeded_inputs(self._get_output_dir_subdir())
+        downloader.download_job_output(on_downloading_files=on_downloading_files)
+        return downloader.get_output_paths_by_root()
+
+    def _list_succeeded_tasks(self, job_id: str) -> list[DeadlineCloudTaskDetails]:
+        """List every succeeded task of the job.
+
+        Steps and tasks are listed rather than searched, since the search index may not yet
+        reflect tasks that only just finished.
+        """
+        client = self._get_client()
+        farm_id = self._multi_task_config.farm_id
+        queue_id = self._multi_task_config.queue_id
+
+        succeeded_tasks: list[DeadlineCloudTaskDetails] = []
+        step_pages = client.get_paginator("list_steps").paginate(farmId=farm_id, queueId=queue_id, jobId=job_id)
+        for step in (step for page in step_pages for step in page.get("steps", [])):
+            task_pages = client.get_paginator("list_tasks").paginate(
+                farmId=farm_id, queueId=queue_id, jobId=job_id, stepId=step["stepId"]
+            )
+            succeeded_tasks.extend(
+                DeadlineCloudTaskDetails(
+                    step_id=step["stepId"], task_id=task["taskId"], parameters=task.get("parameters", {})
+                )
+                for page in task_pages
+                for task in page.get("tasks", [])
+                if task.get("runStatus") == TaskRunStatus.SUCCEEDED
+            )
+        return succeeded_tasks
+
+    def _get_job_attachment_settings(self) -> JobAttachmentS3Settings:
+        """Get the queue's job attachment settings, fetching them if not already cached."""
+        if self._job_attachment_settings is None:
+            queue_metadata = self._get_queue_metadata(self._multi_task_config.farm_id, self._multi_task_config.queue_id)
+            self._job_attachment_settings = queue_metadata.job_attachment_settings
+        return self._job_attachment_settings
+
     def _get_static_files_directory(self) -> Path:
         """Get the static files directory path."""
         workspace_dir = GriptapeNodes.ConfigManager().get_config_value("workspace_directory")
@@ -870,29 +1176,21 @@ class DeadlineCloudMultiTaskPublisher(DeadlineCloudPublisher):
 
         return translate_value(value)
 
-    def _extract_multi_task_results(self, output_paths_by_root: dict[str, list[str]]) -> list[Any]:  # noqa: C901
-        """Extract results from downloaded output files for each task.
+    def _parse_task_outputs(self, output_paths_by_root: dict[str, list[str]]) -> dict[int, Any]:  # noqa: C901
+        """Parse the results from the downloaded output files of one or more tasks.
 
         Each task writes its output to output_X.json where X is the task index.
         The JSON structure is: {"task_index": X, "result": {end_node_name: {param_name: value, ...}}}
 
-        This method also:
-        - Copies any static files to the static files directory
-        - Translates worker paths in results to local filesystem paths
+        Worker paths in results are translated to local filesystem paths.
 
         Args:
             output_paths_by_root: Dictionary mapping root paths to output file paths
 
         Returns:
-            List of results, one per task, in order of task index
+            Map of task index to result for every output_X.json found
         """
-        import re
-
-        # Copy any static files to the static files directory
-        self._copy_static_files(output_paths_by_root)
-
-        # Initialize results list with None for each task
-        results: list[Any] = [None] * self.task_count
+        results: dict[int, Any] = {}
 
         # Get the result parameter name from config (maps to new_item_to_add)
         result_param_name = self._multi_task_config.result_parameter_name
@@ -901,7 +1199,7 @@ class DeadlineCloudMultiTaskPublisher(DeadlineCloudPublisher):
         for root_path, output_files in output_paths_by_root.items():
             for output_file in output_files:
                 # Match output_X.json pattern
-                match = re.match(r"output_(\d+)\.json$", Path(output_file).name)
+                match = TASK_OUTPUT_FILE_PATTERN.match(Path(output_file).name)
                 if match:
                     task_index = int(match.group(1))
                     output_file_path = Path(root_path) / output_file
@@ -941,19 +1239,33 @@ class DeadlineCloudMultiTaskPublisher(DeadlineCloudPublisher):
                     except Exception as e:
                         logger.warning("Failed to parse task output file %s: %s", output_file_path, e)
 
+        return results
+
+    def _finalize_task_outputs(self, output_paths_by_root: dict[str, list[str]], results: dict[int, Any]) -> None:
+        """Write the downloaded output files of one or more tasks into the local project.
+
+        This:
+        - Copies any static files to the static files directory
+        - Writes files with metadata sidecars using situation-aware saving
+        - Writes the remaining macro-referenced files of each result
+
+        Args:
+            output_paths_by_root: Dictionary mapping root paths to output file paths
+            results: Map of task index to parsed result, from `_parse_task_outputs`
+        """
+        # Copy any static files to the static files directory
+        self._copy_static_files(output_paths_by_root)
+
         # Write any macro-referenced output files to the correct local project locations.
         # Collect metadata sidecars once (shared across all tasks).
         downloaded_files = self._build_downloaded_files_lookup(output_paths_by_root)
         metadata_sidecars = collect_metadata_sidecars(downloaded_files)
         sidecar_written = write_sidecar_output_files(downloaded_files, metadata_sidecars)
 
-        for task_result in results:
+        for task_result in results.values():
             if task_result is not None:
                 self._write_macro_output_files(task_result, downloaded_files, sidecar_written)
 
-        logger.info("Extracted results for %d/%d tasks", len([r for r in results if r is not None]), self.task_count)
-        return results
-
     def _build_downloaded_files_lookup(self, output_paths_by_root: dict[str, list[str]]) -> dict[str, Path]:
         """Build a lookup of relative paths within the output dir to their full local paths.
 
@@ -1022,7 +1334,7 @@ class DeadlineCloudMultiTaskPublisher(DeadlineCloudPublisher):
             sidecar_written: Set of relative paths already written via sidecar.
         """
         from griptape_nodes.common.macro_parser import ParsedMacro
-        from griptape_nodes.files.file import File, FileWriteError
+        from griptape_nodes.files.file import FileDestination, FileWriteError
         from griptape_nodes.retained_mode.events.project_events import (
             GetPathForMacroRequest,
             GetPathForMacroResultSuccess,
@@ -1050,9 +1362,8 @@ class DeadlineCloudMultiTaskPublisher(DeadlineCloudPublisher):
             return
 
         try:
-            file_bytes = source_path.read_bytes()
-            local_path = File(macro_string).write_bytes(file_bytes)
-        except FileWriteError as e:
+            local_file = finalize_downloaded_file(source_path, FileDestination(macro_string))
+        except (FileWriteError, OSError) as e:
             logger.warning("Failed to write macro output '%s': %s", macro_string, e)
         else:
-            logger.info("Wrote macro output '%s' -> '%s'", macro_string, local_path)
+            logger.info("Wrote macro output '%s' -> '%s'", macro_string, local_file.resolve())
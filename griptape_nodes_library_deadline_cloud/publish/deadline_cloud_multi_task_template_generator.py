@@ -2,7 +2,8 @@
 
 This module generates Open Job Description templates that execute the same workflow
 multiple times as separate tasks within a single Deadline Cloud job. Each task
-processes a different input from the items list.
+processes a different input from the items list, or a contiguous chunk of inputs
+when chunking is enabled.
 """
 
 from __future__ import annotations
@@ -11,12 +12,176 @@ import logging
 from typing import TYPE_CHECKING, Any
 
 import yaml
+from publish.deadline_cloud_job_template_generator import (
+    SEEDED_INPUTS_MANIFEST_FILE_NAME,
+    STATIC_FILES_OVERLAY_SCRIPT,
+    DeadlineCloudJobTemplateGenerator,
+)
 
 if TYPE_CHECKING:
     from pathlib import Path
 
+    from publish.deadline_cloud_job_template_generator import PackageInstaller
+
 logger = logging.getLogger("multi_task_template_generator")
 
+# Packed task inputs: one JSON Lines record per item, and the little-endian uint64 byte offsets of those records
+PACKED_INPUTS_FILE_NAME = "inputs.jsonl"
+PACKED_INPUTS_INDEX_FILE_NAME = "inputs.idx"
+
+# The session's executor daemon listens on this socket; tasks forward their arguments to it
+EXECUTOR_DAEMON_SOCKET = "{{Session.WorkingDirectory}}/griptape_executor.sock"
+# Time, in seconds, that the step environment waits for the executor daemon to load the engine and libraries
+EXECUTOR_DAEMON_STARTUP_TIMEOUT = 900
+
+# Python code of the execution script that forwards a task to the session's executor daemon, or
+# serves as that daemon. It is pasted into a template that Open Job Description formats, so it
+# must not contain double braces.
+_EXECUTOR_DAEMON_SCRIPT = """
+_EXECUTOR_DAEMON_RESULT_MARKER = "__griptape_executor_daemon_result__ "
+_EXECUTOR_DAEMON_ACCEPTED = b"__griptape_executor_daemon_accepted__\\n"
+# Seconds a task waits for the daemon to accept it before running in its own process
+_EXECUTOR_DAEMON_ACCEPT_TIMEOUT = 30
+
+
+class _ExecutorDaemonStopped(BaseException):
+    pass
+
+
+def _forward_to_executor_daemon(socket_path: str, argv: list) -> None:
+    # Returns only if no daemon is ready for the task, in which case the task runs in this process
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        client.connect(socket_path)
+        # The daemon runs one task at a time, so one still busy with an earlier task is not waited on
+        client.settimeout(_EXECUTOR_DAEMON_ACCEPT_TIMEOUT)
+        accepted = client.recv(len(_EXECUTOR_DAEMON_ACCEPTED))
+        client.settimeout(None)
+    except OSError as e:
+        client.close()
+        logger.warning("Executor daemon unavailable, running the task in this process: %s", e)
+        return
+    if accepted != _EXECUTOR_DAEMON_ACCEPTED:
+        client.close()
+        logger.warning("Executor daemon did not accept the task, running the task in this process")
+        return
+
+    # If this process is killed, e.g. when the task is canceled or times out, the daemon sees the
+    # connection close and stops, aborting the task
+    with client, client.makefile("rw", encoding="utf-8") as stream:
+        stream.write(json.dumps(argv) + "\\n")
+        stream.flush()
+        for line in stream:
+            if line.startswith(_EXECUTOR_DAEMON_RESULT_MARKER):
+                sys.exit(json.loads(line[len(_EXECUTOR_DAEMON_RESULT_MARKER) :])["exit_code"])
+            sys.stdout.write(line)
+            sys.stdout.flush()
+    logger.error("Executor daemon stopped before the task finished")
+    sys.exit(1)
+
+
+def _run_forwarded_tasks(argv: list) -> int:
+    if _bundled_static_files.exists() and not _static_files_overlay:
+        _overlay_static_files(_bundled_static_files, output_dir, _seeded_inputs_baseline)
+    try:
+        _run_tasks(argv)
+    except SystemExit as e:
+        # Mapped to exit codes as the interpreter does
+        if e.code is None:
+            return 0
+        return e.code if isinstance(e.code, int) else 1
+    except Exception:
+        logger.exception("Task failed")
+        return 1
+    finally:
+        # Removed before the task's outputs are synced, as when the task runs in its own process
+        if _bundled_static_files.exists():
+            _remove_static_files_overlay()
+    return 0
+
+
+def _stop_if_client_disconnects(connection: socket.socket, task_done: threading.Event) -> None:
+    # The client only disconnects before its result when it was killed, e.g. because the task was canceled
+    # or timed out. The daemon then stops, aborting the task, and later tasks run in their own processes.
+    try:
+        while connection.recv(1024):
+            pass
+    except OSError:
+        pass
+    if not task_done.is_set():
+        logger.warning("Task client disconnected before the task finished, stopping the executor daemon")
+        os.kill(os.getpid(), signal.SIGTERM)
+
+
+def _serve(socket_path: str) -> None:
+    def stop(signum, frame):
+        raise _ExecutorDaemonStopped
+
+    signal.signal(signal.SIGTERM, stop)
+    # Bound under a temporary name and renamed once listening, so that clients never see a socket that refuses them
+    temp_socket_path = socket_path + ".tmp"
+    for path in (socket_path, temp_socket_path):
+        if os.path.exists(path):
+            os.unlink(path)
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(temp_socket_path)
+    server.listen()
+    os.replace(temp_socket_path, socket_path)
+    logger.info("Executor daemon listening on %s", socket_path)
+
+    try:
+        while True:
+            connection, _ = server.accept()
+            with connection:
+                try:
+                    connection.sendall(_EXECUTOR_DAEMON_ACCEPTED)
+                except OSError:
+                    # The client stopped waiting and ran the task itself
+                    continue
+                stream = connection.makefile("rw", encoding="utf-8")
+                try:
+                    line = stream.readline()
+                    if not line:
+                        continue
+                    argv = json.loads(line)
+                    task_done = threading.Event()
+                    threading.Thread(
+                        target=_stop_if_client_disconnects, args=(connection, task_done), daemon=True
+                    ).start()
+                    # The task's logs and output are streamed back to the client, which prints them to the task log
+                    handler = logging.StreamHandler(stream)
+                    logging.getLogger().addHandler(handler)
+                    try:
+                        with contextlib.redirect_stdout(stream), contextlib.redirect_stderr(stream):
+                            exit_code = _run_forwarded_tasks(argv)
+                    finally:
+                        task_done.set()
+                        logging.getLogger().removeHandler(handler)
+                    try:
+                        stream.write("\\n" + _EXECUTOR_DAEMON_RESULT_MARKER + json.dumps(dict(exit_code=exit_code)) + "\\n")
+                        stream.flush()
+                    except OSError as e:
+                        logger.warning("Failed to report the task result to its client: %s", e)
+                finally:
+                    # Unsent output is dropped if the client is gone, e.g. when its task was aborted
+                    with contextlib.suppress(OSError):
+                        stream.close()
+    except _ExecutorDaemonStopped:
+        logger.info("Executor daemon stopped")
+    finally:
+        server.close()
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+
+
+_executor_parser = argparse.ArgumentParser(add_help=False)
+_executor_parser.add_argument("--executor-socket", default=None)
+_executor_parser.add_argument("--serve", action="store_true")
+_executor_args, _ = _executor_parser.parse_known_args()
+if _executor_args.executor_socket and not _executor_args.serve and os.path.exists(_executor_args.executor_socket):
+    _forward_to_executor_daemon(_executor_args.executor_socket, sys.argv[1:])
+"""
+
 
 class DeadlineCloudMultiTaskJobTemplateGenerator:
     """Handles generation of Open Job Description templates for multi-task Griptape workflows.
@@ -33,8 +198,12 @@ class DeadlineCloudMultiTaskJobTemplateGenerator:
         library_paths: list[str],
         task_count: int,
         *,
+        chunk_size: int = 1,
         pickle_control_flow_result: bool = False,
         host_requirements: dict[str, Any] | None = None,
+        venv_cache_dir: str | None = None,
+        package_installer: PackageInstaller = "pip",
+        models: list[str] | None = None,
     ) -> dict[str, Any]:
         """Generate Open Job Description template for a multi-task workflow.
 
@@ -42,13 +211,21 @@ class DeadlineCloudMultiTaskJobTemplateGenerator:
             job_bundle_dir: Directory where the job bundle files are stored
             workflow_name: Name of the workflow being executed
             library_paths: List of library paths needed for workflow execution
-            task_count: Number of tasks to create (one per iteration item)
+            task_count: Number of iteration items to execute
+            chunk_size: Number of consecutive items each task executes in a single engine process
             pickle_control_flow_result: Whether to pickle control flow results
             host_requirements: Optional host requirements dict with 'amounts' and/or 'attributes'
+            venv_cache_dir: Directory on the worker host to cache virtual environments in
+            package_installer: The installer used to build the virtual environment, "pip" or "uv"
+            models: HuggingFace models whose weights a job environment reads into the worker's page cache
 
         Returns:
             The generated job template dictionary
         """
+        if chunk_size < 1:
+            msg = f"Chunk size must be at least 1, got {chunk_size}."
+            raise ValueError(msg)
+
         parameter_definitions: list[dict[str, Any]] = []
 
         parameter_definitions.append(
@@ -82,7 +259,7 @@ class DeadlineCloudMultiTaskJobTemplateGenerator:
                 "name": "TaskCount",
                 "type": "INT",
                 "default": task_count,
-                "description": "Number of tasks to execute",
+                "description": "Number of iteration items to execute",
             }
         )
 
@@ -117,27 +294,12 @@ class DeadlineCloudMultiTaskJobTemplateGenerator:
             library_paths, pickle_control_flow_result=pickle_control_flow_result
         )
 
-        venv_script = """#!/bin/env bash
-set -e
-echo 'Setting up Python virtual environment...'
-python -m pip install --upgrade pip wheel setuptools
-echo 'Installing dependencies...'
-pip install -r {{Param.LocationToRemap}}/assets/requirements.txt
-mkdir -p {{Param.LocationToRemap}}/output
-
-# Create .venv symlinks in libraries so library code that expects its own
-# venv (e.g. _get_library_env_python) finds a working Python with all deps.
-SESSION_PYTHON=$(which python)
-for lib_dir in {{Param.LocationToRemap}}/assets/libraries/*/; do
-    if [ -f "${lib_dir}griptape-nodes-library.json" ] || [ -f "${lib_dir}griptape-nodes-library-cuda129.json" ]; then
-        mkdir -p "${lib_dir}.venv/bin"
-        ln -sf "$SESSION_PYTHON" "${lib_dir}.venv/bin/python"
-        echo "Created .venv symlink in ${lib_dir}"
-    fi
-done
+        # Each task's TaskIndex is the first item of its chunk
+        task_index_range = f"0-{task_count - 1}" if chunk_size == 1 else f"0-{task_count - 1}:{chunk_size}"
 
-echo 'Virtual environment setup complete.'
-"""
+        venv_script = DeadlineCloudJobTemplateGenerator.generate_venv_script(
+            venv_cache_dir=venv_cache_dir, package_installer=package_installer
+        )
 
         # Create job template with parameterSpace for multi-task execution
         job_template: dict[str, Any] = {
@@ -167,7 +329,7 @@ echo 'Virtual environment setup complete.'
                             {
                                 "name": "TaskIndex",
                                 "type": "INT",
-                                "range": f"0-{task_count - 1}",
+                                "range": task_index_range,
                             }
                         ]
                     },
@@ -177,15 +339,24 @@ echo 'Virtual environment setup complete.'
                                 "command": "python",
                                 "args": [
                                     "{{Task.File.Run}}",
-                                    "--input-file",
-                                    "{{Param.LocationToRemap}}/assets/inputs/input_{{Task.Param.TaskIndex}}.json",
+                                    "--inputs-dir",
+                                    "{{Param.LocationToRemap}}/assets/inputs",
                                     "--task-index",
                                     "{{Task.Param.TaskIndex}}",
+                                    "--chunk-size",
+                                    str(chunk_size),
+                                    "--task-count",
+                                    "{{Param.TaskCount}}",
+                                    "--executor-socket",
+                                    EXECUTOR_DAEMON_SOCKET,
                                 ],
                             }
                         },
                         "embeddedFiles": [{"name": "Run", "type": "TEXT", "runnable": True, "data": python_script}],
                     },
+                    "stepEnvironments": [
+                        DeadlineCloudMultiTaskJobTemplateGenerator._generate_executor_daemon_environment(python_script)
+                    ],
                 },
             ],
         }
@@ -194,6 +365,12 @@ echo 'Virtual environment setup complete.'
         if host_requirements and len(host_requirements) > 0:
             job_template["steps"][0]["hostRequirements"] = host_requirements
 
+        if models:
+            # Entered first, so that warming overlaps with building the virtual environment
+            job_template["jobEnvironments"].insert(
+                0, DeadlineCloudJobTemplateGenerator.generate_model_cache_warmup_environment(models)
+            )
+
         template_path = job_bundle_dir / "template.yaml"
         with template_path.open("w", encoding="utf-8") as template_file:
             yaml.dump(job_template, template_file, default_flow_style=False, sort_keys=False)
@@ -202,22 +379,107 @@ echo 'Virtual environment setup complete.'
 
         return job_template
 
+    @staticmethod
+    def _generate_executor_daemon_environment(python_script: str) -> dict[str, Any]:
+        """Generate the step environment that runs the session's tasks in one long-lived executor daemon.
+
+        Entering the environment starts the execution script as a daemon, which loads the engine and
+        libraries once, and waits until it listens on the session's socket. Each task's execution
+        script then forwards its arguments to the daemon instead of loading everything again, so
+        models cached by nodes also stay loaded between tasks. A task that is canceled or times out
+        stops the daemon, aborting the task. Tasks run in their own process, as before, if the daemon
+        fails to start, stops, or does not accept a task in time.
+        """
+        enter_script = f"""#!/bin/env bash
+SOCKET="{EXECUTOR_DAEMON_SOCKET}"
+PID_FILE="{{{{Session.WorkingDirectory}}}}/griptape_executor.pid"
+LOG_FILE="{{{{Session.WorkingDirectory}}}}/griptape_executor.log"
+
+# Detached from the action, so that the daemon outlives it and does not hold its output open
+SETSID=""
+if command -v setsid >/dev/null 2>&1; then
+    SETSID=setsid
+fi
+$SETSID nohup python "{{{{Env.File.Serve}}}}" --serve --executor-socket "$SOCKET" </dev/null >"$LOG_FILE" 2>&1 &
+echo $! > "$PID_FILE"
+
+for _ in $(seq 1 {EXECUTOR_DAEMON_STARTUP_TIMEOUT}); do
+    if [ -S "$SOCKET" ]; then
+        echo "Griptape executor daemon is ready"
+        exit 0
+    fi
+    if ! kill -0 "$(cat "$PID_FILE")" 2>/dev/null; then
+        echo "Griptape executor daemon exited during startup; tasks will run in their own processes"
+        cat "$LOG_FILE"
+        exit 0
+    fi
+    sleep 1
+done
+echo "Griptape executor daemon did not start in time; tasks will run in their own processes until it does"
+"""
+
+        exit_script = """#!/bin/env bash
+PID_FILE="{{Session.WorkingDirectory}}/griptape_executor.pid"
+LOG_FILE="{{Session.WorkingDirectory}}/griptape_executor.log"
+
+if [ -f "$PID_FILE" ]; then
+    PID=$(cat "$PID_FILE")
+    kill "$PID" 2>/dev/null || true
+    # The daemon removes its overlay of static files on the way out
+    for _ in $(seq 1 60); do
+        kill -0 "$PID" 2>/dev/null || break
+        sleep 1
+    done
+    kill -9 "$PID" 2>/dev/null || true
+    rm -f "$PID_FILE"
+fi
+if [ -f "$LOG_FILE" ]; then
+    echo "End of the Griptape executor daemon log:"
+    tail -n 100 "$LOG_FILE"
+fi
+"""
+
+        return {
+            "name": "GriptapeExecutorDaemon",
+            "description": "Long-lived Griptape engine that executes every task of the session",
+            "script": {
+                "actions": {
+                    "onEnter": {"command": "bash", "args": ["{{Env.File.Enter}}"]},
+                    "onExit": {"command": "bash", "args": ["{{Env.File.Exit}}"]},
+                },
+                "embeddedFiles": [
+                    {"name": "Enter", "type": "TEXT", "runnable": True, "data": enter_script},
+                    {"name": "Exit", "type": "TEXT", "runnable": True, "data": exit_script},
+                    {"name": "Serve", "type": "TEXT", "data": python_script},
+                ],
+            },
+        }
+
     @staticmethod
     def _generate_python_execution_script(library_paths: list[str], *, pickle_control_flow_result: bool = False) -> str:
         """Generate the Python script that will execute the Griptape workflow for each task.
 
         This script is similar to the standard execution script but:
-        1. Accepts a --task-index argument to identify which task is running
-        2. Writes output to a task-specific output file (output_N.json)
+        1. Accepts a --task-index argument to identify the first item of the task
+        2. Executes up to --chunk-size consecutive items within the same engine process
+        3. Reads each item's input from the packed inputs file when present, else from input_N.json
+        4. Writes each item's output to an item-specific output file (output_N.json)
+        5. Forwards the task to the session's executor daemon when one is listening, or runs as that daemon
         """
         library_paths_str = ", ".join(repr(path) for path in library_paths)
 
         return f"""import argparse
+import atexit
+import contextlib
 import json
 import logging
 import os
 import shutil
+import signal
+import socket
+import struct
 import sys
+import threading
 from pathlib import Path
 
 from dotenv import load_dotenv
@@ -228,6 +490,8 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
+# Forward the task to the session's executor daemon, before loading anything else, if one is running
+{_EXECUTOR_DAEMON_SCRIPT}
 # Set up paths - use DataDir parameter for job attachments
 location_to_remap = r"{{{{Param.LocationToRemap}}}}"
 models_location_to_remap = r"{{{{Param.ModelsLocationToRemap}}}}"
@@ -238,12 +502,19 @@ output_dir = Path(location_to_remap) / "output" / output_dir_subdirectory
 output_dir.mkdir(parents=True, exist_ok=True)
 sys.path.insert(0, str(job_assets_dir))
 
-# Copy the contents of static_files/ into the tracked output directory so that
-# project-relative directory macros (e.g. {{outputs}}) resolve inside it.
+# Overlay the contents of static_files/ onto the tracked output directory so that
+# project-relative directory macros (e.g. {{outputs}}) resolve inside it. Files are
+# reflinked where the filesystem supports it and copied otherwise, and the overlay is
+# removed again at exit so that only the static files the workflow changed are synced
+# as outputs.
+# The bundle's baseline manifest of their hashes is copied alongside them, letting clients
+# skip any that still come back unchanged.
+{STATIC_FILES_OVERLAY_SCRIPT}
 _bundled_static_files = job_assets_dir / "static_files"
+_seeded_inputs_baseline = job_assets_dir / "{SEEDED_INPUTS_MANIFEST_FILE_NAME}"
 if _bundled_static_files.exists():
-    shutil.copytree(str(_bundled_static_files), str(output_dir), dirs_exist_ok=True)
-    logger.info("Copied static files contents into output directory: %s", output_dir)
+    atexit.register(_remove_static_files_overlay)
+    _overlay_static_files(_bundled_static_files, output_dir, _seeded_inputs_baseline)
 
 # Load environment variables
 if (job_assets_dir / ".env").exists():
@@ -311,19 +582,39 @@ from deadline_cloud_workflow_executor import DeadlineCloudWorkflowExecutor
 from griptape_nodes.drivers.storage.storage_backend import StorageBackend
 from workflow import execute_workflow  # type: ignore[attr-defined]
 
-if __name__ == "__main__":
+def _read_packed_input(inputs_dir: Path, task_index: int) -> dict:
+    # Look up the record's byte range in the offset index, then read only that record
+    with open(inputs_dir / "{PACKED_INPUTS_INDEX_FILE_NAME}", 'rb') as index_file:
+        index_file.seek(task_index * 8)
+        start, end = struct.unpack("<QQ", index_file.read(16))
+    with open(inputs_dir / "{PACKED_INPUTS_FILE_NAME}", 'rb') as inputs_file:
+        inputs_file.seek(start)
+        return json.loads(inputs_file.read(end - start).decode('utf-8'))
 
+def _run_tasks(argv: list[str]) -> None:
     parser = argparse.ArgumentParser()
     parser.add_argument(
-        "--input-file",
+        "--inputs-dir",
         default=None,
-        help="Path to JSON file containing input for this task",
+        help="Directory containing the input_N.json file of each item",
     )
     parser.add_argument(
         "--task-index",
         type=int,
         default=0,
-        help="Index of the current task (0-based)",
+        help="Index of the first item executed by this task (0-based)",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=1,
+        help="Number of consecutive items executed by this task",
+    )
+    parser.add_argument(
+        "--task-count",
+        type=int,
+        default=None,
+        help="Total number of items in the job",
     )
     parser.add_argument(
         "--pickle-control-flow-result",
@@ -331,53 +622,79 @@ if __name__ == "__main__":
         default={pickle_control_flow_result},
         help="Whether to pickle the control flow result",
     )
+    parser.add_argument(
+        "--executor-socket",
+        default=None,
+        help="Socket of the session's executor daemon, which runs the task when it is listening",
+    )
+    parser.add_argument(
+        "--serve",
+        action="store_true",
+        help="Run as the session's executor daemon, serving tasks on --executor-socket",
+    )
 
-    args = parser.parse_args()
-    input_file_path = args.input_file
-    task_index = args.task_index
+    args = parser.parse_args(argv)
+    inputs_dir = Path(args.inputs_dir) if args.inputs_dir else None
+    first_index = args.task_index
+    last_index = first_index + args.chunk_size
+    if args.task_count is not None:
+        last_index = min(last_index, args.task_count)
     pickle_result = args.pickle_control_flow_result
 
-    logger.info("Starting task %d", task_index)
+    project_file_path = output_dir / "project.yml"
 
-    try:
-        if input_file_path:
-            with open(input_file_path, 'r', encoding='utf-8') as f:
-                flow_input = json.load(f)
-            logger.info("Loaded input from file: %s", input_file_path)
-        else:
-            flow_input = {{}}
-            logger.info("No input file provided, using empty input")
-    except Exception as e:
-        msg = f"Error reading JSON input file: {{e}}"
-        logger.info(msg)
-        raise
+    # The engine and libraries were loaded once above; every item of the chunk reuses them
+    for task_index in range(first_index, last_index):
+        logger.info("Starting task %d", task_index)
+
+        input_file_path = inputs_dir / f"input_{{task_index}}.json" if inputs_dir else None
+        try:
+            if inputs_dir and (inputs_dir / "{PACKED_INPUTS_FILE_NAME}").exists():
+                flow_input = _read_packed_input(inputs_dir, task_index)
+                logger.info("Loaded input %d from packed inputs in: %s", task_index, inputs_dir)
+            elif input_file_path:
+                with open(input_file_path, 'r', encoding='utf-8') as f:
+                    flow_input = json.load(f)
+                logger.info("Loaded input from file: %s", input_file_path)
+            else:
+                flow_input = {{}}
+                logger.info("No input file provided, using empty input")
+        except Exception as e:
+            msg = f"Error reading JSON input file: {{e}}"
+            logger.info(msg)
+            raise
+
+        workflow_runner = DeadlineCloudWorkflowExecutor(
+            storage_backend=StorageBackend("local"),
+            project_file_path=project_file_path if project_file_path.exists() else None,
+            skip_library_loading=True,
+        )
 
-    project_file_path = output_dir / "project.yml"
-    workflow_runner = DeadlineCloudWorkflowExecutor(
-        storage_backend=StorageBackend("local"),
-        project_file_path=project_file_path if project_file_path.exists() else None,
-        skip_library_loading=True,
-    )
+        # Execute the workflow
+        result = execute_workflow(
+            input=flow_input,
+            workflow_executor=workflow_runner,
+            pickle_control_flow_result=pickle_result,
+        )
 
-    # Execute the workflow
-    result = execute_workflow(
-        input=flow_input,
-        workflow_executor=workflow_runner,
-        pickle_control_flow_result=pickle_result,
-    )
+        # Write output to task-specific file
+        output_file = output_dir / f"output_{{task_index}}.json"
 
-    # Write output to task-specific file
-    output_file = output_dir / f"output_{{task_index}}.json"
+        # The result from execute_workflow contains the workflow output
+        # We need to extract the relevant output values
+        output_data = {{
+            "task_index": task_index,
+            "result": result,
+        }}
 
-    # The result from execute_workflow contains the workflow output
-    # We need to extract the relevant output values
-    output_data = {{
-        "task_index": task_index,
-        "result": result,
-    }}
+        with open(output_file, 'w', encoding='utf-8') as f:
+            json.dump(output_data, f, indent=2, default=str)
 
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(output_data, f, indent=2, default=str)
+        logger.info("Task %d completed. Output written to: %s", task_index, output_file)
 
-    logger.info("Task %d completed. Output written to: %s", task_index, output_file)
+if __name__ == "__main__":
+    if _executor_args.serve:
+        _serve(_executor_args.executor_socket)
+    else:
+        _run_tasks(sys.argv[1:])
 """
@@ -0,0 +1,335 @@
+"""Selective download of Deadline Cloud job outputs."""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from deadline.job_attachments.download import OutputDownloader, download_files
+from deadline.job_attachments.models import FileConflictResolution
+from deadline.job_attachments.progress_tracker import ProgressStatus, ProgressTracker
+from griptape_nodes.common.macro_parser import ParsedMacro
+from griptape_nodes.retained_mode.events.project_events import (
+    GetCurrentProjectRequest,
+    GetCurrentProjectResultSuccess,
+    GetPathForMacroRequest,
+    GetPathForMacroResultSuccess,
+)
+from griptape_nodes.retained_mode.griptape_nodes import GriptapeNodes
+from publish.deadline_cloud_job_template_generator import SEEDED_INPUTS_MANIFEST_FILE_NAME
+from publish.utils import get_metadata_dir_name
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from deadline.job_attachments.progress_tracker import ProgressReportMetadata
+    from griptape_nodes.retained_mode.managers.secrets_manager import SecretsManager
+
+
+logger = logging.getLogger("deadline_cloud_output_downloader")
+
+STATIC_FILES_SEGMENT = "staticfiles/"
+
+
+@dataclass(frozen=True)
+class OutputReferenceContext:
+    """The project state needed to find the outputs that a result references.
+
+    Capturing it issues engine requests, so it is captured once on the engine's thread and then
+    shared by downloads running on other threads, which only read it.
+
+    Attributes:
+        metadata_dir_name: The directory metadata sidecars are saved to, if the project defines one.
+        directories: The project's directory names mapped to their resolved relative paths.
+        secrets_manager: Passed to macro resolution, which only uses it for values that reference
+            environment variables; resolved directory paths never do.
+    """
+
+    metadata_dir_name: str | None
+    directories: dict[str, str]
+    secrets_manager: SecretsManager
+
+    @classmethod
+    def capture(cls) -> OutputReferenceContext:
+        """Resolve the current project's metadata directory and directory macros."""
+        directories: dict[str, str] = {}
+        project_result = GriptapeNodes.handle_request(GetCurrentProjectRequest())
+        if isinstance(project_result, GetCurrentProjectResultSuccess):
+            for name in project_result.project_info.template.directories:
+                path_result = GriptapeNodes.handle_request(
+                    GetPathForMacroRequest(parsed_macro=ParsedMacro(f"{{{name}}}"), variables={})
+                )
+                if isinstance(path_result, GetPathForMacroResultSuccess):
+                    directories[name] = Path(path_result.resolved_path).as_posix()
+
+        return cls(
+            metadata_dir_name=get_metadata_dir_name(),
+            directories=directories,
+            secrets_manager=GriptapeNodes.SecretsManager(),
+        )
+
+
+class DeadlineCloudSelectiveOutputDownloader(OutputDownloader):
+    """Downloads only the job outputs that a workflow's results actually reference.
+
+    The output manifests are read up front, as with `OutputDownloader`. Instead of downloading
+    every output file, the result files are downloaded first, then only the output files they
+    reference (and those files' metadata sidecars). Other outputs can still be fetched later
+    on demand with `download_paths`.
+
+    Static files that the worker seeded into the output directory and that came back unchanged
+    can be dropped from the outputs with `exclude_seeded_inputs`, so that they are never downloaded.
+    """
+
+    def exclude_seeded_inputs(self, output_dir_subdir: str) -> int:
+        """Drop the outputs that are unchanged copies of the static files seeded into the output directory.
+
+        The worker copies the bundle's baseline manifest of the seeded files' hashes to the output directory.
+        Outputs whose hash matches the baseline are removed from `outputs_by_root`, and are then
+        skipped by every download method. Without a baseline manifest, nothing is excluded.
+
+        Args:
+            output_dir_subdir: The job's output subdirectory within the output directory.
+
+        Returns:
+            The number of outputs excluded.
+        """
+        output_segment = f"output/{output_dir_subdir}/"
+        baseline_path = f"{output_segment}{SEEDED_INPUTS_MANIFEST_FILE_NAME}"
+        if not any(baseline_path in paths for paths in self.get_output_paths_by_root().values()):
+            return 0
+
+        baseline: dict[str, Any] = {}
+        downloaded_by_root = self.download_paths(
+            {baseline_path}, file_conflict_resolution=FileConflictResolution.OVERWRITE
+        )
+        for root in downloaded_by_root:
+            local_path = Path(root) / baseline_path
+            try:
+                with local_path.open(encoding="utf-8") as f:
+                    baseline = json.load(f)
+            except (OSError, ValueError) as e:
+                logger.warning("Failed to read seeded inputs manifest %s: %s", local_path, e)
+            local_path.unlink(missing_ok=True)
+
+        seeded_hashes: dict[str, str] = baseline.get("files", {})
+        baseline_hash_alg = baseline.get("hash_alg")
+        excluded = 0
+        for path_group in self.outputs_by_root.values():
+            for hash_alg, manifest_paths in path_group.files_by_hash_alg.items():
+                kept = []
+                for manifest_path in manifest_paths:
+                    relative_path = manifest_path.path.removeprefix(output_segment)
+                    if manifest_path.path == baseline_path or (
+                        getattr(hash_alg, "value", hash_alg) == baseline_hash_alg
+                        and manifest_path.path.startswith(output_segment)
+                        and seeded_hashes.get(relative_path) == manifest_path.hash
+                    ):
+                        path_group.total_bytes -= getattr(manifest_path, "size", 0) or 0
+                        excluded += 1
+                    else:
+                        kept.append(manifest_path)
+                manifest_paths[:] = kept
+
+        logger.info("Excluded %d unchanged seeded input file(s) from the job outputs", excluded)
+        return excluded
+
+    def download_paths(
+        self,
+        relative_paths: set[str],
+        file_conflict_resolution: FileConflictResolution | None = FileConflictResolution.CREATE_COPY,
+        on_downloading_files: Callable[[ProgressReportMetadata], bool] | None = None,
+    ) -> dict[str, list[str]]:
+        """Download the given output files, identified by their paths relative to their asset root.
+
+        Args:
+            relative_paths: Output paths, relative to their asset root, to download.
+            file_conflict_resolution: Resolution method for files that already exist locally.
+            on_downloading_files: Callback periodically reporting download progress; returns False to cancel.
+
+        Returns:
+            A dict of asset root paths to the relative paths that were downloaded under them.
+        """
+        selected_by_root: dict[str, dict[Any, list[Any]]] = {}
+        total_files = 0
+        total_bytes = 0
+        for root, path_group in self.outputs_by_root.items():
+            for hash_alg, manifest_paths in path_group.files_by_hash_alg.items():
+                selected = [path for path in manifest_paths if path.path in relative_paths]
+                if not selected:
+                    continue
+                _ensure_paths_within_root(root, [path.path for path in selected])
+                selected_by_root.setdefault(root, {})[hash_alg] = selected
+                total_files += len(selected)
+                total_bytes += sum(getattr(path, "size", 0) or 0 for path in selected)
+
+        progress_tracker = ProgressTracker(
+            status=ProgressStatus.DOWNLOAD_IN_PROGRESS,
+            total_files=total_files,
+            total_bytes=total_bytes,
+            on_progress_callback=on_downloading_files,
+        )
+
+        downloaded_by_root: dict[str, list[str]] = {}
+        for root, selected_by_hash_alg in selected_by_root.items():
+            for hash_alg, selected in selected_by_hash_alg.items():
+                download_files(
+                    files=selected,
+                    hash_algorithm=hash_alg,
+                    local_download_dir=root,
+                    s3_settings=self.s3_settings,
+                    session=self.session,
+                    progress_tracker=progress_tracker,
+                    file_conflict_resolution=file_conflict_resolution,
+                )
+                downloaded_by_root.setdefault(root, []).extend(path.path for path in selected)
+
+        logger.info("Downloaded %d of the job's output files (%d bytes)", total_files, total_bytes)
+        return downloaded_by_root
+
+    def download_referenced_outputs(
+        self,
+        output_dir_subdir: str,
+        is_result_file: Callable[[str], bool],
+        on_downloading_files: Callable[[ProgressReportMetadata], bool] | None = None,
+        reference_context: OutputReferenceContext | None = None,
+    ) -> dict[str, list[str]]:
+        """Download the result files, then only the outputs those results reference.
+
+        Args:
+            output_dir_subdir: The job's output subdirectory within the output directory.
+            is_result_file: Predicate selecting result files (e.g. workflow_output.json) by relative path.
+            on_downloading_files: Callback periodically reporting download progress; returns False to cancel.
+            reference_context: Project state used to find referenced outputs. Required when called
+                off the engine's thread; captured on the spot otherwise.
+
+        Returns:
+            A dict of asset root paths to the relative paths that were downloaded under them, in the
+            same shape as `get_output_paths_by_root`.
+        """
+        output_segment = f"output/{output_dir_subdir}/"
+        if reference_context is None:
+            reference_context = OutputReferenceContext.capture()
+        self.exclude_seeded_inputs(output_dir_subdir)
+        all_paths = {path for paths in self.get_output_paths_by_root().values() for path in paths}
+
+        # 1. Result files
+        result_paths = {path for path in all_paths if is_result_file(path)}
+        downloaded_by_root = self.download_paths(result_paths, on_downloading_files=on_downloading_files)
+
+        results: list[Any] = []
+        for root, paths in downloaded_by_root.items():
+            for path in paths:
+                try:
+                    with (Path(root) / path).open(encoding="utf-8") as f:
+                        results.append(json.load(f))
+                except (OSError, ValueError) as e:
+                    logger.warning("Failed to read result file %s: %s", path, e)
+
+        # 2. Files the results reference, plus their metadata sidecars
+        outputs_in_dir = {path[len(output_segment) :] for path in all_paths if path.startswith(output_segment)}
+        referenced = _collect_referenced_outputs(results, output_segment, outputs_in_dir, reference_context)
+        metadata_dir_name = reference_context.metadata_dir_name
+        if metadata_dir_name is not None:
+            referenced |= {f"{metadata_dir_name}/{path}.json" for path in referenced} & outputs_in_dir
+
+        referenced_paths = {f"{output_segment}{path}" for path in referenced} - result_paths
+        if referenced_paths:
+            for root, paths in self.download_paths(referenced_paths, on_downloading_files=on_downloading_files).items():
+                downloaded_by_root.setdefault(root, []).extend(paths)
+
+        skipped = len(all_paths) - len(result_paths) - len(referenced_paths)
+        logger.info("Skipped downloading %d unreferenced output file(s)", skipped)
+        return downloaded_by_root
+
+
+def _collect_referenced_outputs(
+    value: Any, output_segment: str, outputs_in_dir: set[str], reference_context: OutputReferenceContext
+) -> set[str]:
+    """Find the output files, relative to the output directory, that a result value references.
+
+    Files can be referenced by a worker path, by a static files URL, or by a macro path such as
+    "{outputs}/image.png".
+    """
+    static_files_by_subpath: dict[str, str] = {}
+    for path in outputs_in_dir:
+        if STATIC_FILES_SEGMENT in path:
+            static_files_by_subpath[path[path.index(STATIC_FILES_SEGMENT) + len(STATIC_FILES_SEGMENT) :]] = path
+
+    referenced: set[str] = set()
+
+    def visit_value(val: Any) -> None:
+        if isinstance(val, str):
+            referenced.update(
+                _get_referenced_outputs(val, output_segment, outputs_in_dir, static_files_by_subpath, reference_context)
+            )
+        elif isinstance(val, dict):
+            for v in val.values():
+                visit_value(v)
+        elif isinstance(val, list):
+            for item in val:
+                visit_value(item)
+
+    visit_value(value)
+    return referenced
+
+
+def _get_referenced_outputs(
+    value: str,
+    output_segment: str,
+    outputs_in_dir: set[str],
+    static_files_by_subpath: dict[str, str],
+    reference_context: OutputReferenceContext,
+) -> set[str]:
+    """Find the output files a single string value references."""
+    referenced: set[str] = set()
+
+    if output_segment in value:
+        relative_path = value[value.index(output_segment) + len(output_segment) :]
+        if relative_path in outputs_in_dir:
+            referenced.add(relative_path)
+
+    if STATIC_FILES_SEGMENT in value:
+        # Static file URLs may carry a cache-busting query string
+        subpath = value[value.index(STATIC_FILES_SEGMENT) + len(STATIC_FILES_SEGMENT) :].split("?", 1)[0]
+        if subpath in static_files_by_subpath:
+            referenced.add(static_files_by_subpath[subpath])
+
+    if "{" in value and "}" in value:
+        relative_path = _resolve_macro_relative_path(value, reference_context)
+        if relative_path is not None and relative_path in outputs_in_dir:
+            referenced.add(relative_path)
+
+    return referenced
+
+
+def _resolve_macro_relative_path(macro_string: str, reference_context: OutputReferenceContext) -> str | None:
+    """Resolve a macro path such as "{outputs}/image.png" to the relative path a worker would have written.
+
+    Only the project's directory macros are substituted, from the captured context, so this makes no
+    engine requests.
+    """
+    try:
+        parsed = ParsedMacro(macro_string)
+        if not parsed.get_variables():
+            return None
+
+        resolved_path = parsed.resolve(reference_context.directories, reference_context.secrets_manager)
+    except Exception:
+        return None
+
+    return Path(resolved_path).as_posix()
+
+
+def _ensure_paths_within_root(root: str, relative_paths: list[str]) -> None:
+    """Refuse to download output files whose manifest paths escape their asset root."""
+    root_path = os.path.normpath(Path(root).absolute())
+    for relative_path in relative_paths:
+        full_path = os.path.normpath(Path(root_path) / relative_path)
+        if os.path.commonpath([root_path, full_path]) != root_path:
+            msg = f"The output path is not under its asset root {root}: {relative_path}"
+            raise ValueError(msg)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import copy
+import hashlib
 import json
 import logging
 import os
@@ -12,20 +13,27 @@ from typing import TYPE_CHECKING, Any
 from uuid import uuid4
 
 from botocore.exceptions import BotoCoreError, ClientError
-from deadline.client.api import get_queue_user_boto3_session
-from deadline.job_attachments.download import OutputDownloader
-from deadline.job_attachments.models import JobAttachmentS3Settings
 from griptape_nodes.exe_types.core_types import Parameter, ParameterGroup, ParameterMessage, ParameterMode
 from griptape_nodes.exe_types.node_types import AsyncResult, SuccessFailureNode
 from griptape_nodes.exe_types.param_components.execution_status_component import ExecutionStatusComponent
-from griptape_nodes.files.file import File, FileWriteError
+from griptape_nodes.files.file import FileDestination, FileWriteError
 from griptape_nodes.retained_mode.events.os_events import (
     CopyFileRequest,
     CopyFileResultSuccess,
 )
 from griptape_nodes.retained_mode.griptape_nodes import GriptapeNodes
+from publish import DEADLINE_CLOUD_LIBRARY_CONFIG_KEY
 from publish.base_deadline_cloud import BaseDeadlineCloud
+from publish.deadline_cloud_job_poll_coordinator import DeadlineCloudJobPollCoordinator
 from publish.deadline_cloud_job_poller import DeadlineCloudJobDetails, DeadlineCloudJobPoller
+from publish.deadline_cloud_job_template_generator import DeadlineCloudJobTemplateGenerator
+from publish.deadline_cloud_output_downloader import DeadlineCloudSelectiveOutputDownloader
+from publish.deadline_cloud_published_workflow_batcher import (
+    DeadlineCloudPublishedWorkflowBatcher,
+    PublishedWorkflowBatch,
+    PublishedWorkflowBatchTask,
+    PublishedWorkflowInvocation,
+)
 from publish.parameters.deadline_cloud_host_config_parameter import DeadlineCloudHostConfigParameter
 from publish.parameters.deadline_cloud_job_attachments_config_parameter import (
     DeadlineCloudJobAttachmentsConfigParameter,
@@ -34,9 +42,11 @@ from publish.parameters.deadline_cloud_job_submission_config_advanced_parameter
     DeadlineCloudJobSubmissionConfigAdvancedParameter,
 )
 from publish.parameters.deadline_cloud_job_submission_config_parameter import DeadlineCloudJobSubmissionConfigParameter
-from publish.utils import collect_metadata_sidecars, write_sidecar_output_files
+from publish.utils import collect_metadata_sidecars, finalize_downloaded_file, write_sidecar_output_files
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from deadline.job_attachments.models import StorageProfile
 
 
@@ -296,14 +306,20 @@ class DeadlineCloudPublishedWorkflow(SuccessFailureNode, BaseDeadlineCloud):
 
         return job_id
 
-    def _poll_job(self, job_id: str, queue_id: str, farm_id: str) -> Any:
-        def status_callback(job_details: DeadlineCloudJobDetails, elapsed_time: float) -> None:
-            self.append_value_to_parameter(
-                parameter_name=self.status_component._result_details.name,
-                value=f"\nJob Status - Lifecycle: {job_details.lifecycle_status}, Task Status: {job_details.task_run_status}, Elapsed Time: {elapsed_time}s",
-            )
+    def _job_status_callback(self, job_details: DeadlineCloudJobDetails, elapsed_time: float) -> None:
+        self.append_value_to_parameter(
+            parameter_name=self.status_component._result_details.name,
+            value=f"\nJob Status - Lifecycle: {job_details.lifecycle_status}, Task Status: {job_details.task_run_status}, Elapsed Time: {elapsed_time}s",
+        )
 
-        poller = DeadlineCloudJobPoller(
+    def _create_job_poller(
+        self,
+        job_id: str,
+        queue_id: str,
+        farm_id: str,
+        status_callback: Callable[[DeadlineCloudJobDetails, float], None],
+    ) -> DeadlineCloudJobPoller:
+        return DeadlineCloudJobPoller(
             client=self._get_client(),
             config=self._get_config_parser(),
             job_id=job_id,
@@ -312,7 +328,10 @@ class DeadlineCloudPublishedWorkflow(SuccessFailureNode, BaseDeadlineCloud):
             max_poll_interval=10,
             status_callback=status_callback,
         )
-        return poller.poll_job()
+
+    def _poll_job(self, job_id: str, queue_id: str, farm_id: str) -> Any:
+        poller = self._create_job_poller(job_id, queue_id, farm_id, self._job_status_callback)
+        return DeadlineCloudJobPollCoordinator.get_instance().wait_for_job(self, poller)
 
     def _get_static_files_directory(self) -> Path:
         from griptape_nodes.retained_mode.griptape_nodes import GriptapeNodes
@@ -345,7 +364,7 @@ class DeadlineCloudPublishedWorkflow(SuccessFailureNode, BaseDeadlineCloud):
         local_output_path: str | None = None
         for local_root, output_files in output_paths.items():
             for output_file in output_files:
-                if output_file.startswith(output_segment):
+                if output_file.startswith(f"{output_segment}/"):
                     local_output_path = str(Path(local_root) / output_segment)
                     break
             if local_output_path:
@@ -393,12 +412,12 @@ class DeadlineCloudPublishedWorkflow(SuccessFailureNode, BaseDeadlineCloud):
         workflow_output = {}
         for root_path, output_files in output_paths.items():
             for output_file in output_files:
-                if output_file.endswith("workflow_output.json"):
+                if output_file == f"{output_segment}/workflow_output.json":
                     workflow_file_path = Path(root_path) / output_file
                     with workflow_file_path.open(encoding="utf-8") as f:
                         workflow_output = json.load(f)
                     workflow_file_path.unlink(missing_ok=True)
-                elif "staticfiles" in output_file and output_file.startswith(output_segment):
+                elif "staticfiles" in output_file and output_file.startswith(f"{output_segment}/"):
                     # Copy static files preserving subdirectory structure
                     static_file_path = Path(root_path) / output_file
                     static_dir = self._get_static_files_directory()
@@ -450,7 +469,7 @@ class DeadlineCloudPublishedWorkflow(SuccessFailureNode, BaseDeadlineCloud):
         downloaded_files: dict[str, Path] = {}
         for local_root, output_files in output_paths.items():
             for output_file in output_files:
-                if output_file.startswith(output_segment):
+                if output_file.startswith(f"{output_segment}/"):
                     relative_in_output = output_file[len(output_segment) + 1 :]
                     downloaded_files[relative_in_output] = Path(local_root) / output_file
 
@@ -521,21 +540,21 @@ class DeadlineCloudPublishedWorkflow(SuccessFailureNode, BaseDeadlineCloud):
         if source_path is None or not source_path.exists():
             return
 
-        self._write_file_with_macro(source_path.read_bytes(), macro_string)
+        self._write_file_with_macro(source_path, macro_string)
 
-    def _write_file_with_macro(self, file_bytes: bytes, macro_string: str) -> None:
+    def _write_file_with_macro(self, source_path: Path, macro_string: str) -> None:
         """Write a file using the macro string directly (fallback path).
 
         Args:
-            file_bytes: The file content to write.
+            source_path: The downloaded file to write.
             macro_string: A macro path string like "{outputs}/image.png".
         """
         try:
-            local_path = File(macro_string).write_bytes(file_bytes)
-        except FileWriteError as e:
+            local_file = finalize_downloaded_file(source_path, FileDestination(macro_string))
+        except (FileWriteError, OSError) as e:
             logger.warning("Failed to write macro output '%s': %s", macro_string, e)
         else:
-            logger.info("Wrote macro output '%s' -> '%s'", macro_string, local_path)
+            logger.info("Wrote macro output '%s' -> '%s'", macro_string, local_file.resolve())
 
     def _collect_input_parameters(self) -> dict[str, dict[str, Any]]:
         """Collect input parameters and structure them for the published workflow."""
@@ -558,24 +577,28 @@ class DeadlineCloudPublishedWorkflow(SuccessFailureNode, BaseDeadlineCloud):
 
         return input_json
 
-    def _get_workflow_output(self, farm_id: str, job_id: str, queue_id: str, output_dir_subdir: str) -> dict[str, Any]:
-        """Download and return the workflow output from the job."""
-        deadline_client = self._get_client()
-        queue_response = deadline_client.get_queue(farmId=farm_id, queueId=queue_id)
-        job_attachment_settings = JobAttachmentS3Settings(**queue_response["jobAttachmentSettings"])
-
-        queue_session = get_queue_user_boto3_session(
-            deadline_client,
-            None,
-            farm_id,
-            queue_id,
-        )
+    def _get_workflow_output(  # noqa: PLR0913
+        self,
+        farm_id: str,
+        job_id: str,
+        queue_id: str,
+        output_dir_subdir: str,
+        *,
+        step_id: str | None = None,
+        task_id: str | None = None,
+    ) -> dict[str, Any]:
+        """Download and return the workflow output from the job, or only from one of its tasks."""
+        queue_metadata = self._get_queue_metadata(farm_id, queue_id)
+        job_attachment_settings = queue_metadata.job_attachment_settings
+        queue_session = queue_metadata.queue_session
 
-        downloader = OutputDownloader(
+        downloader = DeadlineCloudSelectiveOutputDownloader(
             s3_settings=job_attachment_settings,
             farm_id=farm_id,
             queue_id=queue_id,
             job_id=job_id,
+            step_id=step_id,
+            task_id=task_id,
             session=queue_session,
         )
 
@@ -584,14 +607,24 @@ class DeadlineCloudPublishedWorkflow(SuccessFailureNode, BaseDeadlineCloud):
             return True  # Continue downloading
 
         try:
-            output = downloader.download_job_output(
-                on_downloading_files=on_download_progress,
-            )
-            logger.info(downloader.get_output_paths_by_root())
-            logger.info("Workflow output downloaded successfully.")
-            logger.info(output)
+            if self._get_config_value(DEADLINE_CLOUD_LIBRARY_CONFIG_KEY, "selective_output_download", default=True):
+                # Only workflow_output.json and the files it references
+                output_paths_by_root = downloader.download_referenced_outputs(
+                    output_dir_subdir,
+                    is_result_file=lambda path: path == f"output/{output_dir_subdir}/workflow_output.json",
+                    on_downloading_files=on_download_progress,
+                )
+                logger.info("Workflow output downloaded successfully.")
+            else:
+                downloader.exclude_seeded_inputs(output_dir_subdir)
+                output = downloader.download_job_output(
+                    on_downloading_files=on_download_progress,
+                )
+                logger.info(downloader.get_output_paths_by_root())
+                logger.info("Workflow output downloaded successfully.")
+                logger.info(output)
 
-            output_paths_by_root = downloader.get_output_paths_by_root()
+                output_paths_by_root = downloader.get_output_paths_by_root()
             return self._extract_workflow_output_from_output_paths(output_paths_by_root, output_dir_subdir)
         except Exception as e:
             details = f"Error downloading workflow output: {e}"
@@ -672,35 +705,44 @@ class DeadlineCloudPublishedWorkflow(SuccessFailureNode, BaseDeadlineCloud):
         storage_profile: StorageProfile | None = None,
     ) -> tuple[str, dict[str, Any]]:
         """Upload input JSON to S3 as a job attachment and return the relative path."""
+        input_dir, input_attachments = self._upload_input_files_to_s3(
+            {"input.json": input_json}, input_paths, output_paths, farm_id, queue_id, storage_profile=storage_profile
+        )
+        return str(input_dir / "input.json"), input_attachments
+
+    def _upload_input_files_to_s3(  # noqa: PLR0913
+        self,
+        input_jsons: dict[str, dict[str, Any]],
+        input_paths: list[str],
+        output_paths: list[str],
+        farm_id: str,
+        queue_id: str,
+        *,
+        storage_profile: StorageProfile | None = None,
+    ) -> tuple[Path, dict[str, Any]]:
+        """Write input JSON files into a new directory, upload them as job attachments and return the directory."""
         try:
             from publish.deadline_cloud_publisher import DeadlineCloudPublisher
 
             temp_dir = Path(tempfile.mkdtemp(prefix="input_json_"))
-            input_json_path = temp_dir / "input.json"
+            input_json_paths: list[str] = []
+            for file_name, input_json in input_jsons.items():
+                input_json_path = temp_dir / file_name
+                with input_json_path.open("w", encoding="utf-8") as f:
+                    json.dump(input_json, f, indent=2)
+                input_json_paths.append(str(input_json_path))
 
-            with input_json_path.open("w", encoding="utf-8") as f:
-                json.dump(input_json, f, indent=2)
+            logger.info("Created %d input JSON file(s) in: %s", len(input_json_paths), temp_dir)
+            input_paths.extend(input_json_paths)
 
-            logger.info("Created input JSON file at: %s", input_json_path)
-            input_paths.append(str(input_json_path))
-
-            deadline_client = self._get_client()
-
-            queue_response = deadline_client.get_queue(farmId=farm_id, queueId=queue_id)
-            job_attachment_settings = JobAttachmentS3Settings(**queue_response["jobAttachmentSettings"])
-
-            queue_session = get_queue_user_boto3_session(
-                deadline_client,
-                None,
-                farm_id,
-                queue_id,
-            )
-            queue_session._session.set_config_variable("region", self._session.region_name)
+            queue_metadata = self._get_queue_metadata(farm_id, queue_id)
+            job_attachment_settings = queue_metadata.job_attachment_settings
+            queue_session = queue_metadata.queue_session
 
             # 1. Upload job input JSON as job attachment
             logger.info("Uploading input JSON to S3 as job attachment")
             input_attachments = DeadlineCloudPublisher.upload_paths_as_job_attachments(
-                input_paths=[str(input_json_path)],
+                input_paths=input_json_paths,
                 output_paths=[],
                 farm_id=farm_id,
                 queue_id=queue_id,
@@ -725,8 +767,8 @@ class DeadlineCloudPublishedWorkflow(SuccessFailureNode, BaseDeadlineCloud):
 
             logger.info("Job attachments uploaded successfully to S3")
 
-            # Return the relative path and the attachments
-            return str(input_json_path), input_attachments.to_dict()
+            # Return the input directory and the attachments
+            return temp_dir, input_attachments.to_dict()
         except Exception as e:
             details = f"Error uploading input JSON to S3: {e}"
             logger.error(details)
@@ -800,11 +842,144 @@ class DeadlineCloudPublishedWorkflow(SuccessFailureNode, BaseDeadlineCloud):
     def _generate_output_subdir(self) -> str:
         return uuid4().hex
 
-    def _process(self) -> None:
+    def _get_job_parameters(
+        self, attachments: dict[str, Any], relative_dir_path: str, models_dir_path: str, output_dir_subdir: str
+    ) -> dict[str, Any]:
+        """Get the job parameters shared by single and batched submissions, without the input parameter."""
+        return {
+            "DataDir": {"path": str(attachments["manifests"][0]["rootPath"])},
+            "LocationToRemap": {"path": relative_dir_path},
+            "ModelsLocationToRemap": {"path": models_dir_path},
+            "OutputDir": {"string": output_dir_subdir},
+            "CondaChannels": {"string": self.get_parameter_value("conda_channels")},
+            "CondaPackages": {"string": self._ensure_conda_git(self.get_parameter_value("conda_packages"))},
+        }
+
+    def _get_batch_key(self, **batch_values: Any) -> str:
+        """Build the key identifying the invocations that can be submitted together as one job."""
+        batch_values["submission_options"] = {
+            name: self.get_parameter_value(name)
+            for name in ("priority", "max_failed_tasks", "max_task_retries", "initial_state", "conda_channels")
+        }
+        batch_values["conda_packages"] = self._ensure_conda_git(self.get_parameter_value("conda_packages"))
+        return hashlib.sha256(json.dumps(batch_values, sort_keys=True, default=str).encode()).hexdigest()
+
+    def _submit_batched_invocation(  # noqa: PLR0913
+        self,
+        *,
+        input_json: dict[str, Any],
+        attachments: dict[str, Any],
+        job_template: dict[str, Any],
+        relative_dir_path: str,
+        models_dir_path: str,
+        farm_id: str,
+        queue_id: str,
+        storage_profile: StorageProfile | None,
+        attachment_input_paths: list[str],
+        attachment_output_paths: list[str],
+        window: float,
+    ) -> PublishedWorkflowBatchTask:
+        """Submit this invocation together with concurrent invocations of the same published workflow.
+
+        Invocations that share the job template, attachments, queue and submission options within
+        the batch window are submitted as one job with a task per invocation.
+
+        Returns:
+            The task that runs this invocation.
+        """
+
+        def submit_batch(invocations: list[PublishedWorkflowInvocation]) -> PublishedWorkflowBatch:
+            input_dir, input_attachments = self._upload_input_files_to_s3(
+                {f"input_{index}.json": invocation.input_json for index, invocation in enumerate(invocations)},
+                list(attachment_input_paths),
+                list(attachment_output_paths),
+                farm_id,
+                queue_id,
+                storage_profile=storage_profile,
+            )
+            output_dir_subdir = self._generate_output_subdir()
+            job_parameters = self._get_job_parameters(
+                attachments, relative_dir_path, models_dir_path, output_dir_subdir
+            )
+            job_parameters["InputDir"] = {"path": str(input_dir)}
+
+            job_id = self._submit_job_with_attachments(
+                attachments=self._combine_attachments(attachments, input_attachments),
+                farm_id=farm_id,
+                queue_id=queue_id,
+                job_template=DeadlineCloudJobTemplateGenerator.generate_batched_job_template(
+                    job_template, len(invocations)
+                ),
+                job_parameters=job_parameters,
+                storage_profile=storage_profile,
+            )
+
+            def status_callback(job_details: DeadlineCloudJobDetails, elapsed_time: float) -> None:
+                for invocation in invocations:
+                    if invocation.status_callback is not None:
+                        invocation.status_callback(job_details, elapsed_time)
+
+            poller = self._create_job_poller(job_id, queue_id, farm_id, status_callback)
+            return PublishedWorkflowBatch(
+                job_id=job_id,
+                output_dir_subdir=output_dir_subdir,
+                input_dir=input_dir,
+                completion=DeadlineCloudJobPollCoordinator.get_instance().register(self, poller),
+            )
+
+        batch_key = self._get_batch_key(
+            attachments=attachments,
+            job_template=job_template,
+            relative_dir_path=relative_dir_path,
+            models_dir_path=models_dir_path,
+            farm_id=farm_id,
+            queue_id=queue_id,
+            storage_profile_id=storage_profile.storageProfileId if storage_profile is not None else None,
+            attachment_input_paths=attachment_input_paths,
+            attachment_output_paths=attachment_output_paths,
+        )
+        invocation = PublishedWorkflowInvocation(input_json=input_json, status_callback=self._job_status_callback)
+        future = DeadlineCloudPublishedWorkflowBatcher.get_instance().submit(
+            batch_key, invocation, submit_batch, window
+        )
+        return future.result()
+
+    def _get_batch_task_ids(
+        self, batch_task: PublishedWorkflowBatchTask, farm_id: str, queue_id: str
+    ) -> tuple[str, str]:
+        """Return the (step ID, task ID) of the task that ran a batched invocation.
+
+        The batch job's tasks are listed once per batch, by whichever invocation asks first.
+        """
+        batch = batch_task.batch
+        with batch.task_ids_lock:
+            if not batch.task_ids_by_index:
+                client = self._get_client()
+                step_pages = client.get_paginator("list_steps").paginate(
+                    farmId=farm_id, queueId=queue_id, jobId=batch.job_id
+                )
+                for step in (step for page in step_pages for step in page.get("steps", [])):
+                    task_pages = client.get_paginator("list_tasks").paginate(
+                        farmId=farm_id, queueId=queue_id, jobId=batch.job_id, stepId=step["stepId"]
+                    )
+                    for task in (task for page in task_pages for task in page.get("tasks", [])):
+                        task_index = task.get("parameters", {}).get("TaskIndex", {}).get("int")
+                        if task_index is not None:
+                            batch.task_ids_by_index[int(task_index)] = (step["stepId"], task["taskId"])
+
+        task_ids = batch.task_ids_by_index.get(batch_task.task_index)
+        if task_ids is None:
+            msg = f"Job {batch.job_id} has no task with TaskIndex {batch_task.task_index}"
+            raise RuntimeError(msg)
+        return task_ids
+
+    def _process(self) -> None:  # noqa: PLR0915
         # Reset execution state and result details at the start of each run
         self._clear_execution_status()
         input_path: Path | None = None
         output_path: Path | None = None
+        step_id: str | None = None
+        task_id: str | None = None
 
         try:
             attachments = self.get_parameter_value("attachments")
@@ -817,7 +992,6 @@ class DeadlineCloudPublishedWorkflow(SuccessFailureNode, BaseDeadlineCloud):
             attachment_input_paths = self.get_parameter_value("attachment_input_paths") or []
             attachment_output_paths = self.get_parameter_value("attachment_output_paths") or []
 
-            root_dir = str(attachments["manifests"][0]["rootPath"])
             input_json = self._collect_input_parameters()
             output_dir_subdir = self._generate_output_subdir()
             output_path = Path(relative_dir_path) / "output" / output_dir_subdir
@@ -833,46 +1007,72 @@ class DeadlineCloudPublishedWorkflow(SuccessFailureNode, BaseDeadlineCloud):
                 str(Path(os.path.normpath(Path(path_str).absolute()))) for path_str in attachment_output_paths
             ]
 
-            logger.info("Uploading attachments")
-            input_json_path, input_attachments = self._upload_attachments_to_s3(
-                input_json, attachment_input_paths, attachment_output_paths, farm_id, queue_id, storage_profile
-            )
-            input_path = Path(input_json_path).parent
-
-            # Combine the original attachments with the input JSON attachments
-            combined_attachments = self._combine_attachments(attachments, input_attachments)
-
-            job_parameters = {
-                "InputFile": {"path": input_json_path},
-                "DataDir": {"path": root_dir},
-                "LocationToRemap": {"path": relative_dir_path},
-                "ModelsLocationToRemap": {"path": models_dir_path},
-                "OutputDir": {"string": output_dir_subdir},
-                "CondaChannels": {"string": self.get_parameter_value("conda_channels")},
-                "CondaPackages": {"string": self._ensure_conda_git(self.get_parameter_value("conda_packages"))},
-            }
-
             job_template = self._reconcile_job_template(job_template)
-            job_id = self._submit_job_with_attachments(
-                attachments=combined_attachments,
-                farm_id=farm_id,
-                queue_id=queue_id,
-                job_template=job_template,
-                job_parameters=job_parameters,
-                storage_profile=storage_profile,
+            batch_window = float(
+                self._get_config_value(
+                    DEADLINE_CLOUD_LIBRARY_CONFIG_KEY, "published_workflow_batch_window_seconds", default=0
+                )
             )
+            if batch_window > 0 and DeadlineCloudJobTemplateGenerator.can_batch_job_template(job_template):
+                batch_task = self._submit_batched_invocation(
+                    input_json=input_json,
+                    attachments=attachments,
+                    job_template=job_template,
+                    relative_dir_path=relative_dir_path,
+                    models_dir_path=models_dir_path,
+                    farm_id=farm_id,
+                    queue_id=queue_id,
+                    storage_profile=storage_profile,
+                    attachment_input_paths=attachment_input_paths,
+                    attachment_output_paths=attachment_output_paths,
+                    window=batch_window,
+                )
+                job_id = batch_task.batch.job_id
+                output_dir_subdir = batch_task.output_dir_subdir
+                output_path = Path(relative_dir_path) / "output" / output_dir_subdir
+                input_json_path = str(batch_task.batch.input_dir / f"input_{batch_task.task_index}.json")
+                input_path = batch_task.batch.input_dir
+
+                # Every invocation in the batch waits on the same job, then downloads only its own task's outputs
+                batch_task.batch.completion.result()
+                step_id, task_id = self._get_batch_task_ids(batch_task, farm_id, queue_id)
+            else:
+                logger.info("Uploading attachments")
+                input_json_path, input_attachments = self._upload_attachments_to_s3(
+                    input_json, attachment_input_paths, attachment_output_paths, farm_id, queue_id, storage_profile
+                )
+                input_path = Path(input_json_path).parent
 
-            self._poll_job(
-                job_id=job_id,
-                queue_id=queue_id,
-                farm_id=farm_id,
-            )
+                # Combine the original attachments with the input JSON attachments
+                combined_attachments = self._combine_attachments(attachments, input_attachments)
+
+                job_parameters = self._get_job_parameters(
+                    attachments, relative_dir_path, models_dir_path, output_dir_subdir
+                )
+                job_parameters["InputFile"] = {"path": input_json_path}
+
+                job_id = self._submit_job_with_attachments(
+                    attachments=combined_attachments,
+                    farm_id=farm_id,
+                    queue_id=queue_id,
+                    job_template=job_template,
+                    job_parameters=job_parameters,
+                    storage_profile=storage_profile,
+                )
+
+                self._poll_job(
+                    job_id=job_id,
+                    queue_id=queue_id,
+                    farm_id=farm_id,
+                )
 
             output = self._get_workflow_output(
                 farm_id=farm_id,
                 job_id=job_id,
                 queue_id=queue_id,
                 output_dir_subdir=output_dir_subdir,
+                step_id=step_id,
+                task_id=task_id,
             )
             self._map_output_parameters(output)
 
@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import logging
+import threading
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, ClassVar
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
+    from publish.deadline_cloud_job_poller import DeadlineCloudJobDetails
+
+
+logger = logging.getLogger("deadline_cloud_published_workflow_batcher")
+
+# Upper bound on the number of invocations submitted together as one job
+MAX_BATCH_SIZE = 256
+
+
+@dataclass
+class PublishedWorkflowInvocation:
+    """A single published workflow execution waiting to be submitted as part of a batch."""
+
+    input_json: dict[str, Any]
+    status_callback: Callable[[DeadlineCloudJobDetails, float], None] | None = None
+
+
+@dataclass
+class PublishedWorkflowBatch:
+    """A submitted batch job, shared by every invocation in it.
+
+    `task_ids_by_index` maps each task's TaskIndex to its (step ID, task ID) once the job's tasks
+    have been listed; it is filled once per batch, under `task_ids_lock`.
+    """
+
+    job_id: str
+    output_dir_subdir: str
+    input_dir: Path
+    completion: Future = field(default_factory=Future)
+    task_ids_by_index: dict[int, tuple[str, str]] = field(default_factory=dict)
+    task_ids_lock: threading.Lock = field(default_factory=threading.Lock)
+
+
+@dataclass
+class PublishedWorkflowBatchTask:
+    """The task that runs one invocation of a submitted batch."""
+
+    batch: PublishedWorkflowBatch
+    task_index: int
+
+    @property
+    def output_dir_subdir(self) -> str:
+        """The output subdirectory the task writes its outputs to."""
+        return f"{self.batch.output_dir_subdir}/{self.task_index}"
+
+
+@dataclass
+class _PendingBatch:
+    """Invocations collected for a batch that has not been submitted yet."""
+
+    submit_batch: Callable[[list[PublishedWorkflowInvocation]], PublishedWorkflowBatch]
+    invocations: list[PublishedWorkflowInvocation] = field(default_factory=list)
+    futures: list[Future] = field(default_factory=list)
+    submitted: bool = False
+
+
+class DeadlineCloudPublishedWorkflowBatcher:
+    """Process-wide batcher that submits concurrent invocations of a published workflow as one job.
+
+    Invocations are grouped under a key identifying everything that must be identical for them
+    to share a job: the job template, attachments, target queue and submission options. The first
+    invocation of a group opens a short collection window; once it closes (or the batch is full),
+    the group is submitted as a single job with one task per invocation, using the `submit_batch`
+    callback of the invocation that opened it.
+
+    Each invocation receives the task that runs it, from which it can wait for the shared job and
+    download only its own outputs.
+    """
+
+    _instance: ClassVar[DeadlineCloudPublishedWorkflowBatcher | None] = None
+    _instance_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(self) -> None:
+        self._pending: dict[str, _PendingBatch] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def get_instance(cls) -> DeadlineCloudPublishedWorkflowBatcher:
+        """Return the process-wide batcher instance."""
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls()
+            return cls._instance
+
+    def submit(
+        self,
+        batch_key: str,
+        invocation: PublishedWorkflowInvocation,
+        submit_batch: Callable[[list[PublishedWorkflowInvocation]], PublishedWorkflowBatch],
+        window: float,
+    ) -> Future:
+        """Add an invocation to the open batch for its key, opening one if needed.
+
+        Args:
+            batch_key: Identifies the invocations that can share a job.
+            invocation: The invocation to submit.
+            submit_batch: Submits a batch of invocations as one job; used if this invocation opens the batch.
+            window: Time, in seconds, to collect further invocations before submitting.
+
+        Returns:
+            A future resolved with the invocation's `PublishedWorkflowBatchTask`, or with the error
+            raised while submitting the batch.
+        """
+        future: Future = Future()
+        full_batch: _PendingBatch | None = None
+
+        with self._lock:
+            pending = self._pending.get(batch_key)
+            if pending is None:
+                pending = _PendingBatch(submit_batch=submit_batch)
+                self._pending[batch_key] = pending
+                timer = threading.Timer(window, self._submit_pending, args=(batch_key, pending))
+                timer.daemon = True
+                timer.start()
+
+            pending.invocations.append(invocation)
+            pending.futures.append(future)
+            if len(pending.invocations) >= MAX_BATCH_SIZE:
+                full_batch = pending
+
+        if full_batch is not None:
+            self._submit_pending(batch_key, full_batch)
+
+        return future
+
+    def _submit_pending(self, batch_key: str, pending: _PendingBatch) -> None:
+        """Submit a pending batch, unless it was already submitted."""
+        with self._lock:
+            if pending.submitted:
+                return
+            pending.submitted = True
+            if self._pending.get(batch_key) is pending:
+                del self._pending[batch_key]
+
+        logger.info("Submitting %d published workflow invocation(s) as one job", len(pending.invocations))
+        try:
+            batch = pending.submit_batch(pending.invocations)
+        except Exception as e:
+            for future in pending.futures:
+                future.set_exception(e)
+            return
+
+        for task_index, future in enumerate(pending.futures):
+            future.set_result(PublishedWorkflowBatchTask(batch=batch, task_index=task_index))
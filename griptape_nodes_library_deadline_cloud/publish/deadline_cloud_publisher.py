@@ -1,28 +1,29 @@
 from __future__ import annotations
 
+import compileall
 import importlib.metadata
+import io
 import json
 import logging
 import os
+import py_compile
 import subprocess
-import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Literal, TypeVar, cast
 from urllib.parse import urljoin
 
 import semver
 from botocore.exceptions import BotoCoreError, ClientError
-from deadline.client.api import get_queue_user_boto3_session
 from deadline.client.config import get_setting_default
 from deadline.client.config.config_file import get_cache_directory
-from deadline.job_attachments.models import Attachments, JobAttachmentS3Settings
 from deadline.job_attachments.upload import S3AssetManager, S3AssetUploader
 from dotenv import set_key
 from dotenv.main import DotEnv
 from griptape_nodes.common.macro_parser import ParsedMacro
 from griptape_nodes.exe_types.node_types import BaseNode, StartNode
 from griptape_nodes.node_library.library_registry import LibraryNameAndVersion, LibraryRegistry
-from griptape_nodes.node_library.workflow_registry import Workflow, WorkflowRegistry
+from griptape_nodes.node_library.workflow_registry import LibraryNameAndNodeType, Workflow, WorkflowRegistry
 from griptape_nodes.retained_mode.events.app_events import (
     GetEngineVersionRequest,
     GetEngineVersionResultSuccess,
@@ -41,8 +42,6 @@ from griptape_nodes.retained_mode.events.node_events import (
 from griptape_nodes.retained_mode.events.os_events import (
     CopyFileRequest,
     CopyFileResultSuccess,
-    CopyTreeRequest,
-    CopyTreeResultSuccess,
 )
 from griptape_nodes.retained_mode.events.parameter_events import (
     GetParameterValueRequest,
@@ -71,9 +70,13 @@ from griptape_nodes.retained_mode.griptape_nodes import (
 from huggingface_hub.constants import HF_HUB_CACHE
 from publish import DEADLINE_CLOUD_LIBRARY_CONFIG_KEY, LIBRARY_NAME
 from publish.base_deadline_cloud import BaseDeadlineCloud
+from publish.deadline_cloud_bundle_cache import BundleFingerprint, BundleHashIndex, DeadlineCloudBundleCache
+from publish.deadline_cloud_bundle_stager import DeadlineCloudBundleStager
 from publish.deadline_cloud_job_template_generator import (
+    SEEDED_INPUTS_MANIFEST_FILE_NAME,
     DeadlineCloudJobTemplateGenerator,
 )
+from publish.deadline_cloud_model_manifest_cache import DeadlineCloudModelManifestCache
 from publish.deadline_cloud_workflow_builder import (
     DeadlineCloudWorkflowBuilder,
     DeadlineCloudWorkflowBuilderInput,
@@ -84,9 +87,15 @@ if TYPE_CHECKING:
     from collections.abc import Callable
 
     from boto3 import Session
-    from deadline.job_attachments.models import StorageProfile
+    from deadline.job_attachments.models import (
+        Attachments,
+        JobAttachmentS3Settings,
+        ManifestProperties,
+        StorageProfile,
+    )
     from griptape_nodes.retained_mode.events.base_events import ResultPayload
     from griptape_nodes.retained_mode.managers.library_manager import LibraryManager
+    from huggingface_hub import HFCacheInfo
     from publish.deadline_cloud_start_flow import DeadlineCloudStartFlow
 
 
@@ -101,6 +110,15 @@ FILE_SELECTOR_LIBRARY_NAME = "Griptape Nodes Library"
 SELECT_FROM_PROJECT_NODE_TYPE = "SelectFromProject"
 SELECT_FROM_PROJECT_PARAM_NAME = "selected_path"
 
+# Directories never copied into a job bundle from library trees
+LIBRARY_IGNORE_PATTERNS = [".venv", "__pycache__"]
+
+# Suffix of the library JSON files, written next to the staged originals, that declare only the nodes a workflow uses
+TRIMMED_LIBRARY_FILE_SUFFIX = ".trimmed.json"
+
+# Model revisions hashed and uploaded concurrently when they are not in the model manifest cache
+MODEL_UPLOAD_MAX_WORKERS = 4
+
 
 class DeadlineCloudPublisher(BaseDeadlineCloud):
     def __init__(
@@ -123,6 +141,7 @@ class DeadlineCloudPublisher(BaseDeadlineCloud):
         self._farm_id: str | None = None
         self._queue_id: str | None = None
         self._workflow_nodes: list[BaseNode] | None = None
+        self._huggingface_cache_info: HFCacheInfo | None = None
 
     def publish_workflow(self) -> ResultPayload:
         try:
@@ -140,14 +159,16 @@ class DeadlineCloudPublisher(BaseDeadlineCloud):
             )
             self._create_run_input = self._gather_deadline_cloud_start_flow_input(workflow_shape)
 
-            # Package the workflow
-            self._emit_progress_event(10, "Packaging workflow...")
-            package_path = self._package_workflow(self._workflow_name)
-            logger.info("Workflow packaged to path: %s", package_path)
+            # The cached bundle is not changed by other publishes until its attachments are uploaded
+            with DeadlineCloudBundleCache().lock_bundle(self._workflow_name):
+                # Package the workflow
+                self._emit_progress_event(10, "Packaging workflow...")
+                package_path = self._package_workflow(self._workflow_name)
+                logger.info("Workflow packaged to path: %s", package_path)
 
-            # Publish the workflow to AWS Deadline Cloud
-            self._emit_progress_event(10, "Processing job attachments...")
-            job_attachment_settings, manifests = self._process_job_attachments(package_path)
+                # Publish the workflow to AWS Deadline Cloud
+                self._emit_progress_event(10, "Processing job attachments...")
+                job_attachment_settings, manifests = self._process_job_attachments(package_path)
             logger.info("Workflow '%s' published successfully to AWS Deadline Cloud", self._workflow_name)
 
             # Generate an executor workflow that can invoke the published structure
@@ -327,86 +348,49 @@ class DeadlineCloudPublisher(BaseDeadlineCloud):
         self,
         file_selector_nodes: list[tuple[str, str]],
         assets_dir: Path,
+        stager: DeadlineCloudBundleStager | None = None,
     ) -> None:
-        """Resolve macro paths from FileSelector nodes and copy files into the bundle.
+        """Resolve macro paths from FileSelector nodes and stage files into the bundle.
 
         For each FileSelector node:
         1. Parses the macro string to extract variable names (directory macros).
         2. Resolves the macro to an absolute local path via GetPathForMacroRequest.
-        3. Copies the file into assets/static_files/ preserving the resolved relative path.
+        3. Stages the file into assets/static_files/ preserving the resolved relative path.
 
         Args:
             file_selector_nodes: List of (node_name, macro_string) tuples.
             assets_dir: The assets directory within the job bundle.
+            stager: Stager to stage the files with. If omitted, the files are staged before returning;
+                otherwise they may still be staging until the stager is waited on.
         """
+        if stager is None:
+            with DeadlineCloudBundleStager() as own_stager:
+                self._resolve_and_copy_static_files(file_selector_nodes, assets_dir, own_stager)
+                own_stager.wait()
+            return
+
         static_files_dir = assets_dir / "static_files"
         static_files_dir.mkdir(parents=True, exist_ok=True)
 
         copied_files: set[Path] = set()
 
         for node_name, macro_string in file_selector_nodes:
-            # Parse the macro string
-            try:
-                parsed = ParsedMacro(macro_string)
-            except Exception:
-                logger.warning(
-                    "Failed to parse macro string '%s' from node '%s', skipping.",
-                    macro_string,
-                    node_name,
-                )
-                continue
-
-            # Resolve to absolute local path
-            resolve_result = GriptapeNodes.handle_request(GetPathForMacroRequest(parsed_macro=parsed, variables={}))
-            if not isinstance(resolve_result, GetPathForMacroResultSuccess):
-                logger.warning(
-                    "Failed to resolve macro path '%s' for node '%s': %s",
-                    macro_string,
-                    node_name,
-                    resolve_result,
-                )
+            resolve_result = self._resolve_static_file_path(node_name, macro_string)
+            if resolve_result is None:
                 continue
 
             absolute_path = resolve_result.absolute_path
             resolved_relative_path = resolve_result.resolved_path
 
-            if not absolute_path.exists():
-                logger.warning(
-                    "Resolved file does not exist: %s (from node '%s')",
-                    absolute_path,
-                    node_name,
-                )
-                continue
-
-            # Copy file or directory to static_files/ preserving the resolved relative path
+            # Stage file or directory to static_files/ preserving the resolved relative path
             if absolute_path not in copied_files:
                 dest = static_files_dir / resolved_relative_path
                 if absolute_path.is_dir():
-                    copy_tree_result = GriptapeNodes.handle_request(
-                        CopyTreeRequest(
-                            source_path=str(absolute_path),
-                            destination_path=str(dest),
-                            dirs_exist_ok=True,
-                        )
-                    )
-                    if not isinstance(copy_tree_result, CopyTreeResultSuccess):
-                        details = f"Failed to copy directory '{absolute_path}' to '{dest}' for node '{node_name}'."
-                        logger.error(details)
-                        raise RuntimeError(details)
+                    stager.stage_tree(absolute_path, dest)
                 else:
-                    dest.parent.mkdir(parents=True, exist_ok=True)
-                    copy_file_result = GriptapeNodes.handle_request(
-                        CopyFileRequest(
-                            source_path=str(absolute_path),
-                            destination_path=str(dest),
-                        )
-                    )
-                    if not isinstance(copy_file_result, CopyFileResultSuccess):
-                        details = f"Failed to copy file '{absolute_path}' to '{dest}' for node '{node_name}'."
-                        logger.error(details)
-                        raise RuntimeError(details)
+                    stager.stage_file(absolute_path, dest)
                 copied_files.add(absolute_path)
-                logger.debug("Copied static path: %s -> %s", absolute_path, dest)
+                logger.debug("Staging static path: %s -> %s", absolute_path, dest)
 
             logger.info(
                 "Bundled static file for %s.%s: %s -> %s",
@@ -416,6 +400,48 @@ class DeadlineCloudPublisher(BaseDeadlineCloud):
                 resolved_relative_path,
             )
 
+    def _resolve_static_file_path(self, node_name: str, macro_string: str) -> GetPathForMacroResultSuccess | None:
+        """Resolve a FileSelector node's macro path to an existing local path.
+
+        Args:
+            node_name: The name of the FileSelector node.
+            macro_string: The macro path string selected on the node.
+
+        Returns:
+            The resolved path result, or None if the macro cannot be resolved to an existing path.
+        """
+        # Parse the macro string
+        try:
+            parsed = ParsedMacro(macro_string)
+        except Exception:
+            logger.warning(
+                "Failed to parse macro string '%s' from node '%s', skipping.",
+                macro_string,
+                node_name,
+            )
+            return None
+
+        # Resolve to absolute local path
+        resolve_result = GriptapeNodes.handle_request(GetPathForMacroRequest(parsed_macro=parsed, variables={}))
+        if not isinstance(resolve_result, GetPathForMacroResultSuccess):
+            logger.warning(
+                "Failed to resolve macro path '%s' for node '%s': %s",
+                macro_string,
+                node_name,
+                resolve_result,
+            )
+            return None
+
+        if not resolve_result.absolute_path.exists():
+            logger.warning(
+                "Resolved file does not exist: %s (from node '%s')",
+                resolve_result.absolute_path,
+                node_name,
+            )
+            return None
+
+        return resolve_result
+
     def _write_deadline_project_template(self, assets_dir: Path) -> None:
         """Write the current project template unmodified for the Deadline worker.
 
@@ -426,14 +452,64 @@ class DeadlineCloudPublisher(BaseDeadlineCloud):
         Args:
             assets_dir: The assets directory within the job bundle.
         """
+        project_yaml = self._get_deadline_project_template_yaml()
+        if project_yaml is None:
+            logger.warning("No project.yml will be written for the Deadline worker.")
+            return
+
+        static_files_dir = assets_dir / "static_files"
+        static_files_dir.mkdir(parents=True, exist_ok=True)
+        project_yaml_path = static_files_dir / "project.yml"
+        # A staged static file may be a hard link to the user's own file, so it is replaced rather than written to
+        project_yaml_path.unlink(missing_ok=True)
+        project_yaml_path.write_text(project_yaml, encoding="utf-8")
+        logger.info("Wrote project template to %s", project_yaml_path)
+
+    @staticmethod
+    def _write_seeded_inputs_baseline(assets_dir: Path, hash_index: BundleHashIndex) -> None:
+        """Write the baseline manifest of the static files that the worker seeds into the output directory.
+
+        The hashes come from the bundle's hash index, so that workers only copy the baseline rather
+        than hashing every static file for each task. The baseline is only rewritten when it changed,
+        keeping it indexed too.
+
+        Args:
+            assets_dir: The assets directory within the cached job bundle.
+            hash_index: The hash index of the cached job bundle.
+        """
+        static_files_dir = assets_dir / "static_files"
+        baseline_path = assets_dir / SEEDED_INPUTS_MANIFEST_FILE_NAME
+        if not static_files_dir.is_dir():
+            baseline_path.unlink(missing_ok=True)
+            return
+
+        # Walked the same way as the worker overlays the static files
+        static_file_paths = [
+            Path(dirpath) / filename for dirpath, _, filenames in os.walk(static_files_dir) for filename in filenames
+        ]
+        hash_alg, hashes = hash_index.hash_files(static_file_paths)
+        baseline = json.dumps(
+            {
+                "hash_alg": hash_alg.value,
+                "files": {
+                    path.relative_to(static_files_dir).as_posix(): file_hash for path, file_hash in hashes.items()
+                },
+            },
+            sort_keys=True,
+        )
+        if not baseline_path.is_file() or baseline_path.read_text(encoding="utf-8") != baseline:
+            baseline_path.write_text(baseline, encoding="utf-8")
+
+    def _get_deadline_project_template_yaml(self) -> str | None:
+        """Get the current project template as YAML, adjusted for the Deadline worker.
+
+        Returns:
+            The project template YAML, or None if the current project could not be retrieved.
+        """
         current_project_result = GriptapeNodes.handle_request(GetCurrentProjectRequest())
         if not isinstance(current_project_result, GetCurrentProjectResultSuccess):
-            logger.warning(
-                "Could not retrieve current project template: %s. "
-                "No project.yml will be written for the Deadline worker.",
-                current_project_result,
-            )
-            return
+            logger.warning("Could not retrieve current project template: %s.", current_project_result)
+            return None
 
         template = current_project_result.project_info.template.model_copy(deep=True)
 
@@ -442,12 +518,7 @@ class DeadlineCloudPublisher(BaseDeadlineCloud):
         metadata_dir_name = get_metadata_dir_name()
         if metadata_dir_name and metadata_dir_name in template.directories:
             template.directories[metadata_dir_name].path_macro = metadata_dir_name
-        static_files_dir = assets_dir / "static_files"
-        static_files_dir.mkdir(parents=True, exist_ok=True)
-        project_yaml = template.to_yaml()
-        project_yaml_path = static_files_dir / "project.yml"
-        project_yaml_path.write_text(project_yaml, encoding="utf-8")
-        logger.info("Wrote project template to %s", project_yaml_path)
+        return template.to_yaml()
 
     def _validate_workflow(self, workflow_name: str) -> Workflow:
         """Validate the workflow before publishing."""
@@ -565,8 +636,12 @@ class DeadlineCloudPublisher(BaseDeadlineCloud):
         job_attachment_settings: JobAttachmentS3Settings,
         queue_session: Session,
         on_uploading_assets: Callable[[Any], bool] | None = None,
+        hash_index: BundleHashIndex | None = None,
     ) -> Attachments:
-        """Upload specified paths as job attachments and return the attachments."""
+        """Upload specified paths as job attachments and return the attachments.
+
+        When a hash index is given, files it has already hashed are not hashed again.
+        """
         try:
             logger.info("Uploading %d input paths as job attachments", len(input_paths))
 
@@ -595,12 +670,15 @@ class DeadlineCloudPublisher(BaseDeadlineCloud):
                 upload_group.total_input_files,
                 upload_group.total_input_bytes,
             )
-            (_, manifests) = s3_asset_manager.hash_assets_and_create_manifest(
-                upload_group.asset_groups,
-                upload_group.total_input_files,
-                upload_group.total_input_bytes,
-                cache_directory,
-            )
+            if hash_index is not None:
+                manifests = hash_index.create_manifests(upload_group.asset_groups, s3_asset_manager.manifest_version)
+            else:
+                (_, manifests) = s3_asset_manager.hash_assets_and_create_manifest(
+                    upload_group.asset_groups,
+                    upload_group.total_input_files,
+                    upload_group.total_input_bytes,
+                    cache_directory,
+                )
 
             def default_on_uploading_assets(summary: Any) -> bool:
                 logger.info("Uploading assets: %s", summary)
@@ -634,58 +712,158 @@ class DeadlineCloudPublisher(BaseDeadlineCloud):
         """Get the top-level HuggingFace cache directory path."""
         return HF_HUB_CACHE
 
+    def _scan_huggingface_cache(self) -> HFCacheInfo | None:
+        """Scan the HuggingFace cache directory once per publish and reuse the result."""
+        if self._huggingface_cache_info is None:
+            try:
+                from huggingface_hub import scan_cache_dir
+
+                self._huggingface_cache_info = scan_cache_dir()
+            except Exception as e:
+                logger.warning("Failed to scan HuggingFace cache: %s", e)
+                return None
+
+        return self._huggingface_cache_info
+
     def _get_huggingface_repo_names(self) -> list[str]:
         """Get the names of HuggingFace repositories from the huggingface_hub cache directory."""
-        try:
-            from huggingface_hub import scan_cache_dir
+        cache_info = self._scan_huggingface_cache()
+        if cache_info is None:
+            return []
 
-            cache_info = scan_cache_dir()
-            return [repo.repo_id for repo in cache_info.repos]
+        return [repo.repo_id for repo in cache_info.repos]
 
-        except Exception as e:
-            logger.warning("Failed to get HuggingFace repo names: %s", e)
+    def _get_model_revisions(self, model_names: list[str]) -> list[tuple[str, str, list[str]]]:
+        """Get the cached snapshot revisions of specific HuggingFace repositories.
+
+        Returns:
+            A list of (repo_id, commit_hash, file paths) tuples, one per cached revision.
+        """
+        if not model_names:
+            logger.info("No model names provided, returning empty list")
             return []
 
-    def _get_model_paths(self, model_names: list[str]) -> list[str]:
-        """Get stringified paths to model files for specific HuggingFace repositories from cache."""
-        try:
-            from huggingface_hub import scan_cache_dir
+        cache_info = self._scan_huggingface_cache()
+        if cache_info is None:
+            return []
 
-            if not model_names:
-                logger.info("No model names provided, returning empty list")
-                return []
+        model_revisions: list[tuple[str, str, list[str]]] = []
+        for repo in sorted(cache_info.repos, key=lambda repo: repo.repo_id):
+            if repo.repo_id not in model_names:
+                continue
+
+            for revision in sorted(repo.revisions, key=lambda revision: revision.commit_hash):
+                file_paths = sorted(
+                    str(file.file_path)
+                    for file in revision.files
+                    if Path(file.file_path).exists()
+                    and not Path(file.file_path).is_dir()
+                    and "__pycache__" not in str(file.file_path)
+                    and ".venv" not in str(file.file_path)
+                )
+                if file_paths:
+                    model_revisions.append((repo.repo_id, revision.commit_hash, file_paths))
+
+        logger.info("Found %d model revision(s) for %d requested repositories", len(model_revisions), len(model_names))
+        return model_revisions
 
-            cache_info = scan_cache_dir()
-            model_paths: list[str] = []
-
-            # Filter repos by the requested model names
-            for repo in cache_info.repos:
-                if repo.repo_id in model_names:
-                    # Get all file paths for this repo
-                    for revision in repo.revisions:
-                        for file in revision.files:
-                            file_path = Path(file.file_path)
-                            if (
-                                file_path.exists()
-                                and not file_path.is_dir()
-                                and "__pycache__" not in str(file_path)
-                                and ".venv" not in str(file_path)
-                            ):
-                                model_paths.append(str(file_path))
-
-            # Create dummy file in HF_HUB_CACHE path to ensure cache root directory syncs to deadline
-            dummy_file_path = (Path(self._get_huggingface_cache_dir()) / "dummy.txt").resolve()
+    def _get_huggingface_cache_root_marker(self) -> str:
+        """Return a file at the HuggingFace cache root that roots every model manifest at the cache directory.
+
+        The file is only written when missing so that its modification time, and therefore the
+        manifests that include it, stay stable across publishes.
+        """
+        dummy_file_path = (Path(self._get_huggingface_cache_dir()) / "dummy.txt").resolve()
+        if not dummy_file_path.is_file():
             dummy_file_path.write_text("This is a dummy file for path remapping.")
-            model_paths.append(str(dummy_file_path))
+        return str(dummy_file_path)
 
-            logger.info("Found %d model files for %d requested repositories", len(model_paths), len(model_names))
+    def _upload_model_attachments(  # noqa: PLR0913
+        self,
+        model_names: list[str],
+        *,
+        farm_id: str,
+        queue_id: str,
+        storage_profile: StorageProfile | None,
+        job_attachment_settings: JobAttachmentS3Settings,
+        queue_session: Session,
+        on_uploading_assets: Callable[[Any], bool] | None = None,
+    ) -> list[ManifestProperties]:
+        """Upload the cached revisions of HuggingFace models as job attachments and return their manifests.
 
+        Each model revision gets its own manifest, cached by repository, commit hash, file listing
+        and upload target. Revisions uploaded by an earlier publish are reused without hashing or uploading
+        their files again; the remaining revisions are uploaded in parallel.
+        """
+        try:
+            model_revisions = self._get_model_revisions(model_names)
+            if not model_revisions:
+                return []
+            cache_root_marker = self._get_huggingface_cache_root_marker()
         except Exception as e:
             logger.warning("Failed to get model paths for repositories %s: %s", model_names, e)
             return []
 
-        else:
-            return model_paths
+        manifest_cache = DeadlineCloudModelManifestCache()
+        models_root = str(Path(cache_root_marker).parent)
+        storage_profile_id = storage_profile.storageProfileId if storage_profile is not None else None
+
+        manifests_by_revision: dict[tuple[str, str], list[ManifestProperties]] = {}
+        pending_uploads: list[tuple[str | None, str, str, list[str]]] = []
+        for repo_id, commit_hash, file_paths in model_revisions:
+            try:
+                manifest_key = manifest_cache.get_key(
+                    repo_id,
+                    commit_hash,
+                    file_paths,
+                    models_root=models_root,
+                    storage_profile_id=storage_profile_id,
+                    job_attachment_settings=job_attachment_settings,
+                )
+            except OSError as e:
+                logger.warning("Failed to read model %s@%s, not caching its manifest: %s", repo_id, commit_hash[:12], e)
+                pending_uploads.append((None, repo_id, commit_hash, file_paths))
+                continue
+
+            cached_manifest = manifest_cache.load_manifest(manifest_key, job_attachment_settings, queue_session)
+            if cached_manifest is not None:
+                logger.info("Reusing uploaded manifest for model %s@%s", repo_id, commit_hash[:12])
+                manifests_by_revision[repo_id, commit_hash] = [cached_manifest]
+            else:
+                pending_uploads.append((manifest_key, repo_id, commit_hash, file_paths))
+
+        if pending_uploads:
+            logger.info("Uploading %d model revision(s)", len(pending_uploads))
+            with ThreadPoolExecutor(max_workers=MODEL_UPLOAD_MAX_WORKERS) as executor:
+                futures = {
+                    (manifest_key, repo_id, commit_hash): executor.submit(
+                        self.upload_paths_as_job_attachments,
+                        input_paths=[*file_paths, cache_root_marker],
+                        output_paths=[],
+                        farm_id=farm_id,
+                        queue_id=queue_id,
+                        storage_profile=storage_profile,
+                        job_attachment_settings=job_attachment_settings,
+                        queue_session=queue_session,
+                        on_uploading_assets=on_uploading_assets,
+                    )
+                    for manifest_key, repo_id, commit_hash, file_paths in pending_uploads
+                }
+                for (manifest_key, repo_id, commit_hash), future in futures.items():
+                    revision_manifests = future.result().manifests
+                    # Every file lives under the HuggingFace cache, so a revision uploads as a single manifest
+                    if manifest_key is not None and len(revision_manifests) == 1:
+                        manifest_cache.save_manifest(manifest_key, revision_manifests[0])
+                    manifests_by_revision[repo_id, commit_hash] = revision_manifests
+
+        # The worker merges manifests that share the HuggingFace cache root
+        manifests = [
+            manifest
+            for repo_id, commit_hash, _ in model_revisions
+            for manifest in manifests_by_revision[repo_id, commit_hash]
+        ]
+        logger.info("Added %d model manifest(s)", len(manifests))
+        return manifests
 
     @classmethod
     def expand_directories_to_files(cls, paths: list[str]) -> list[str]:
@@ -759,34 +937,16 @@ class DeadlineCloudPublisher(BaseDeadlineCloud):
                 DEADLINE_CLOUD_LIBRARY_CONFIG_KEY, "enable_models_as_attachments", default=True
             )
 
-            # Initialize Deadline client
-            deadline_client = self._get_client()
-
             # Get queue information for job attachment settings
-            queue_response = deadline_client.get_queue(farmId=farm_id, queueId=queue_id)
-            job_attachment_settings = JobAttachmentS3Settings(**queue_response["jobAttachmentSettings"])
-
-            queue_session = get_queue_user_boto3_session(
-                deadline_client,
-                None,
-                farm_id,
-                queue_id,
-            )
-            queue_session._session.set_config_variable("region", self._session.region_name)
+            queue_metadata = self._get_queue_metadata(farm_id, queue_id, storage_profile_id)
+            job_attachment_settings = queue_metadata.job_attachment_settings
+            queue_session = queue_metadata.queue_session
+            storage_profile = queue_metadata.storage_profile
 
             # Set up asset manager and hash cache
             job_bundle_path = Path(package_path)
             assets_dir = job_bundle_path / "assets"
 
-            storage_profile: StorageProfile | None = self._get_storage_profile_for_queue(
-                farm_id, queue_id, storage_profile_id
-            )
-
-            # 1. Upload job bundle assets (clean root path = temp bundle directory)
-            bundle_input_paths = []
-            if assets_dir.is_dir():
-                bundle_input_paths.extend(self.expand_directories_to_files([str(assets_dir)]))
-
             def on_upload_assets(summary: Any) -> bool:
                 from deadline.job_attachments.progress_tracker import ProgressReportMetadata
 
@@ -795,27 +955,45 @@ class DeadlineCloudPublisher(BaseDeadlineCloud):
                     self._emit_progress_event(progress, summary.progressMessage)
                 return True
 
-            logger.info("Uploading %d job bundle files", len(bundle_input_paths))
-            attachments = self.upload_paths_as_job_attachments(
-                input_paths=bundle_input_paths,
-                output_paths=[str(job_bundle_path / "output")],
-                farm_id=farm_id,
-                queue_id=queue_id,
-                storage_profile=storage_profile,
-                job_attachment_settings=job_attachment_settings,
-                queue_session=queue_session,
-                on_uploading_assets=on_upload_assets,
+            # Reuse the attachments uploaded for this exact bundle to this queue, if any
+            bundle_cache = DeadlineCloudBundleCache()
+            attachments_key = bundle_cache.get_attachments_key(
+                farm_id, queue_id, storage_profile_id, job_attachment_settings
             )
+            attachments = bundle_cache.load_attachments(
+                job_bundle_path, attachments_key, job_attachment_settings, queue_session
+            )
+            if attachments is not None:
+                logger.info("Reusing previously uploaded job attachments for bundle %s", job_bundle_path)
+                self._emit_progress_event(10, "Reusing previously uploaded job bundle.")
+            else:
+                # 1. Upload job bundle assets (clean root path = cached bundle directory)
+                hash_index = BundleHashIndex(job_bundle_path)
+                self._write_seeded_inputs_baseline(assets_dir, hash_index)
+                bundle_input_paths = []
+                if assets_dir.is_dir():
+                    bundle_input_paths.extend(self.expand_directories_to_files([str(assets_dir)]))
+
+                logger.info("Uploading %d job bundle files", len(bundle_input_paths))
+                attachments = self.upload_paths_as_job_attachments(
+                    input_paths=bundle_input_paths,
+                    output_paths=[str(job_bundle_path / "output")],
+                    farm_id=farm_id,
+                    queue_id=queue_id,
+                    storage_profile=storage_profile,
+                    job_attachment_settings=job_attachment_settings,
+                    queue_session=queue_session,
+                    on_uploading_assets=on_upload_assets,
+                    hash_index=hash_index,
+                )
+                bundle_cache.save_attachments(job_bundle_path, attachments_key, attachments)
 
             # 2. Upload model files separately (if enabled)
             if enable_models_as_attachments:
                 model_names = self._gather_models_for_workflow()
-                model_paths = self._get_model_paths(model_names)
-                if model_paths:
-                    logger.info("Uploading %d model files", len(model_paths))
-                    model_attachments = self.upload_paths_as_job_attachments(
-                        input_paths=model_paths,
-                        output_paths=[],
+                attachments.manifests.extend(
+                    self._upload_model_attachments(
+                        model_names,
                         farm_id=farm_id,
                         queue_id=queue_id,
                         storage_profile=storage_profile,
@@ -823,8 +1001,7 @@ class DeadlineCloudPublisher(BaseDeadlineCloud):
                         queue_session=queue_session,
                         on_uploading_assets=on_upload_assets,
                     )
-                    attachments.manifests.extend(model_attachments.manifests)
-                    logger.info("Added %d model manifest(s)", len(model_attachments.manifests))
+                )
 
             progress = 0 if enable_models_as_attachments else 10
             self._emit_progress_event(progress, "Job attachments processed successfully.")
@@ -851,12 +1028,15 @@ class DeadlineCloudPublisher(BaseDeadlineCloud):
         destination_path: Path,
         runtime_env_path: Path,
         workflow: Workflow,
+        stager: DeadlineCloudBundleStager,
     ) -> list[str]:
-        """Copies the libraries to the specified path for the workflow, returning the list of library paths.
+        """Stages the libraries to the specified path for the workflow, returning the list of library paths.
 
-        This is used to package the workflow for publishing.
+        This is used to package the workflow for publishing. The library files may still be staging
+        until the stager is waited on.
         """
         library_paths: list[str] = []
+        node_types_by_library = self._get_node_types_by_library(workflow.metadata.node_types_used)
 
         for library_ref in node_libraries:
             library = GriptapeNodes.LibraryManager().get_library_info_by_library_name(library_ref.library_name)
@@ -869,26 +1049,14 @@ class DeadlineCloudPublisher(BaseDeadlineCloud):
             library_data = LibraryRegistry.get_library(library_ref.library_name).get_library_data()
 
             if library.library_path.endswith(".json"):
-                library_path = Path(library.library_path)
-                absolute_library_path = library_path.resolve()
-                abs_paths = [absolute_library_path]
-                for node in library_data.nodes:
-                    p = (library_path.parent / Path(node.file_path)).resolve()
-                    abs_paths.append(p)
-                common_root = Path(os.path.commonpath([str(p) for p in abs_paths]))
-                dest = destination_path / common_root.name
-                copy_tree_request = CopyTreeRequest(
-                    source_path=str(common_root),
-                    destination_path=str(dest),
-                    ignore_patterns=[".venv", "__pycache__"],
-                    dirs_exist_ok=True,
-                )
-                copy_tree_result = GriptapeNodes.handle_request(copy_tree_request)
-                if not isinstance(copy_tree_result, CopyTreeResultSuccess):
-                    details = f"Failed to copy library files from '{common_root}' to '{dest}' for library '{library_ref.library_name}'."
-                    logger.error(details)
-                    raise TypeError(details)
-                library_path_relative_to_common_root = absolute_library_path.relative_to(common_root)
+                absolute_library_path = Path(library.library_path).resolve()
+                common_root = self._get_library_common_root(library.library_path, library_data)
+                stager.stage_tree(common_root, destination_path / common_root.name, LIBRARY_IGNORE_PATTERNS)
+                library_path_relative_to_common_root = self._write_trimmed_library_json(
+                    absolute_library_path,
+                    destination_path / common_root.name / absolute_library_path.relative_to(common_root),
+                    node_types_by_library.get(library_ref.library_name, set()),
+                ).relative_to(destination_path / common_root.name)
                 library_paths.append(
                     (runtime_env_path / common_root.name / library_path_relative_to_common_root).as_posix()
                 )
@@ -897,6 +1065,79 @@ class DeadlineCloudPublisher(BaseDeadlineCloud):
 
         return library_paths
 
+    def _get_node_types_by_library(self, node_types_used: set[LibraryNameAndNodeType]) -> dict[str, set[str]]:
+        """Group the node types a workflow uses by library, or return none if libraries must not be trimmed."""
+        if not self._get_config_value(DEADLINE_CLOUD_LIBRARY_CONFIG_KEY, "trim_library_registration", default=True):
+            return {}
+
+        node_types_by_library: dict[str, set[str]] = {}
+        for node_type_used in node_types_used:
+            node_types_by_library.setdefault(node_type_used.library_name, set()).add(node_type_used.node_type)
+        return node_types_by_library
+
+    @staticmethod
+    def _write_trimmed_library_json(
+        library_json_path: Path, staged_library_json_path: Path, node_types: set[str]
+    ) -> Path:
+        """Write a copy of a library's JSON that declares only the given node types, returning the path to register.
+
+        Registering a library imports the module of every node it declares, so a worker that only
+        registers the nodes its workflow uses starts much faster. The trimmed copy is written next
+        to the staged library JSON, so that node file paths still resolve, and the staged original
+        is left untouched since it may share its data with the source file. Without node types, e.g.
+        for workflows saved before the engine recorded them, the staged original is returned.
+        """
+        if not node_types:
+            return staged_library_json_path
+
+        with library_json_path.open(encoding="utf-8") as library_file:
+            library_json = json.load(library_file)
+
+        nodes = library_json.get("nodes", [])
+        library_json["nodes"] = [node for node in nodes if node.get("class_name") in node_types]
+        # Workflow templates are only offered in the editor
+        library_json.pop("workflows", None)
+
+        trimmed_library_json_path = staged_library_json_path.with_name(
+            f"{staged_library_json_path.stem}{TRIMMED_LIBRARY_FILE_SUFFIX}"
+        )
+        with trimmed_library_json_path.open("w", encoding="utf-8") as trimmed_library_file:
+            json.dump(library_json, trimmed_library_file, indent=4)
+
+        logger.info(
+            "Trimmed library '%s' to %d of its %d node(s)",
+            library_json.get("name", library_json_path),
+            len(library_json["nodes"]),
+            len(nodes),
+        )
+        return trimmed_library_json_path
+
+    @staticmethod
+    def _compile_library_bytecode(libraries_dir: Path) -> None:
+        """Pre-compile the staged libraries, so that workers do not compile every module they import.
+
+        Bytecode is validated against a hash of its source rather than its modification time, so it
+        stays valid however the sources reach the worker. Workers on another Python version ignore it.
+        """
+        # Compiled in this process; a process pool would have to re-import the engine's main module
+        compiled = compileall.compile_dir(
+            libraries_dir, quiet=2, invalidation_mode=py_compile.PycInvalidationMode.CHECKED_HASH
+        )
+        if not compiled:
+            logger.warning(
+                "Some library modules in '%s' could not be compiled; workers will compile them", libraries_dir
+            )
+
+    @staticmethod
+    def _get_library_common_root(library_json_path: str, library_data: Any) -> Path:
+        """Get the common root directory of a library's JSON file and all of its node files."""
+        library_path = Path(library_json_path)
+        abs_paths = [library_path.resolve()]
+        for node in library_data.nodes:
+            p = (library_path.parent / Path(node.file_path)).resolve()
+            abs_paths.append(p)
+        return Path(os.path.commonpath([str(p) for p in abs_paths]))
+
     def _find_griptape_nodes_distribution(self) -> importlib.metadata.Distribution | None:
         """Find the griptape_nodes distribution from the current executable's venv.
 
@@ -1051,6 +1292,24 @@ class DeadlineCloudPublisher(BaseDeadlineCloud):
             except Exception:  # noqa: S112
                 continue
 
+    def _get_worker_venv_options(self) -> dict[str, Any]:
+        """Get the job template options that control how workers build and cache the job's virtual environment."""
+        venv_cache_dir = self._get_config_value(DEADLINE_CLOUD_LIBRARY_CONFIG_KEY, "worker_venv_cache_dir", default="")
+        package_installer = self._get_config_value(
+            DEADLINE_CLOUD_LIBRARY_CONFIG_KEY, "worker_package_installer", default="pip"
+        )
+        if package_installer not in ("pip", "uv"):
+            logger.warning("Unsupported worker package installer '%s', falling back to pip", package_installer)
+            package_installer = "pip"
+
+        return {"venv_cache_dir": venv_cache_dir or None, "package_installer": package_installer}
+
+    def _get_models_to_warm(self) -> list[str]:
+        """Get the HuggingFace models whose weights workers read into their page cache before the first task."""
+        if not self._get_config_value(DEADLINE_CLOUD_LIBRARY_CONFIG_KEY, "warm_model_cache", default=True):
+            return []
+        return sorted(set(self._gather_models_for_workflow()))
+
     def _get_engine_version_for_workflow(self, workflow: Workflow) -> str:
         # Get engine version for dependencies
         engine_version_request = GetEngineVersionRequest()
@@ -1062,8 +1321,97 @@ class DeadlineCloudPublisher(BaseDeadlineCloud):
         engine_version_success = cast("GetEngineVersionResultSuccess", engine_version_result)
         return f"v{engine_version_success.major}.{engine_version_success.minor}.{engine_version_success.patch}"
 
-    def _package_workflow(self, workflow_name: str) -> str:  # noqa: C901, PLR0912, PLR0915
-        """Package workflow as a Deadline Cloud job bundle with Open Job Description template."""
+    def _build_requirements_txt(self, workflow: Workflow, engine_version: str) -> str:
+        """Build the requirements.txt contents installed on the worker for the workflow."""
+        source, commit_id = self._get_install_source()
+        if source == "git" and commit_id is not None:
+            engine_version = commit_id
+
+        req_file = io.StringIO()
+        req_file.write(
+            f"griptape-nodes-engine @ git+https://github.com/griptape-ai/griptape-nodes-engine.git@{engine_version}\n"
+        )
+        # Libraries may be registered locally with a no-deps JSON variant
+        # (e.g. griptape-nodes-library-no-deps.json) to avoid installing heavy
+        # GPU dependencies on machines without NVIDIA hardware. When publishing
+        # to Deadline Cloud, the worker still needs those deps, so we fall back
+        # to a sibling JSON that declares the full pip_dependencies (e.g.
+        # griptape-nodes-library-cuda129.json in the same directory).
+        for library_ref in workflow.metadata.node_libraries_referenced:
+            lib = LibraryRegistry.get_library(library_ref.library_name)
+            library_data = lib.get_library_data()
+            deps = library_data.metadata.dependencies
+            if deps and deps.pip_dependencies:
+                if deps.pip_install_flags:
+                    req_file.write(f"{' '.join(deps.pip_install_flags)}\n")
+                for dep in deps.pip_dependencies:
+                    if dep.startswith("-e"):
+                        continue
+                    req_file.write(f"{dep}\n")
+            else:
+                self._write_deps_from_sibling_json(library_ref.library_name, req_file)
+
+        return req_file.getvalue()
+
+    def _compute_bundle_fingerprint(
+        self, workflow: Workflow, full_workflow_file_path: str, requirements_txt: str, env_file_mapping: dict[str, Any]
+    ) -> str:
+        """Fingerprint everything that goes into the job bundle, without copying any of it.
+
+        Covers the workflow file, the publisher's own bundled sources, each referenced library's
+        version and file tree, the engine config, secrets, requirements, project template and
+        static files selected in the workflow.
+        """
+        config_manager = GriptapeNodes.get_instance()._config_manager
+        local_publish_path = Path(__file__).parent
+
+        fingerprint = BundleFingerprint()
+        fingerprint.add_text("workflow_name", workflow.metadata.name)
+        fingerprint.add_json("pickle_control_flow_result", self.pickle_control_flow_result)
+        fingerprint.add_file_contents("workflow", Path(full_workflow_file_path))
+        for publish_file_name in (
+            "__init__.py",
+            "deadline_cloud_workflow_executor.py",
+            "deadline_cloud_job_template_generator.py",
+        ):
+            fingerprint.add_file_contents(publish_file_name, local_publish_path / publish_file_name)
+
+        for library_ref in workflow.metadata.node_libraries_referenced:
+            fingerprint.add_json("library", [library_ref.library_name, library_ref.library_version])
+            library = GriptapeNodes.LibraryManager().get_library_info_by_library_name(library_ref.library_name)
+            if library is not None and library.library_path.endswith(".json"):
+                library_data = LibraryRegistry.get_library(library_ref.library_name).get_library_data()
+                common_root = self._get_library_common_root(library.library_path, library_data)
+                fingerprint.add_text("library_root", str(common_root))
+                fingerprint.add_path_stats("library_tree", common_root, LIBRARY_IGNORE_PATTERNS)
+            elif library is not None:
+                fingerprint.add_text("library_path", library.library_path)
+
+        fingerprint.add_json("config", config_manager.user_config)
+        fingerprint.add_json("env", env_file_mapping)
+        fingerprint.add_text("requirements", requirements_txt)
+        fingerprint.add_json("models_to_warm", self._get_models_to_warm())
+        fingerprint.add_json(
+            "trim_library_registration",
+            self._get_config_value(DEADLINE_CLOUD_LIBRARY_CONFIG_KEY, "trim_library_registration", default=True),
+        )
+        fingerprint.add_text("project_template", self._get_deadline_project_template_yaml() or "")
+
+        for node_name, macro_string in self._gather_file_selector_nodes():
+            fingerprint.add_json("static_file", [node_name, macro_string])
+            resolve_result = self._resolve_static_file_path(node_name, macro_string)
+            if resolve_result is not None:
+                fingerprint.add_text("static_file_resolved", str(resolve_result.resolved_path))
+                fingerprint.add_path_stats("static_file_stats", resolve_result.absolute_path)
+
+        return fingerprint.hexdigest()
+
+    def _package_workflow(self, workflow_name: str) -> str:  # noqa: PLR0915
+        """Package workflow as a Deadline Cloud job bundle with Open Job Description template.
+
+        Bundles are cached by a fingerprint of their inputs, so republishing an unchanged
+        workflow reuses the previously packaged bundle instead of copying everything again.
+        """
         config_manager = GriptapeNodes.get_instance()._config_manager
         secrets_manager = GriptapeNodes.get_instance()._secrets_manager
         workflow = WorkflowRegistry.get_workflow_by_name(workflow_name)
@@ -1071,9 +1419,27 @@ class DeadlineCloudPublisher(BaseDeadlineCloud):
         # Get engine version for dependencies
         engine_version = self._get_engine_version_for_workflow(workflow)
 
-        # Create temporary directory for packaging
-        temp_dir = Path(tempfile.mkdtemp(prefix=f"{workflow_name}_deadline_bundle_"))
-        job_bundle_dir = temp_dir
+        if workflow.file_path is None:
+            details = f"Workflow '{workflow_name}' has no file path on disk and cannot be packaged."
+            logger.error(details)
+            raise ValueError(details)
+        full_workflow_file_path = WorkflowRegistry.get_complete_file_path(workflow.file_path)
+
+        requirements_txt = self._build_requirements_txt(workflow, engine_version)
+        env_file_mapping = self._get_merged_env_file_mapping(secrets_manager.workspace_env_path)
+
+        bundle_cache = DeadlineCloudBundleCache()
+        fingerprint = self._compute_bundle_fingerprint(
+            workflow, full_workflow_file_path, requirements_txt, env_file_mapping
+        )
+        cached_bundle_dir = bundle_cache.get_cached_bundle(workflow_name, fingerprint)
+        if cached_bundle_dir is not None:
+            self._job_template = bundle_cache.load_job_template(cached_bundle_dir)
+            logger.info("Reusing cached job bundle for unchanged workflow '%s': %s", workflow_name, cached_bundle_dir)
+            return str(cached_bundle_dir)
+
+        # Package into a staging directory that is synced into the cache once complete
+        job_bundle_dir = bundle_cache.create_staging_dir(workflow_name)
         assets_dir = job_bundle_dir / "assets"
 
         # Create bundle directory structure
@@ -1083,11 +1449,6 @@ class DeadlineCloudPublisher(BaseDeadlineCloud):
             local_publish_path = Path(__file__).parent
 
             # 1. Copy workflow and dependencies to assets
-            if workflow.file_path is None:
-                details = f"Workflow '{workflow_name}' has no file path on disk and cannot be packaged."
-                logger.error(details)
-                raise ValueError(details)  # noqa: TRY301
-            full_workflow_file_path = WorkflowRegistry.get_complete_file_path(workflow.file_path)
             copy_file_request = CopyFileRequest(
                 source_path=full_workflow_file_path,
                 destination_path=str(assets_dir / "workflow.py"),
@@ -1124,85 +1485,76 @@ class DeadlineCloudPublisher(BaseDeadlineCloud):
                 logger.error(details)
                 raise TypeError(details)  # noqa: TRY301
 
-            # 2. Copy libraries
-            library_paths = self._copy_libraries_to_path_for_workflow(
-                node_libraries=workflow.metadata.node_libraries_referenced,
-                destination_path=assets_dir / "libraries",
-                runtime_env_path=Path("{{Param.LocationToRemap}}/assets/libraries"),
-                workflow=workflow,
-            )
+            with DeadlineCloudBundleStager() as stager:
+                # 2. Stage libraries, concurrently with writing the rest of the bundle
+                library_paths = self._copy_libraries_to_path_for_workflow(
+                    node_libraries=workflow.metadata.node_libraries_referenced,
+                    destination_path=assets_dir / "libraries",
+                    runtime_env_path=Path("{{Param.LocationToRemap}}/assets/libraries"),
+                    workflow=workflow,
+                    stager=stager,
+                )
 
-            # 3. Create configuration
-            config = config_manager.user_config.copy()
-            config["workspace_directory"] = "."
-            config["app_events"] = {
-                "on_app_initialization_complete": {
-                    "workflows_to_register": [],
-                    "libraries_to_register": library_paths,
+                # 3. Create configuration
+                config = config_manager.user_config.copy()
+                config["workspace_directory"] = "."
+                config["app_events"] = {
+                    "on_app_initialization_complete": {
+                        "workflows_to_register": [],
+                        "libraries_to_register": library_paths,
+                    }
                 }
-            }
 
-            with (assets_dir / "griptape_nodes_config.json").open("w", encoding="utf-8") as config_file:
-                json.dump(config, config_file, indent=2)
+                with (assets_dir / "griptape_nodes_config.json").open("w", encoding="utf-8") as config_file:
+                    json.dump(config, config_file, indent=2)
 
-            # 4. Create environment file
-            env_file_mapping = self._get_merged_env_file_mapping(secrets_manager.workspace_env_path)
-            self._write_env_file(assets_dir / ".env", env_file_mapping)
+                # 4. Create environment file
+                self._write_env_file(assets_dir / ".env", env_file_mapping)
 
-            # 5. Create requirements.txt
-            source, commit_id = self._get_install_source()
-            if source == "git" and commit_id is not None:
-                engine_version = commit_id
+                # 5. Create requirements.txt
+                (assets_dir / "requirements.txt").write_text(requirements_txt, encoding="utf-8")
 
-            with (assets_dir / "requirements.txt").open("w", encoding="utf-8") as req_file:
-                req_file.write(
-                    f"griptape-nodes-engine @ git+https://github.com/griptape-ai/griptape-nodes-engine.git@{engine_version}\n"
-                )
-                # Libraries may be registered locally with a no-deps JSON variant
-                # (e.g. griptape-nodes-library-no-deps.json) to avoid installing heavy
-                # GPU dependencies on machines without NVIDIA hardware. When publishing
-                # to Deadline Cloud, the worker still needs those deps, so we fall back
-                # to a sibling JSON that declares the full pip_dependencies (e.g.
-                # griptape-nodes-library-cuda129.json in the same directory).
-                for library_ref in workflow.metadata.node_libraries_referenced:
-                    lib = LibraryRegistry.get_library(library_ref.library_name)
-                    library_data = lib.get_library_data()
-                    deps = library_data.metadata.dependencies
-                    if deps and deps.pip_dependencies:
-                        if deps.pip_install_flags:
-                            req_file.write(f"{' '.join(deps.pip_install_flags)}\n")
-                        for dep in deps.pip_dependencies:
-                            if dep.startswith("-e"):
-                                continue
-                            req_file.write(f"{dep}\n")
-                    else:
-                        self._write_deps_from_sibling_json(library_ref.library_name, req_file)
-
-            # 6. Gather and copy static file dependencies from FileSelector nodes
-            file_selector_nodes = self._gather_file_selector_nodes()
-            if file_selector_nodes:
-                self._resolve_and_copy_static_files(file_selector_nodes, assets_dir)
+                # 6. Gather and stage static file dependencies from FileSelector nodes
+                file_selector_nodes = self._gather_file_selector_nodes()
+                if file_selector_nodes:
+                    self._resolve_and_copy_static_files(file_selector_nodes, assets_dir, stager)
+
+                stager.wait()
+
+            # Bytecode is compiled once the library sources are all staged
+            self._compile_library_bytecode(assets_dir / "libraries")
 
             # 7. Write Deadline-specific project template (always, even without FileSelector nodes)
             self._write_deadline_project_template(assets_dir)
 
             # 8. Generate Job Template
             self._job_template = DeadlineCloudJobTemplateGenerator.generate_job_template(
-                job_bundle_dir, workflow_name, library_paths, pickle_control_flow_result=self.pickle_control_flow_result
+                job_bundle_dir,
+                workflow_name,
+                library_paths,
+                pickle_control_flow_result=self.pickle_control_flow_result,
+                models=self._get_models_to_warm(),
+                **self._get_worker_venv_options(),
             )
 
+            # 9. Sync the completed bundle into the cache
+            job_bundle_dir = bundle_cache.commit_bundle(job_bundle_dir, workflow_name, fingerprint)
+
             logger.info("Job bundle created at: %s", job_bundle_dir)
             return str(job_bundle_dir)
 
         except OSError as e:
+            bundle_cache.discard_staging_dir(job_bundle_dir)
             details = f"File system error packaging workflow '{workflow_name}': {e}"
             logger.error(details)
             raise RuntimeError(details) from e
         except (ValueError, TypeError) as e:
+            bundle_cache.discard_staging_dir(job_bundle_dir)
             details = f"Configuration error packaging workflow '{workflow_name}': {e}"
             logger.error(details)
             raise
         except Exception as e:
+            bundle_cache.discard_staging_dir(job_bundle_dir)
             details = f"Unexpected error packaging workflow '{workflow_name}': {e}"
             logger.exception(details)
             raise RuntimeError(details) from e
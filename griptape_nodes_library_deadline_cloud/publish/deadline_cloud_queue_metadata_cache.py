@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import threading
+import time
+import weakref
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, ClassVar
+
+from deadline.client.api import get_storage_profile_for_queue
+from deadline.job_attachments.models import JobAttachmentS3Settings
+
+if TYPE_CHECKING:
+    import boto3
+    from botocore.client import BaseClient
+    from deadline.job_attachments.models import StorageProfile
+
+
+# Time, in seconds, after which a queue's job attachment settings and storage profiles are fetched again
+QUEUE_METADATA_TTL = 900.0
+
+
+@dataclass
+class DeadlineCloudQueueMetadata:
+    """Everything needed to upload or download a queue's job attachments."""
+
+    job_attachment_settings: JobAttachmentS3Settings
+    queue_session: boto3.Session
+    storage_profile: StorageProfile | None = None
+
+
+@dataclass
+class _QueueEntry:
+    """The cached metadata of a single queue."""
+
+    job_attachment_settings: JobAttachmentS3Settings
+    fetched_at: float
+    storage_profiles: dict[str, StorageProfile]
+
+
+class DeadlineCloudQueueMetadataCache:
+    """Process-wide cache of each queue's job attachment settings and storage profiles.
+
+    Submitting a job and downloading its outputs both need the queue's job attachment settings,
+    which otherwise cost a `get_queue` call each time. Entries are keyed by the Deadline Cloud
+    client, farm and queue, and expire after `QUEUE_METADATA_TTL` so that configuration changes
+    are eventually picked up.
+    """
+
+    _instance: ClassVar[DeadlineCloudQueueMetadataCache | None] = None
+    _instance_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(self, ttl: float = QUEUE_METADATA_TTL) -> None:
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entries: weakref.WeakKeyDictionary[BaseClient, dict[tuple[str, str], _QueueEntry]] = (
+            weakref.WeakKeyDictionary()
+        )
+
+    @classmethod
+    def get_instance(cls) -> DeadlineCloudQueueMetadataCache:
+        """Return the process-wide cache instance."""
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls()
+            return cls._instance
+
+    def get_job_attachment_settings(
+        self, deadline_client: BaseClient, farm_id: str, queue_id: str
+    ) -> JobAttachmentS3Settings:
+        """Return the queue's job attachment settings, fetching them if they are missing or expired.
+
+        Raises:
+            ClientError: If the queue cannot be read.
+            KeyError: If the queue has no job attachment settings.
+        """
+        return self._get_entry(deadline_client, farm_id, queue_id).job_attachment_settings
+
+    def get_storage_profile(
+        self, deadline_client: BaseClient, farm_id: str, queue_id: str, storage_profile_id: str
+    ) -> StorageProfile:
+        """Return a storage profile of the queue, fetching it if it is missing or expired."""
+        entry = self._get_entry(deadline_client, farm_id, queue_id)
+        with self._lock:
+            storage_profile = entry.storage_profiles.get(storage_profile_id)
+        if storage_profile is None:
+            storage_profile = get_storage_profile_for_queue(farm_id, queue_id, storage_profile_id, deadline_client)
+            with self._lock:
+                entry.storage_profiles[storage_profile_id] = storage_profile
+        return storage_profile
+
+    def invalidate(self, farm_id: str, queue_id: str) -> None:
+        """Drop the cached metadata of a queue."""
+        with self._lock:
+            for entries in self._entries.values():
+                entries.pop((farm_id, queue_id), None)
+
+    def _get_entry(self, deadline_client: BaseClient, farm_id: str, queue_id: str) -> _QueueEntry:
+        key = (farm_id, queue_id)
+        with self._lock:
+            entry = self._entries.get(deadline_client, {}).get(key)
+        if entry is not None and time.monotonic() - entry.fetched_at < self.ttl:
+            return entry
+
+        queue_response = deadline_client.get_queue(farmId=farm_id, queueId=queue_id)
+        entry = _QueueEntry(
+            job_attachment_settings=JobAttachmentS3Settings(**queue_response["jobAttachmentSettings"]),
+            fetched_at=time.monotonic(),
+            storage_profiles={},
+        )
+        with self._lock:
+            self._entries.setdefault(deadline_client, {})[key] = entry
+        return entry
@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, ClassVar
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
+
+logger = logging.getLogger("deadline_cloud_resource_catalog")
+
+# Default time, in seconds, before a cached listing is refreshed
+DEFAULT_RESOURCE_CATALOG_TTL = 300.0
+# Bumped whenever the persisted catalog layout changes so that stale files are ignored
+_CATALOG_FILE_VERSION = 1
+# Background refreshes share a small pool; listings are cheap, they just should not block callers
+_REFRESH_MAX_WORKERS = 4
+
+
+@dataclass
+class _CatalogEntry:
+    """A cached listing and the wall clock time it was fetched at."""
+
+    value: Any
+    fetched_at: float
+
+
+class DeadlineCloudResourceCatalog:
+    """Process-wide cache of Deadline Cloud resource listings such as farms, queues and storage profiles.
+
+    Listings are cached under a key that identifies the account, region and resource being
+    listed. A listing younger than its TTL is returned as is. An older listing is still returned
+    right away, and a background refresh replaces it (stale-while-revalidate). Only a listing
+    that was never fetched blocks the caller, and concurrent callers share a single fetch.
+
+    When created with a cache path, the catalog is loaded from and saved to disk so that a new
+    process can show its dropdowns without waiting for AWS.
+    """
+
+    _instance: ClassVar[DeadlineCloudResourceCatalog | None] = None
+    _instance_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(self, cache_path: Path | None = None) -> None:
+        self.cache_path = cache_path
+        self._entries: dict[tuple[str, ...], _CatalogEntry] = {}
+        self._pending: dict[tuple[str, ...], Future] = {}
+        self._lock = threading.Lock()
+        self._executor: ThreadPoolExecutor | None = None
+        self._load()
+
+    @classmethod
+    def get_instance(cls, cache_path: Path | None = None) -> DeadlineCloudResourceCatalog:
+        """Return the process-wide catalog, creating it with the given cache path on first use."""
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls(cache_path=cache_path)
+            return cls._instance
+
+    def get(self, key: tuple[str, ...], loader: Callable[[], Any], ttl: float = DEFAULT_RESOURCE_CATALOG_TTL) -> Any:
+        """Return the cached value for a key, fetching it with the loader when needed.
+
+        Args:
+            key: Identifies the listing, e.g. ("farms", profile_name, region_name).
+            loader: Fetches the current value. Errors are raised to the caller only when there is
+                no cached value to fall back on.
+            ttl: Age, in seconds, after which the cached value is refreshed in the background.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if time.time() - entry.fetched_at >= ttl and key not in self._pending:
+                    self._pending[key] = self._get_executor().submit(self._refresh, key, loader)
+                return entry.value
+
+            future = self._pending.get(key)
+            owner = future is None
+            if future is None:
+                future = Future()
+                self._pending[key] = future
+
+        if not owner:
+            return future.result()
+
+        try:
+            value = loader()
+        except BaseException as e:
+            with self._lock:
+                self._pending.pop(key, None)
+            future.set_exception(e)
+            raise
+
+        self._store(key, value)
+        future.set_result(value)
+        return value
+
+    def invalidate(self, *key_prefix: str) -> None:
+        """Drop every cached value whose key starts with the given prefix, or all values if none is given."""
+        with self._lock:
+            for key in list(self._entries):
+                if key[: len(key_prefix)] == key_prefix:
+                    del self._entries[key]
+        self._save()
+
+    def _refresh(self, key: tuple[str, ...], loader: Callable[[], Any]) -> Any:
+        """Fetch a fresh value for a key in the background, keeping the stale value on failure."""
+        try:
+            value = loader()
+        except Exception as e:
+            logger.debug("Failed to refresh cached Deadline Cloud resources %s: %s", key, e)
+            with self._lock:
+                self._pending.pop(key, None)
+            raise
+
+        self._store(key, value)
+        return value
+
+    def _store(self, key: tuple[str, ...], value: Any) -> None:
+        with self._lock:
+            self._entries[key] = _CatalogEntry(value=value, fetched_at=time.time())
+            self._pending.pop(key, None)
+        self._save()
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=_REFRESH_MAX_WORKERS, thread_name_prefix="deadline_cloud_resource_catalog"
+            )
+        return self._executor
+
+    def _load(self) -> None:
+        """Load the persisted catalog, if there is one."""
+        if self.cache_path is None or not self.cache_path.is_file():
+            return
+
+        try:
+            data = json.loads(self.cache_path.read_text(encoding="utf-8"))
+            if data.get("version") != _CATALOG_FILE_VERSION:
+                return
+            self._entries = {
+                tuple(entry["key"]): _CatalogEntry(value=entry["value"], fetched_at=float(entry["fetched_at"]))
+                for entry in data["entries"]
+            }
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.info("Ignoring unreadable Deadline Cloud resource catalog %s: %s", self.cache_path, e)
+
+    def _save(self) -> None:
+        """Persist the catalog, if it has a cache path."""
+        if self.cache_path is None:
+            return
+
+        with self._lock:
+            data = {
+                "version": _CATALOG_FILE_VERSION,
+                "entries": [
+                    {"key": list(key), "value": entry.value, "fetched_at": entry.fetched_at}
+                    for key, entry in self._entries.items()
+                ],
+            }
+
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = self.cache_path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            temp_path.write_text(json.dumps(data, default=str), encoding="utf-8")
+            temp_path.replace(self.cache_path)
+        except OSError as e:
+            logger.warning("Failed to save Deadline Cloud resource catalog %s: %s", self.cache_path, e)
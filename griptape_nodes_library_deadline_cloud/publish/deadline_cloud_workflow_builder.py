@@ -20,11 +20,18 @@ from griptape_nodes.retained_mode.events.parameter_events import AddParameterToN
 from griptape_nodes.retained_mode.griptape_nodes import GriptapeNodes
 from publish import LIBRARY_NAME
 from publish.deadline_cloud_end_flow import DeadlineCloudEndFlow
+from publish.deadline_cloud_executor_builder_process import (
+    DeadlineCloudExecutorBuilderProcess,
+    ExecutorBuilderProcessError,
+)
 from publish.deadline_cloud_published_workflow import DeadlineCloudPublishedWorkflow
 from publish.deadline_cloud_start_flow import DeadlineCloudStartFlow
 
 logger = logging.getLogger(__name__)
 
+# Time, in seconds, a workflow creation script may take to generate the executor workflow
+EXECUTOR_SCRIPT_TIMEOUT = 300
+
 
 @dataclass
 class DeadlineCloudWorkflowBuilderInput:
@@ -94,7 +101,7 @@ class DeadlineCloudWorkflowBuilder:
             self.workflow_builder_input.libraries,
         )
 
-        # Execute the script in a subprocess to create the workflow
+        # Execute the script in a separate process to create the workflow
         self._execute_workflow_script(workflow_script)
 
         # Verify the workflow was created successfully
@@ -423,33 +430,28 @@ if __name__ == "__main__":
         return script
 
     def _execute_workflow_script(self, script: str) -> None:
-        """Execute the workflow creation script in a subprocess."""
+        """Execute the workflow creation script, in the shared builder process when possible.
+
+        The builder process keeps the engine and libraries loaded between publishes. A one-off
+        subprocess is only used when the builder process cannot run the script; a script that
+        fails in the builder process is not run again.
+        """
         temp_script_path = Path(__file__).parent / f"temp_executor_{uuid.uuid4().hex}.py"
 
         try:
             with temp_script_path.open("w", encoding="utf-8") as f:
                 f.write(script)
 
-            # Execute the script in a subprocess to isolate the GriptapeNodes state
-            result = subprocess.run(  # noqa: S603
-                [sys.executable, str(temp_script_path)],
-                capture_output=True,
-                text=True,
-                cwd=temp_script_path.parent,
-                timeout=300,
-                check=False,
-            )
-
-            # Print subprocess output
-            if result.stdout:
-                logger.debug(result.stdout)
-            if result.stderr:
-                logger.debug(result.stderr)
-
-            if result.returncode != 0:
-                error_msg = f"Executor workflow generation failed: {result.stderr}"
-                logger.error("Failed to generate executor workflow: %s", result.stderr)
-                raise RuntimeError(error_msg)
+            try:
+                DeadlineCloudExecutorBuilderProcess.get_instance().run_script(
+                    temp_script_path,
+                    workspace_path=GriptapeNodes.ConfigManager().workspace_path,
+                    libraries=self.workflow_builder_input.libraries,
+                    timeout=EXECUTOR_SCRIPT_TIMEOUT,
+                )
+            except ExecutorBuilderProcessError as e:
+                logger.warning("Executor workflow builder process failed, retrying in a new subprocess: %s", e)
+                self._execute_workflow_script_in_subprocess(temp_script_path)
 
             logger.info(
                 "Successfully generated executor workflow: %s", self.workflow_builder_input.executor_workflow_name
@@ -459,3 +461,26 @@ if __name__ == "__main__":
             # Clean up temporary script
             if temp_script_path.exists():
                 temp_script_path.unlink()
+
+    def _execute_workflow_script_in_subprocess(self, script_path: Path) -> None:
+        """Execute the workflow creation script in a one-off subprocess."""
+        # Execute the script in a subprocess to isolate the GriptapeNodes state
+        result = subprocess.run(  # noqa: S603
+            [sys.executable, str(script_path)],
+            capture_output=True,
+            text=True,
+            cwd=script_path.parent,
+            timeout=EXECUTOR_SCRIPT_TIMEOUT,
+            check=False,
+        )
+
+        # Print subprocess output
+        if result.stdout:
+            logger.debug(result.stdout)
+        if result.stderr:
+            logger.debug(result.stderr)
+
+        if result.returncode != 0:
+            error_msg = f"Executor workflow generation failed: {result.stderr}"
+            logger.error("Failed to generate executor workflow: %s", result.stderr)
+            raise RuntimeError(error_msg)
@@ -4,9 +4,18 @@ from __future__ import annotations
 
 import json
 import logging
+import os
+import shutil
+from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 from griptape_nodes.files.project_file import ProjectFileDestination
+from griptape_nodes.retained_mode.events.artifact_events import (
+    GetArtifactProviderDetailsRequest,
+    GetArtifactProviderDetailsResultSuccess,
+    ListArtifactProvidersRequest,
+    ListArtifactProvidersResultSuccess,
+)
 from griptape_nodes.retained_mode.events.project_events import (
     GetSituationRequest,
     GetSituationResultSuccess,
@@ -14,13 +23,16 @@ from griptape_nodes.retained_mode.events.project_events import (
 from griptape_nodes.retained_mode.griptape_nodes import GriptapeNodes
 
 if TYPE_CHECKING:
-    from pathlib import Path
+    from griptape_nodes.files.file import File, FileDestination
 
 logger = logging.getLogger(__name__)
 
 # The situation name that defines where metadata sidecars are saved.
 METADATA_SITUATION_NAME = "save_griptape_nodes_metadata"
 
+# Chunk size used when a downloaded output has to be copied across filesystems.
+_COPY_CHUNK_SIZE = 8 * 1024 * 1024
+
 
 def get_metadata_dir_name() -> str | None:
     """Return the logical metadata directory name from the current project.
@@ -46,6 +58,78 @@ def get_metadata_dir_name() -> str | None:
     return None
 
 
+def get_metadata_injected_formats() -> set[str]:
+    """Return the file extensions whose content the engine rewrites as it writes them.
+
+    When ``auto_inject_workflow_metadata`` is enabled, writes go through the artifact provider
+    registered for the file's extension, which may embed workflow metadata (e.g. into images).
+
+    Returns:
+        The lowercase extensions, without a leading dot, handled by an artifact provider, or an
+        empty set if metadata injection is disabled.
+    """
+    if not GriptapeNodes.ConfigManager().get_config_value("auto_inject_workflow_metadata"):
+        return set()
+
+    result = GriptapeNodes.handle_request(ListArtifactProvidersRequest())
+    if not isinstance(result, ListArtifactProvidersResultSuccess):
+        return set()
+
+    formats: set[str] = set()
+    for friendly_name in result.friendly_names:
+        details = GriptapeNodes.handle_request(GetArtifactProviderDetailsRequest(friendly_name=friendly_name))
+        if isinstance(details, GetArtifactProviderDetailsResultSuccess):
+            formats.update(file_format.lower() for file_format in details.supported_formats)
+    return formats
+
+
+def finalize_downloaded_file(source_path: Path, destination: FileDestination) -> File:
+    """Place a downloaded output file at its project destination without loading it into memory.
+
+    The destination is claimed by writing an empty placeholder through the engine, so the
+    write policy (collision handling, parent directory creation and metadata sidecars) applies
+    exactly as for a regular write. The placeholder is then atomically replaced with the
+    downloaded file: hard-linked when both are on the same filesystem, otherwise streamed
+    across in chunks.
+
+    Files of a format the engine embeds workflow metadata into are instead written through the
+    engine with their full content, so that the metadata is injected as for any other write.
+
+    Args:
+        source_path: The downloaded file.
+        destination: Where the file should be written.
+
+    Returns:
+        A File referencing the path the file was written to.
+
+    Raises:
+        FileWriteError: If the destination cannot be claimed.
+        OSError: If the downloaded file cannot be moved into place.
+    """
+    if source_path.suffix.lstrip(".").lower() in get_metadata_injected_formats():
+        return destination.write_bytes(source_path.read_bytes())
+
+    result_file = destination.write_bytes(b"")
+    # The returned File may hold the portable macro form of the path
+    final_path = Path(result_file.resolve())
+
+    temp_path = final_path.with_name(f".{final_path.name}.{os.getpid()}.tmp")
+    try:
+        temp_path.unlink(missing_ok=True)
+        try:
+            temp_path.hardlink_to(source_path)
+        except OSError:
+            with source_path.open("rb") as src, temp_path.open("wb") as dst:
+                shutil.copyfileobj(src, dst, _COPY_CHUNK_SIZE)
+        temp_path.replace(final_path)
+    except OSError:
+        temp_path.unlink(missing_ok=True)
+        final_path.unlink(missing_ok=True)
+        raise
+
+    return result_file
+
+
 def collect_metadata_sidecars(downloaded_files: dict[str, Path]) -> dict[str, dict[str, Any]]:
     """Collect metadata sidecar JSON files from the downloaded output.
 
@@ -138,9 +222,8 @@ def write_sidecar_output_files(
         extra_vars = {k: v for k, v in variables.items() if k not in ("file_name_base", "file_extension")}
 
         try:
-            file_bytes = source_path.read_bytes()
             dest = ProjectFileDestination.from_situation(filename, situation_name, **extra_vars)
-            result_file = dest.write_bytes(file_bytes)
+            result_file = finalize_downloaded_file(source_path, dest)
         except Exception as e:
             logger.warning(
                 "Failed to write output via situation '%s' for '%s': %s",